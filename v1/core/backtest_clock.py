@@ -0,0 +1,164 @@
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from v1.core.candle_grid import grid_index
+from v1.core.data_collector import DataCollector
+from v1.utils.timeline import format_kst, to_epoch, unit_seconds
+
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+class CandleWindow(Sequence):
+    """
+    캔들 리스트의 [start, stop) 구간을 복사 없이 보여주는 읽기 전용 뷰.
+
+    dict 리스트처럼 인덱싱/반복할 수 있고, column()으로 OHLCV 배열 뷰를 바로 얻을 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        candles: List[Dict],
+        columns: Dict[str, np.ndarray],
+        start: int,
+        stop: int,
+    ):
+        self._candles = candles
+        self._columns = columns
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return CandleWindow(
+                self._candles,
+                self._columns,
+                self._start + start,
+                self._start + max(start, stop),
+            )
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CandleWindow index out of range")
+        return self._candles[self._start + index]
+
+    def __iter__(self) -> Iterator[Dict]:
+        for index in range(self._start, self._stop):
+            yield self._candles[index]
+
+    def column(self, field: str) -> np.ndarray:
+        """OHLCV 필드의 float64 배열 뷰 (복사 없음)"""
+        return self._columns[field][self._start : self._stop]
+
+
+class BacktestClock:
+    """
+    백테스트 전체 구간(+ 지표 계산용 워밍업)을 한 번만 불러온 뒤 정수 인덱스로 시간을 진행합니다.
+
+    스텝 i에서
+        - window(i): i번째 캔들까지의 최근 limit개 캔들 뷰 (에이전트 입력)
+        - candle(i): 현재(방금 마감된) 캔들
+        - next_candle(i): 다음 캔들 (시가에 매매 실행)
+    루프 안에서는 네트워크 요청이나 날짜 문자열 파싱이 없습니다.
+    """
+
+    def __init__(
+        self,
+        coin: str,
+        start_date: str,
+        end_date: str,
+        candle_unit: str,
+        limit: int = 0,
+        data_collector: Optional[DataCollector] = None,
+    ):
+        self.coin = coin
+        self.start_date = start_date
+        self.end_date = end_date
+        self.candle_unit = candle_unit
+        self.limit = limit
+        self.data_collector = data_collector or DataCollector(limit=limit)
+
+        self.candles: List[Dict] = []
+        self.columns: Dict[str, np.ndarray] = {}
+        self.timestamps = np.empty(0, dtype=np.int64)
+        # 캔들이 고정 간격 격자(빠진 캔들 없음)면 시각 -> 인덱스를 산술로 계산
+        self.is_grid = False
+        self.start_index = 0
+        self.end_index = -1
+
+    def warmup_start_date(self) -> str:
+        """
+        기술 지표 계산용 워밍업 캔들을 포함한 수집 시작일을 캔들 단위에 맞춰 계산합니다.
+        limit이 없다면 약 40개 캔들을 워밍업으로 사용합니다(macd 계산을 위해).
+
+        Returns:
+            str: 수집 시작일 (예: "2020-08-23 09:00:00")
+        """
+        limit = self.limit if self.limit > 0 else 40
+        return format_kst(
+            to_epoch(self.start_date) - unit_seconds(self.candle_unit) * (limit - 1)
+        )
+
+    async def load(self) -> None:
+        """워밍업부터 종료일까지의 캔들을 한 번에 불러와 배열로 변환합니다."""
+        self.candles = await self.data_collector.load_candles(
+            self.coin, self.warmup_start_date(), self.end_date, self.candle_unit
+        )
+        self.columns = {
+            field: np.array([c[field] for c in self.candles], dtype=np.float64)
+            for field in OHLCV_FIELDS
+        }
+        self.timestamps = np.array(
+            [c["timestamp"] for c in self.candles], dtype=np.int64
+        )
+        step = unit_seconds(self.candle_unit)
+        self.is_grid = len(self.timestamps) > 0 and int(
+            self.timestamps[-1] - self.timestamps[0]
+        ) == step * (len(self.timestamps) - 1)
+
+        self.start_index = int(
+            np.searchsorted(self.timestamps, to_epoch(self.start_date), side="left")
+        )
+        self.end_index = (
+            int(np.searchsorted(self.timestamps, to_epoch(self.end_date), side="right"))
+            - 1
+        )
+
+    def index_of(self, timestamp: int) -> Optional[int]:
+        """timestamp에 해당하는 캔들 인덱스 (없으면 None)"""
+        if self.is_grid:
+            index = grid_index(
+                timestamp, int(self.timestamps[0]), unit_seconds(self.candle_unit)
+            )
+            return index if index is not None and index < len(self.timestamps) else None
+        index = int(np.searchsorted(self.timestamps, timestamp))
+        if index < len(self.timestamps) and self.timestamps[index] == timestamp:
+            return index
+        return None
+
+    def __iter__(self) -> Iterator[int]:
+        """매매 결정을 내리는 스텝 인덱스 (다음 캔들이 존재하는 구간)"""
+        return iter(range(self.start_index, self.end_index))
+
+    def __len__(self) -> int:
+        return max(self.end_index - self.start_index, 0)
+
+    def window(self, index: int) -> CandleWindow:
+        """index번째 캔들까지의 최근 limit개 캔들 뷰 (limit이 0이면 처음부터)"""
+        start = max(index + 1 - self.limit, 0) if self.limit > 0 else 0
+        return CandleWindow(self.candles, self.columns, start, index + 1)
+
+    def candle(self, index: int) -> Dict:
+        return self.candles[index]
+
+    def next_candle(self, index: int) -> Dict:
+        return self.candles[index + 1]
+
+    def next_open(self, index: int) -> float:
+        return float(self.columns["open"][index + 1])
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Mapping, Optional
+
+import numpy as np
+
+from v1.core.constants import BASELINE_PARAMS
+from v1.utils.lazy_import import lazy_module
+
+talib = lazy_module("talib")
+pd = lazy_module("pandas")
+
+
+# ---------------------------------------------------------------------- #
+# 신호: 캔들 i까지의 데이터로 만든 신호 (1: 매수, -1: 매도, 0: 유지)
+# 지표는 워밍업 캔들을 포함한 전체 배열로 계산한 뒤 스텝 구간만 사용합니다.
+# ---------------------------------------------------------------------- #
+def _state_signal(condition: np.ndarray) -> np.ndarray:
+    """조건이 참이면 보유(1), 거짓이면 미보유(-1)를 원하는 신호 (지표가 없으면 0)"""
+    return np.where(np.isnan(condition), 0, np.where(condition > 0, 1, -1))
+
+
+def buy_and_hold(columns: Mapping[str, np.ndarray], start: int) -> np.ndarray:
+    signals = np.zeros(len(columns["close"]), dtype=np.int8)
+    signals[start] = 1
+    return signals
+
+
+def sma_cross(
+    columns: Mapping[str, np.ndarray], start: int, fast: int, slow: int
+) -> np.ndarray:
+    close = columns["close"]
+    return _state_signal(
+        talib.SMA(close, timeperiod=fast) - talib.SMA(close, timeperiod=slow)
+    )
+
+
+def rsi_reversion(
+    columns: Mapping[str, np.ndarray],
+    start: int,
+    period: int,
+    lower: float,
+    upper: float,
+) -> np.ndarray:
+    rsi = talib.RSI(columns["close"], timeperiod=period)
+    with np.errstate(invalid="ignore"):
+        return np.where(rsi < lower, 1, np.where(rsi > upper, -1, 0))
+
+
+def macd_cross(
+    columns: Mapping[str, np.ndarray], start: int, fast: int, slow: int, signal: int
+) -> np.ndarray:
+    macd, macd_signal, _ = talib.MACD(
+        columns["close"], fastperiod=fast, slowperiod=slow, signalperiod=signal
+    )
+    return _state_signal(macd - macd_signal)
+
+
+def bollinger_breakout(
+    columns: Mapping[str, np.ndarray], start: int, period: int, nbdev: float
+) -> np.ndarray:
+    """종가가 상단 밴드를 넘으면 매수, 중심선 아래로 내려오면 매도"""
+    close = columns["close"]
+    upper, middle, _ = talib.BBANDS(
+        close, timeperiod=period, nbdevup=nbdev, nbdevdn=nbdev
+    )
+    with np.errstate(invalid="ignore"):
+        return np.where(close > upper, 1, np.where(close < middle, -1, 0))
+
+
+BASELINES: Dict[str, Callable[..., np.ndarray]] = {
+    "buy_and_hold": buy_and_hold,
+    "sma_cross": sma_cross,
+    "rsi_reversion": rsi_reversion,
+    "macd_cross": macd_cross,
+    "bollinger_breakout": bollinger_breakout,
+}
+
+
+# ---------------------------------------------------------------------- #
+# 시뮬레이션: 전략 x 스텝 2차원 배열로 한 번에 계산
+# ---------------------------------------------------------------------- #
+def holding_states(signals: np.ndarray) -> np.ndarray:
+    """
+    스텝별 신호(전략 x 스텝)를 각 결정 직후의 목표 보유 상태(bool)로 변환합니다.
+    매수는 미보유일 때만, 매도는 보유 중일 때만 의미가 있으므로 마지막 0이 아닌 신호를 따릅니다.
+    """
+    steps = np.arange(signals.shape[1])
+    last = np.maximum.accumulate(np.where(signals != 0, steps, -1), axis=1)
+    picked = np.take_along_axis(signals, np.maximum(last, 0), axis=1)
+    return (last >= 0) & (picked == 1)
+
+
+def simulate(
+    desired: np.ndarray,
+    open_: np.ndarray,
+    close: np.ndarray,
+    fee_rate: float,
+    initial_cash: float,
+) -> np.ndarray:
+    """
+    PortfolioManager 규칙(전액 매수/전량 매도, 체결 금액에 수수료)으로 스텝별 총자산을 계산합니다.
+
+    스텝 t의 결정은 t+1 캔들 시가에 체결되며, 행 t의 총자산은 t 캔들까지 체결된 상태를
+    t 캔들 종가로 평가한 값입니다(기록 CSV의 total_asset_value와 동일).
+
+    Args:
+        desired (np.ndarray): 결정 직후의 목표 보유 상태 (전략 x 스텝, bool)
+        open_ (np.ndarray): 스텝 캔들 시가
+        close (np.ndarray): 스텝 캔들 종가
+        fee_rate (float): 수수료율 (예: 0.0008)
+        initial_cash (float): 초기 현금
+
+    Returns:
+        np.ndarray: 총자산 (전략 x 스텝)
+    """
+    held = np.zeros_like(desired)
+    held[:, 1:] = desired[:, :-1]
+    prev, cur = held[:, :-1], held[:, 1:]
+
+    keep = close[1:] / close[:-1]
+    bought = (1 - fee_rate) * close[1:] / open_[1:]
+    sold = (1 - fee_rate) * open_[1:] / close[:-1]
+    growth = np.where(
+        prev & cur, keep, np.where(cur, bought, np.where(prev, sold, 1.0))
+    )
+    equity = np.empty(desired.shape, dtype=np.float64)
+    equity[:, 0] = initial_cash
+    equity[:, 1:] = initial_cash * np.cumprod(growth, axis=1)
+    return equity
+
+
+def metrics(
+    equity: np.ndarray,
+    desired: np.ndarray,
+    open_: np.ndarray,
+    periods_per_year: int = 365,
+) -> List[Dict[str, float]]:
+    """
+    전략별로 DataAnalyzer.performance_metrics와 같은 지표를 계산합니다.
+    (승률은 결정 캔들 시가 기준 매수→매도 쌍, 샤프 지수는 표본 표준편차 사용)
+    """
+    returns = equity[:, 1:] / equity[:, :-1] - 1
+    std = (
+        returns.std(axis=1, ddof=1)
+        if returns.shape[1] > 1
+        else np.full(len(equity), np.nan)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(
+            std != 0.0, returns.mean(axis=1) / std * periods_per_year**0.5, np.nan
+        )
+    running_max = np.maximum.accumulate(equity, axis=1)
+    mdd = ((equity - running_max) / running_max).min(axis=1) * 100.0
+    ret = (equity[:, -1] / equity[:, 0] - 1) * 100.0
+
+    before = np.zeros_like(desired)
+    before[:, 1:] = desired[:, :-1]
+    results = []
+    for idx in range(len(equity)):
+        buys = np.flatnonzero(desired[idx] & ~before[idx])
+        sells = np.flatnonzero(~desired[idx] & before[idx])
+        wins = int((open_[sells] > open_[buys[: len(sells)]]).sum())
+        trades = len(sells)
+        results.append(
+            {
+                "return_pct": float(ret[idx]),
+                "mdd": float(mdd[idx]),
+                "win_rate": round(wins / trades * 100, 2) if trades else 0,
+                "total_trades": trades,
+                "sharpe_index": float(sharpe[idx]),
+            }
+        )
+    return results
+
+
+def run_baselines(
+    columns: Mapping[str, np.ndarray],
+    start: int,
+    end: int,
+    fee_rate: float,
+    initial_cash: float,
+    params: Optional[Mapping[str, List[Dict]]] = None,
+) -> List[Dict]:
+    """
+    기준 전략들을 백테스트 스텝 구간 [start, end)에서 한 번에 평가합니다.
+
+    Args:
+        columns (Mapping[str, np.ndarray]): 워밍업을 포함한 OHLCV 배열 (BacktestClock.columns)
+        start (int): 첫 결정 스텝 인덱스
+        end (int): 마지막 체결 캔들 인덱스 (결정 스텝은 end 직전까지)
+        fee_rate (float): 수수료율 (예: 0.0008)
+        initial_cash (float): 초기 현금
+        params (Optional[Mapping[str, List[Dict]]]): 전략별 파라미터 목록 (기본값: BASELINE_PARAMS)
+
+    Returns:
+        List[Dict]: 전략, 파라미터와 성과 지표
+    """
+    params = BASELINE_PARAMS if params is None else params
+    labels, signals = [], []
+    for name, variants in params.items():
+        for variant in variants:
+            labels.append((name, variant))
+            signals.append(BASELINES[name](columns, start, **variant)[start:end])
+
+    desired = holding_states(np.asarray(signals, dtype=np.int8))
+    open_ = columns["open"][start:end]
+    equity = simulate(
+        desired, open_, columns["close"][start:end], fee_rate, initial_cash
+    )
+    return [
+        {
+            "strategy": name,
+            "params": ", ".join(f"{k}={v}" for k, v in variant.items()),
+            **result,
+        }
+        for (name, variant), result in zip(labels, metrics(equity, desired, open_))
+    ]
+
+
+def format_baseline_table(
+    rows: List[Dict], system_metrics: Optional[Dict] = None
+) -> pd.DataFrame:
+    """기준 전략 결과(와 시스템 성과)를 수익률 순 비교표로 만듭니다."""
+    if system_metrics is not None:
+        rows = [{"strategy": "system", "params": "", **system_metrics}] + rows
+    table = pd.DataFrame(rows)
+    return table.sort_values("return_pct", ascending=False, ignore_index=True)
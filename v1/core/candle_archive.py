@@ -0,0 +1,403 @@
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from v1.core.candle_grid import Grid, fill_gaps, grid_index
+from v1.utils.timeline import UPBIT_FORMAT, format_kst, unit_seconds
+
+ARCHIVE_VERSION = 2
+# 컬럼 파일별 고정 폭 dtype (리틀 엔디언)
+COLUMN_DTYPES = {
+    "timestamp": np.dtype("<i8"),
+    "open": np.dtype("<f8"),
+    "high": np.dtype("<f8"),
+    "low": np.dtype("<f8"),
+    "close": np.dtype("<f8"),
+    "volume": np.dtype("<f8"),
+    "filled": np.dtype("u1"),  # 거래가 없어 직전 종가로 채운 캔들이면 1
+}
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+INDEX_FILE = "index.json"
+LOCK_FILE = ".lock"
+
+
+class CandleArchive:
+    """
+    마켓/캔들 단위별 컬럼 파일(numpy.memmap)로 된 디스크 캔들 아카이브.
+
+    디렉터리 구조:
+        {root}/{market}/{candle_unit}/index.json           # 행 수, 세대, 수집 완료 구간
+        {root}/{market}/{candle_unit}/{column}-{gen}.bin    # 고정 폭 int64/float64/uint8 컬럼
+
+    - 격자: 수집 완료 구간 전체를 캔들 간격마다 한 행씩 저장합니다. 거래가 없어 Upbit가
+      주지 않은 캔들은 직전 종가·거래량 0으로 채우고 filled 컬럼에 표시하므로,
+      시각 -> 행 인덱스는 (timestamp - 시작 시각) // 간격으로 계산되고
+      여러 마켓의 정렬도 같은 구간 슬라이스로 끝납니다.
+
+    - 읽기: index.json의 행 수만큼만 memmap으로 열어 시간 구간을 복사 없이 슬라이싱합니다.
+      여러 프로세스가 같은 파일을 열면 OS 페이지 캐시를 공유합니다.
+    - 쓰기: fcntl 락으로 한 번에 한 프로세스만 씁니다. 마지막 행 이후 데이터는 컬럼 끝에
+      덧붙이고(fsync 후) index.json을 원자적으로 교체하므로, 읽는 쪽은 락 없이도
+      완성된 행만 봅니다. 기존 구간 앞/사이에 들어가는 데이터는 새 세대 파일로 다시 쓴 뒤
+      index.json을 교체합니다(이미 열린 memmap은 이전 파일을 계속 사용).
+
+    Args:
+        root (str): 아카이브 루트 디렉터리
+    """
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        # (market, unit) -> ((index inode, 수정 시각), 컬럼 memmap)
+        self._opened: Dict[Tuple[str, str], Tuple[Tuple[int, int], Dict]] = {}
+
+    @classmethod
+    def from_env(cls) -> Optional["CandleArchive"]:
+        """CANDLE_ARCHIVE_DIR 환경 변수가 있으면 해당 경로의 아카이브를, 없으면 None을 반환합니다."""
+        root = os.getenv("CANDLE_ARCHIVE_DIR")
+        return cls(root) if root else None
+
+    def _dir(self, market: str, candle_unit: str) -> str:
+        return os.path.join(self.root, market, candle_unit)
+
+    def _column_path(self, directory: str, column: str, generation: int) -> str:
+        return os.path.join(directory, f"{column}-{generation}.bin")
+
+    def _read_index(self, directory: str) -> Dict:
+        try:
+            with open(os.path.join(directory, INDEX_FILE)) as f:
+                index = json.load(f)
+            if index.get("version") != ARCHIVE_VERSION:
+                raise ValueError(
+                    f"{directory} 아카이브 형식(v{index.get('version')})이 "
+                    f"현재 형식(v{ARCHIVE_VERSION})과 다릅니다. 디렉터리를 지우고 다시 수집하세요."
+                )
+            return index
+        except FileNotFoundError:
+            return {
+                "version": ARCHIVE_VERSION,
+                "count": 0,
+                "generation": 0,
+                "covered": [],
+            }
+
+    def columns(self, market: str, candle_unit: str) -> Dict[str, np.ndarray]:
+        """
+        마켓/캔들 단위의 전체 컬럼을 읽기 전용 memmap으로 반환합니다.
+        index.json이 바뀌지 않았으면 이미 연 memmap을 재사용합니다.
+        """
+        key = (market, candle_unit)
+        directory = self._dir(market, candle_unit)
+        for _ in range(2):
+            try:
+                stat = os.stat(os.path.join(directory, INDEX_FILE))
+            except FileNotFoundError:
+                return {
+                    column: np.empty(0, dtype=dtype)
+                    for column, dtype in COLUMN_DTYPES.items()
+                }
+            version = (stat.st_ino, stat.st_mtime_ns)
+            cached = self._opened.get(key)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            index = self._read_index(directory)
+            try:
+                columns = {
+                    column: (
+                        np.memmap(
+                            self._column_path(directory, column, index["generation"]),
+                            dtype=dtype,
+                            mode="r",
+                            shape=(index["count"],),
+                        )
+                        if index["count"] > 0
+                        else np.empty(0, dtype=dtype)
+                    )
+                    for column, dtype in COLUMN_DTYPES.items()
+                }
+            except FileNotFoundError:
+                # 다시 쓰기로 세대가 바뀐 직후라면 새 index로 한 번 더 시도
+                continue
+            self._opened[key] = (version, columns)
+            return columns
+        raise RuntimeError(f"{directory} 아카이브를 열 수 없습니다.")
+
+    def index_of(self, market: str, candle_unit: str, timestamp: int) -> Optional[int]:
+        """캔들 시작 시각의 행 인덱스 (고정 간격 격자이므로 산술 계산, 범위 밖이면 None)"""
+        index = self._read_index(self._dir(market, candle_unit))
+        if not index["covered"]:
+            return None
+        position = grid_index(
+            timestamp, index["covered"][0][0], unit_seconds(candle_unit)
+        )
+        if position is None or position >= index["count"]:
+            return None
+        return position
+
+    def window(
+        self, market: str, candle_unit: str, start_ts: int, end_ts: int
+    ) -> Dict[str, np.ndarray]:
+        """시작 시각이 [start_ts, end_ts]인 행의 컬럼 뷰 (memmap 슬라이스, 복사 없음)"""
+        columns = self.columns(market, candle_unit)
+        timestamps = columns["timestamp"]
+        if len(timestamps) == 0:
+            return columns
+        # 격자이므로 시각 -> 인덱스는 산술 계산
+        step = unit_seconds(candle_unit)
+        origin = int(timestamps[0])
+        lo = min(max(0, -((origin - start_ts) // step)), len(timestamps))
+        hi = min(max(0, (end_ts - origin) // step + 1), len(timestamps))
+        return {column: values[lo:hi] for column, values in columns.items()}
+
+    def aligned_window(
+        self, markets: Iterable[str], candle_unit: str, start_ts: int, end_ts: int
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        여러 마켓의 같은 시각 구간을 길이가 같은 컬럼 뷰로 반환합니다(조인 없이 슬라이스만).
+        모든 마켓이 수집을 마친 공통 구간으로 잘립니다.
+        """
+        markets = list(markets)
+        for market in markets:
+            covered = self._read_index(self._dir(market, candle_unit))["covered"]
+            if not covered:
+                return {
+                    market: self.window(market, candle_unit, 1, 0) for market in markets
+                }
+            start_ts = max(start_ts, covered[0][0])
+            end_ts = min(end_ts, covered[0][1])
+        return {
+            market: self.window(market, candle_unit, start_ts, end_ts)
+            for market in markets
+        }
+
+    def candles(
+        self, market: str, candle_unit: str, start_ts: int, end_ts: int
+    ) -> List[Dict]:
+        """window()를 fetch_candles와 같은 형식("filled" 플래그 포함)의 캔들 리스트로 변환합니다."""
+        window = self.window(market, candle_unit, start_ts, end_ts)
+        values = {field: window[field].tolist() for field in OHLCV_FIELDS}
+        filled = window["filled"].astype(bool).tolist()
+        return [
+            {
+                "date": format_kst(timestamp, UPBIT_FORMAT),
+                "timestamp": timestamp,
+                **{field: values[field][i] for field in OHLCV_FIELDS},
+                "filled": filled[i],
+            }
+            for i, timestamp in enumerate(window["timestamp"].tolist())
+        ]
+
+    def missing_ranges(
+        self, market: str, candle_unit: str, start_ts: int, end_ts: int
+    ) -> List[Tuple[int, int]]:
+        """
+        [start_ts, end_ts]를 제공하기 위해 수집해야 하는 구간 목록 (캔들 시작 시각 기준)
+
+        아카이브는 항상 하나의 연속 구간을 격자로 보관하므로, 요청이 기존 구간과
+        떨어져 있으면 사이 구간까지 함께 수집합니다.
+        """
+        step = unit_seconds(candle_unit)
+        start_ts -= start_ts % step
+        end_ts -= end_ts % step
+        if start_ts > end_ts:
+            return []
+        covered = self._read_index(self._dir(market, candle_unit))["covered"]
+        if not covered:
+            return [(start_ts, end_ts)]
+        covered_start, covered_end = covered[0]
+        missing = []
+        if start_ts < covered_start:
+            missing.append((start_ts, covered_start - step))
+        if end_ts > covered_end:
+            missing.append((covered_end + step, end_ts))
+        return missing
+
+    @contextmanager
+    def _write_lock(self, directory: str) -> Iterator[None]:
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, LOCK_FILE), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def write(
+        self,
+        market: str,
+        candle_unit: str,
+        candles: List[Dict],
+        covered: Tuple[int, int],
+    ) -> None:
+        """
+        받은 캔들을 고정 간격 격자로 정규화(빠진 캔들은 직전 종가, 거래량 0, filled=1)하여
+        아카이브에 추가합니다(블로킹, 프로세스 간 락).
+
+        수집 완료로 기록하는 구간은 요청 구간 전체가 아니라 받은 캔들의 첫~마지막 시각입니다.
+        다만 요청 구간이 기존 구간에 바로 이어지는 쪽은 거래소가 그 사이 캔들을 돌려주지 않은
+        것(거래 없음)이므로 요청 경계까지 채웁니다. 받은 캔들이 없으면 아무것도 기록하지 않습니다.
+
+        Args:
+            market (str): 예) "KRW-BTC"
+            candle_unit (str): 캔들 단위
+            candles (List[Dict]): "timestamp"와 OHLCV를 가진 캔들 리스트 (마감된 캔들만)
+            covered (Tuple[int, int]): 이번에 요청한 [시작, 종료] 캔들 시각,
+                기존 구간과 겹치거나 바로 이어져야 함
+        """
+        directory = self._dir(market, candle_unit)
+        step = unit_seconds(candle_unit)
+        requested_start = covered[0] - covered[0] % step
+        requested_end = covered[1] - covered[1] % step
+        if not candles:
+            return
+        timestamps = np.array([c["timestamp"] for c in candles], dtype=np.int64)
+        order = np.argsort(timestamps, kind="stable")
+        new = {
+            "timestamp": timestamps[order],
+            **{
+                field: np.array([c[field] for c in candles], dtype=np.float64)[order]
+                for field in OHLCV_FIELDS
+            },
+        }
+
+        with self._write_lock(directory):
+            index = self._read_index(directory)
+            count, generation = index["count"], index["generation"]
+            index_generation = generation
+
+            # 받은 캔들이 걸친 구간만 수집 완료로 기록 (부분 응답이 전체 구간을 덮지 않도록)
+            covered_start = max(requested_start, int(new["timestamp"][0]))
+            covered_end = min(requested_end, int(new["timestamp"][-1]))
+            if count:
+                # 기존 구간에 바로 이어지는 쪽의 빈 캔들은 거래가 없었던 구간
+                old_start, old_end = index["covered"][0]
+                if requested_start == old_end + step:
+                    covered_start = requested_start
+                if requested_end == old_start - step:
+                    covered_end = requested_end
+
+            if count == 0:
+                grid = fill_gaps(
+                    new["timestamp"], new, step, covered_start, covered_end
+                )
+                count = self._append(directory, generation, 0, grid)
+                merged_range = [covered_start, covered_end]
+            elif covered_start == index["covered"][0][1] + step:
+                # 마지막 행 바로 뒤: 직전 종가로 앞쪽 빈 캔들을 채워 덧붙임
+                last_close = float(self._read_column(directory, index, "close")[-1])
+                grid = fill_gaps(
+                    new["timestamp"],
+                    new,
+                    step,
+                    covered_start,
+                    covered_end,
+                    seed_close=last_close,
+                )
+                count = self._append(directory, generation, count, grid)
+                merged_range = [index["covered"][0][0], covered_end]
+            else:
+                old_start, old_end = index["covered"][0]
+                if covered_end < old_start - step or covered_start > old_end + step:
+                    raise ValueError(
+                        f"{market} {candle_unit} 아카이브 구간 [{old_start}, {old_end}]와 "
+                        f"떨어진 구간 [{covered_start}, {covered_end}]은 추가할 수 없습니다."
+                    )
+                merged_range = [
+                    min(old_start, covered_start),
+                    max(old_end, covered_end),
+                ]
+                generation, count = self._rewrite(
+                    directory, index, new, step, merged_range
+                )
+
+            index = {
+                "version": ARCHIVE_VERSION,
+                "market": market,
+                "candle_unit": candle_unit,
+                "count": count,
+                "generation": generation,
+                # 격자의 시작/종료 시각 (항상 하나의 연속 구간)
+                "covered": [merged_range],
+            }
+            tmp_path = os.path.join(directory, f"{INDEX_FILE}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(index, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, os.path.join(directory, INDEX_FILE))
+
+            if generation != index_generation:
+                # 이전 세대 파일 삭제 (이미 열린 memmap은 삭제 후에도 계속 읽을 수 있음)
+                for column in COLUMN_DTYPES:
+                    path = self._column_path(directory, column, index_generation)
+                    if os.path.exists(path):
+                        os.remove(path)
+
+    def _read_column(self, directory: str, index: Dict, column: str) -> np.ndarray:
+        return np.fromfile(
+            self._column_path(directory, column, index["generation"]),
+            dtype=COLUMN_DTYPES[column],
+            count=index["count"],
+        )
+
+    def _grid_columns(self, grid: Grid) -> Dict[str, np.ndarray]:
+        timestamps, values, filled = grid
+        return {"timestamp": timestamps, **values, "filled": filled}
+
+    def _append(self, directory: str, generation: int, count: int, grid: Grid) -> int:
+        """마지막 행 뒤에 덧붙이고 새 행 수를 반환합니다(이전 쓰기가 중단되며 남긴 꼬리는 잘라냄)."""
+        columns = self._grid_columns(grid)
+        for column, dtype in COLUMN_DTYPES.items():
+            fd = os.open(
+                self._column_path(directory, column, generation),
+                os.O_RDWR | os.O_CREAT,
+                0o644,
+            )
+            try:
+                os.ftruncate(fd, count * dtype.itemsize)
+                os.lseek(fd, 0, os.SEEK_END)
+                os.write(fd, columns[column].astype(dtype).tobytes())
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        return count + len(columns["timestamp"])
+
+    def _rewrite(
+        self,
+        directory: str,
+        index: Dict,
+        new: Dict[str, np.ndarray],
+        step: int,
+        merged_range: List[int],
+    ) -> Tuple[int, int]:
+        """
+        기존의 실제 캔들(filled=0)과 새 캔들을 병합(같은 시각은 새 값 우선)하고
+        merged_range 전체를 다시 격자로 채워 새 세대 파일로 씁니다.
+        """
+        old = {
+            column: self._read_column(directory, index, column)
+            for column in COLUMN_DTYPES
+        }
+        real = old["filled"] == 0
+        timestamps = np.concatenate((old["timestamp"][real], new["timestamp"]))
+        order = np.argsort(timestamps, kind="stable")
+        sorted_ts = timestamps[order]
+        keep = np.r_[sorted_ts[1:] != sorted_ts[:-1], True]
+        merged = {
+            field: np.concatenate((old[field][real], new[field]))[order][keep]
+            for field in OHLCV_FIELDS
+        }
+        grid = fill_gaps(sorted_ts[keep], merged, step, *merged_range)
+
+        new_generation = index["generation"] + 1
+        columns = self._grid_columns(grid)
+        for column, dtype in COLUMN_DTYPES.items():
+            path = self._column_path(directory, column, new_generation)
+            with open(path, "wb") as f:
+                f.write(columns[column].astype(dtype).tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+        return new_generation, len(columns["timestamp"])
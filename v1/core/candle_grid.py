@@ -0,0 +1,119 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from v1.utils.timeline import UPBIT_FORMAT, format_kst, unit_seconds
+
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+Grid = Tuple[np.ndarray, Dict[str, np.ndarray], np.ndarray]
+
+
+def grid_index(timestamp: int, origin: int, step: int) -> Optional[int]:
+    """고정 간격 격자에서 timestamp의 인덱스 (격자 위의 시각이 아니면 None)"""
+    offset = timestamp - origin
+    if offset < 0 or offset % step:
+        return None
+    return offset // step
+
+
+def fill_gaps(
+    timestamps: np.ndarray,
+    values: Dict[str, np.ndarray],
+    step: int,
+    start_ts: Optional[int] = None,
+    end_ts: Optional[int] = None,
+    seed_close: Optional[float] = None,
+) -> Grid:
+    """
+    거래가 없어 빠진 캔들을 채워 [start_ts, end_ts]의 고정 간격 격자로 정규화합니다(벡터 연산).
+
+    빠진 캔들은 직전 종가로 시가/고가/저가/종가를 채우고 거래량은 0으로 둡니다.
+    구간 맨 앞의 빠진 캔들은 seed_close(이전 구간의 마지막 종가)로, 없으면 첫 캔들 시가로 채웁니다.
+
+    Args:
+        timestamps (np.ndarray): 캔들 시작 시각 (epoch 초, 오름차순, step 배수)
+        values (Dict[str, np.ndarray]): OHLCV 필드별 배열
+        step (int): 캔들 간격(초)
+        start_ts (Optional[int]): 격자 시작 시각, None이면 첫 캔들
+        end_ts (Optional[int]): 격자 종료 시각, None이면 마지막 캔들
+        seed_close (Optional[float]): 구간 앞의 빠진 캔들을 채울 가격
+
+    Returns:
+        Tuple[np.ndarray, Dict[str, np.ndarray], np.ndarray]: 격자 시각, OHLCV, 채운 캔들 마스크
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    if start_ts is None:
+        start_ts = int(timestamps[0]) if len(timestamps) else 0
+    if end_ts is None:
+        end_ts = int(timestamps[-1]) if len(timestamps) else start_ts - step
+    start_ts -= start_ts % step
+    end_ts -= end_ts % step
+    size = max(0, (end_ts - start_ts) // step + 1)
+    grid = start_ts + np.arange(size, dtype=np.int64) * step
+
+    inside = (timestamps >= start_ts) & (timestamps <= end_ts)
+    positions = (timestamps[inside] - start_ts) // step
+    sources = np.flatnonzero(inside)
+    if size == 0 or len(sources) == 0 and seed_close is None:
+        empty = {field: np.empty(0, dtype=np.float64) for field in OHLCV_FIELDS}
+        return grid[:0], empty, np.empty(0, dtype=bool)
+    if len(sources) == 0:
+        # 구간 전체에 거래가 없으면 이전 종가로만 채움
+        out = {field: np.full(size, float(seed_close)) for field in OHLCV_FIELDS}
+        out["volume"] = np.zeros(size)
+        return grid, out, np.ones(size, dtype=bool)
+
+    # 각 격자 칸의 원본 캔들 인덱스 (-1: 빠진 캔들)
+    source = np.full(size, -1, dtype=np.int64)
+    source[positions] = sources
+    filled = source < 0
+    # 직전 원본 캔들 인덱스 (없으면 -1)
+    previous = np.maximum.accumulate(source)
+
+    close = np.asarray(values["close"], dtype=np.float64)
+    if seed_close is None:
+        seed_close = float(np.asarray(values["open"], dtype=np.float64)[sources[0]])
+    carry = np.where(previous >= 0, close[np.maximum(previous, 0)], seed_close)
+
+    out = {}
+    for field in OHLCV_FIELDS:
+        column = np.asarray(values[field], dtype=np.float64)[np.maximum(source, 0)]
+        if field == "volume":
+            out[field] = np.where(filled, 0.0, column)
+        else:
+            out[field] = np.where(filled, carry, column)
+    return grid, out, filled
+
+
+def fill_candle_gaps(
+    candles: List[Dict],
+    candle_unit: str,
+    start_ts: Optional[int] = None,
+    end_ts: Optional[int] = None,
+    seed_close: Optional[float] = None,
+) -> List[Dict]:
+    """
+    캔들 리스트를 fill_gaps로 정규화하여 "filled" 플래그가 있는 캔들 리스트로 반환합니다.
+    start_ts/end_ts가 None이면 첫/마지막 캔들까지만 채웁니다.
+    """
+    if not candles and seed_close is None:
+        return []
+    timestamps = np.array([c["timestamp"] for c in candles], dtype=np.int64)
+    values = {
+        field: np.array([c[field] for c in candles], dtype=np.float64)
+        for field in OHLCV_FIELDS
+    }
+    grid, out, filled = fill_gaps(
+        timestamps, values, unit_seconds(candle_unit), start_ts, end_ts, seed_close
+    )
+    columns = {field: out[field].tolist() for field in OHLCV_FIELDS}
+    return [
+        {
+            "date": format_kst(timestamp, UPBIT_FORMAT),
+            "timestamp": timestamp,
+            **{field: columns[field][i] for field in OHLCV_FIELDS},
+            "filled": is_filled,
+        }
+        for i, (timestamp, is_filled) in enumerate(zip(grid.tolist(), filled.tolist()))
+    ]
@@ -0,0 +1,246 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from v1.core.constants import RESAMPLE_BASE_UNIT, RESAMPLE_UNITS
+from v1.utils.timeline import UPBIT_FORMAT, format_kst, unit_seconds
+
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+Bars = Tuple[np.ndarray, Dict[str, np.ndarray]]
+
+
+def bucket_start(timestamps, step: int):
+    """
+    각 시각이 속한 캔들의 시작 시각 (epoch 기준 step 배수)
+
+    KST는 UTC+9이므로 일봉(86400초) 경계인 UTC 00:00은 Upbit 일봉 기준인 KST 09:00과 같습니다.
+    """
+    return timestamps - timestamps % step
+
+
+def resample_ohlcv(
+    timestamps: np.ndarray, values: Dict[str, np.ndarray], step: int
+) -> Bars:
+    """
+    시각 오름차순 캔들 배열을 step(초) 단위 캔들로 묶습니다(반복문 없이 벡터 연산).
+
+    Args:
+        timestamps (np.ndarray): 캔들 시작 시각 (epoch 초, 오름차순, 중복 없음)
+        values (Dict[str, np.ndarray]): OHLCV 필드별 float64 배열
+        step (int): 묶을 캔들 단위 길이(초)
+
+    Returns:
+        Tuple[np.ndarray, Dict[str, np.ndarray]]: 묶인 캔들의 시작 시각과 OHLCV 배열
+    """
+    if len(timestamps) == 0:
+        return timestamps[:0], {field: values[field][:0] for field in OHLCV_FIELDS}
+
+    buckets = bucket_start(timestamps, step)
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(timestamps)] - 1
+    return buckets[starts], {
+        "open": values["open"][starts],
+        "high": np.maximum.reduceat(values["high"], starts),
+        "low": np.minimum.reduceat(values["low"], starts),
+        "close": values["close"][ends],
+        "volume": np.add.reduceat(values["volume"], starts),
+    }
+
+
+class _ColumnBuffer:
+    """용량을 두 배씩 늘려 가며 뒤에 이어 붙이는 timestamp + OHLCV 열 버퍼"""
+
+    def __init__(self, capacity: int = 1024):
+        self.size = 0
+        self._timestamps = np.empty(capacity, dtype=np.int64)
+        self._values = {
+            field: np.empty(capacity, dtype=np.float64) for field in OHLCV_FIELDS
+        }
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[: self.size]
+
+    def values(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> Dict[str, np.ndarray]:
+        stop = self.size if stop is None else stop
+        return {field: column[start:stop] for field, column in self._values.items()}
+
+    def truncate(self, size: int) -> None:
+        self.size = min(self.size, size)
+
+    def extend(self, timestamps: np.ndarray, values: Dict[str, np.ndarray]) -> None:
+        count = len(timestamps)
+        required = self.size + count
+        if required > len(self._timestamps):
+            capacity = max(required, len(self._timestamps) * 2)
+            self._timestamps = np.resize(self._timestamps, capacity)
+            self._values = {
+                field: np.resize(column, capacity)
+                for field, column in self._values.items()
+            }
+        self._timestamps[self.size : required] = timestamps
+        for field, column in self._values.items():
+            column[self.size : required] = values[field]
+        self.size = required
+
+
+class MultiTimeframeCandles:
+    """
+    한 마켓의 1분봉만 보관하고, 상위 단위(5m/15m/1h/1d) 캔들은 로컬에서 파생합니다.
+
+    update()로 새 1분봉이 들어오면 영향을 받는 (진행 중인) 상위 캔들부터만 다시 계산하므로
+    이미 마감된 상위 캔들은 그대로 유지됩니다. 일봉은 Upbit와 같이 KST 09:00에 시작합니다.
+
+    Args:
+        units (Iterable[str]): 파생할 캔들 단위 (기본값: RESAMPLE_UNITS)
+    """
+
+    def __init__(self, units: Iterable[str] = RESAMPLE_UNITS):
+        self.base = _ColumnBuffer()
+        self.bars: Dict[str, _ColumnBuffer] = {
+            unit: _ColumnBuffer() for unit in units if unit != RESAMPLE_BASE_UNIT
+        }
+
+    def update(self, candles: List[Dict]) -> None:
+        """
+        1분봉을 추가합니다. 같은 시각의 캔들은 새 값으로 교체되며, 순서는 상관없습니다.
+        "filled"가 True인(거래가 없어 채운) 캔들은 무시합니다.
+
+        Args:
+            candles (List[Dict]): "timestamp"와 OHLCV를 가진 1분봉 리스트
+        """
+        # 격자를 맞추려고 채운 캔들은 제외 (상위 캔들은 실제 거래만으로 계산)
+        candles = [c for c in candles if not c.get("filled")]
+        if not candles:
+            return
+        timestamps = np.fromiter(
+            (c["timestamp"] for c in candles), dtype=np.int64, count=len(candles)
+        )
+        values = {
+            field: np.fromiter(
+                (c[field] for c in candles), dtype=np.float64, count=len(candles)
+            )
+            for field in OHLCV_FIELDS
+        }
+        earliest = int(timestamps.min())
+
+        # 기존 1분봉 중 earliest 이후 구간만 새 캔들과 병합 (같은 시각은 새 값 우선)
+        cut = int(np.searchsorted(self.base.timestamps, earliest, side="left"))
+        tail = self.base.values(cut)
+        merged_ts = np.concatenate((self.base.timestamps[cut:], timestamps))
+        order = np.argsort(merged_ts, kind="stable")
+        merged_ts = merged_ts[order]
+        keep = np.r_[merged_ts[1:] != merged_ts[:-1], True]
+        merged = {
+            field: np.concatenate((tail[field], values[field]))[order][keep]
+            for field in OHLCV_FIELDS
+        }
+        self.base.truncate(cut)
+        self.base.extend(merged_ts[keep], merged)
+
+        # 상위 단위는 earliest가 속한 캔들부터 다시 계산
+        base_ts = self.base.timestamps
+        for unit, bars in self.bars.items():
+            step = unit_seconds(unit)
+            start = int(bucket_start(earliest, step))
+            bars.truncate(int(np.searchsorted(bars.timestamps, start, side="left")))
+            base_cut = int(np.searchsorted(base_ts, start, side="left"))
+            bars.extend(
+                *resample_ohlcv(base_ts[base_cut:], self.base.values(base_cut), step)
+            )
+
+    def _buffer(self, candle_unit: str) -> _ColumnBuffer:
+        if candle_unit == RESAMPLE_BASE_UNIT:
+            return self.base
+        if candle_unit not in self.bars:
+            raise ValueError(f"{candle_unit}은(는) 파생 대상 캔들 단위가 아닙니다.")
+        return self.bars[candle_unit]
+
+    def candles(self, candle_unit: str, start_ts: int, end_ts: int) -> List[Dict]:
+        """
+        시작 시각이 [start_ts, end_ts]인 캔들을 fetch_candles와 같은 형식으로 반환합니다.
+        마지막 캔들은 아직 진행 중일 수 있습니다(Upbit 응답과 동일).
+        """
+        buffer = self._buffer(candle_unit)
+        lo = int(np.searchsorted(buffer.timestamps, start_ts, side="left"))
+        hi = int(np.searchsorted(buffer.timestamps, end_ts, side="right"))
+        values = buffer.values(lo, hi)
+        return [
+            {
+                "date": format_kst(timestamp, UPBIT_FORMAT),
+                "timestamp": int(timestamp),
+                **{field: float(values[field][i]) for field in OHLCV_FIELDS},
+            }
+            for i, timestamp in enumerate(buffer.timestamps[lo:hi])
+        ]
+
+    def view(self, candle_unit: str, until_ts: int, count: int) -> Bars:
+        """
+        until_ts 이전 1분봉만으로 본 최근 count개 캔들 (미래 데이터 없음)
+
+        until_ts가 캔들 중간이면 마지막 캔들은 until_ts 직전까지의 1분봉으로 다시 계산한
+        진행 중 캔들입니다.
+
+        Args:
+            candle_unit (str): 캔들 단위
+            until_ts (int): 이 시각(epoch 초) 이전 데이터만 사용 (exclusive)
+            count (int): 반환할 최대 캔들 수
+
+        Returns:
+            Tuple[np.ndarray, Dict[str, np.ndarray]]: 캔들 시작 시각과 OHLCV 배열
+        """
+        if candle_unit == RESAMPLE_BASE_UNIT:
+            stop = int(np.searchsorted(self.base.timestamps, until_ts, side="left"))
+            start = max(0, stop - count)
+            return self.base.timestamps[start:stop], self.base.values(start, stop)
+
+        buffer = self._buffer(candle_unit)
+        step = unit_seconds(candle_unit)
+        current = int(bucket_start(until_ts, step))
+        stop = int(np.searchsorted(buffer.timestamps, current, side="left"))
+        start = max(0, stop - count)
+        timestamps = buffer.timestamps[start:stop]
+        values = buffer.values(start, stop)
+
+        base_lo = int(np.searchsorted(self.base.timestamps, current, side="left"))
+        base_hi = int(np.searchsorted(self.base.timestamps, until_ts, side="left"))
+        if base_hi > base_lo:
+            partial_ts, partial = resample_ohlcv(
+                self.base.timestamps[base_lo:base_hi],
+                self.base.values(base_lo, base_hi),
+                step,
+            )
+            timestamps = np.concatenate((timestamps, partial_ts))[-count:]
+            values = {
+                field: np.concatenate((values[field], partial[field]))[-count:]
+                for field in OHLCV_FIELDS
+            }
+        return timestamps, values
+
+
+def format_timeframe_summary(views: Dict[str, Bars]) -> str:
+    """
+    캔들 단위별 최근 캔들을 에이전트 프롬프트용 요약 문자열로 변환합니다.
+
+    Args:
+        views (Dict[str, Bars]): 캔들 단위 -> MultiTimeframeCandles.view() 결과
+
+    Returns:
+        str: 단위별 종가, 구간 변화율, 고가/저가, 거래량 요약
+    """
+    lines = []
+    for unit, (timestamps, values) in views.items():
+        if len(timestamps) == 0:
+            continue
+        close = values["close"][-1]
+        change = (close / values["open"][0] - 1) * 100
+        lines.append(
+            f"- {unit} (last {len(timestamps)} bars since "
+            f"{format_kst(timestamps[0], UPBIT_FORMAT)}): close {close:.2f}, "
+            f"change {change:+.2f}%, high {values['high'].max():.2f}, "
+            f"low {values['low'].min():.2f}, volume {values['volume'].sum():.2f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,185 @@
+import asyncio
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from v1.core.candle_archive import CandleArchive
+from v1.core.candle_grid import fill_candle_gaps
+from v1.core.candle_resampler import Bars, MultiTimeframeCandles
+from v1.core.constants import (
+    DEFAULT_EXCHANGE_CONCURRENCY,
+    DEFAULT_TIMEFRAME_BARS,
+    RESAMPLE_BASE_UNIT,
+    RESAMPLE_UNITS,
+)
+from v1.core.data_collector import fetch_archived_candles, fetch_candles
+from v1.utils.timeline import to_epoch, unit_seconds
+
+
+class CandleStore:
+    """
+    여러 실행(CryptoTradingSystem)이 공유하는 프로세스 내 캔들 저장소.
+
+    (코인, 캔들 단위)별로 이미 내려받은 구간을 기억하여, 같은 구간은 한 번만
+    거래소에서 수집하고 이후 요청은 메모리에서 응답합니다.
+    동일 마켓을 동시에 요청하면 먼저 시작한 수집이 끝날 때까지 기다린 뒤 재사용합니다.
+
+    resample_from_minutes=True면 1분봉만 거래소에서 내려받고 RESAMPLE_UNITS 단위 캔들은
+    로컬에서 파생하므로, 같은 구간을 여러 캔들 단위로 실행해도 추가 수집이 없습니다.
+    """
+
+    def __init__(
+        self,
+        exchange_concurrency: int = DEFAULT_EXCHANGE_CONCURRENCY,
+        resample_from_minutes: bool = False,
+        archive: Optional[CandleArchive] = None,
+    ):
+        """
+        Args:
+            exchange_concurrency (int): 거래소에 동시에 보낼 수 있는 수집 작업 수
+            resample_from_minutes (bool): 상위 단위 캔들을 1분봉에서 파생할지 여부
+            archive (Optional[CandleArchive]): 수집 결과를 보관할 디스크 아카이브,
+                None이면 CANDLE_ARCHIVE_DIR 환경 변수가 있을 때만 사용
+        """
+        self.exchange_concurrency = exchange_concurrency
+        self.archive = archive if archive is not None else CandleArchive.from_env()
+        self.resample_from_minutes = resample_from_minutes
+        # coin -> 1분봉 기반 멀티 타임프레임 캔들 (resample_from_minutes=True일 때)
+        self._timeframes: Dict[str, MultiTimeframeCandles] = {}
+        # (coin, candle_unit) -> {timestamp: candle}
+        self._candles: Dict[Tuple[str, str], Dict[int, Dict]] = {}
+        # (coin, candle_unit) -> 수집 완료된 [시작, 종료] epoch 구간 목록
+        self._covered: Dict[Tuple[str, str], List[Tuple[int, int]]] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._exchange_semaphore = None
+        self.fetch_count = 0
+
+    async def prefetch(
+        self, coin: str, start_date: str, end_date: str, candle_unit: str
+    ) -> None:
+        """실행 전에 구간 전체를 한 번에 내려받아 둡니다."""
+        await self.get_candles(coin, start_date, end_date, candle_unit)
+
+    async def get_candles(
+        self, coin: str, start_date: str, end_date: str, candle_unit: str
+    ) -> List[Dict]:
+        """
+        [start_date, end_date] 구간의 캔들을 반환합니다. 수집되지 않은 구간이면 거래소에서 내려받습니다.
+
+        Args:
+            coin (str): 예) "KRW-BTC"
+            start_date (str): 시작 날짜 (예: "2020-10-10 09:00:00")
+            end_date (str): 종료 날짜 (예: "2024-10-09 09:00:00")
+            candle_unit (str): 캔들 단위 (예: "1d", "1h", "1m" 등)
+
+        Returns:
+            List[Dict]: 날짜 오름차순으로 정렬된 캔들 리스트
+        """
+        start_ts = to_epoch(start_date)
+        end_ts = to_epoch(end_date)
+        if self.resample_from_minutes and candle_unit in RESAMPLE_UNITS:
+            return await self._get_resampled(coin, start_ts, end_ts, candle_unit)
+        key = (coin, candle_unit)
+
+        if key not in self._locks:
+            self._locks[key] = asyncio.Lock()
+            self._candles[key] = {}
+            self._covered[key] = []
+        if self._exchange_semaphore is None:
+            self._exchange_semaphore = asyncio.Semaphore(self.exchange_concurrency)
+
+        async with self._locks[key]:
+            if not self._is_covered(key, start_ts, end_ts):
+                async with self._exchange_semaphore:
+                    if self.archive is not None:
+                        candles = await fetch_archived_candles(
+                            self.archive, coin, start_date, end_date, candle_unit
+                        )
+                    else:
+                        # 거래가 없어 빠진 캔들은 직전 종가로 채워 고정 간격으로 맞춤
+                        step = unit_seconds(candle_unit)
+                        previous = self._candles[key].get(
+                            start_ts - start_ts % step - step
+                        )
+                        candles = fill_candle_gaps(
+                            await fetch_candles(
+                                coin, start_date, end_date, candle_unit
+                            ),
+                            candle_unit,
+                            start_ts=start_ts,
+                            seed_close=previous["close"] if previous else None,
+                        )
+                self.fetch_count += 1
+                for c in candles:
+                    self._candles[key][c["timestamp"]] = c
+                self._covered[key].append((start_ts, end_ts))
+                if self.resample_from_minutes and candle_unit == RESAMPLE_BASE_UNIT:
+                    # 새로 받은 1분봉만큼 진행 중인 상위 캔들부터 갱신
+                    self._timeframe(coin).update(candles)
+
+        candles = self._candles[key]
+        return [
+            candles[timestamp]
+            for timestamp in sorted(candles)
+            if start_ts <= timestamp <= end_ts
+        ]
+
+    async def _get_resampled(
+        self, coin: str, start_ts: int, end_ts: int, candle_unit: str
+    ) -> List[Dict]:
+        """[start_ts, end_ts]에 시작하는 캔들을 구성하는 1분봉을 확보한 뒤 파생 캔들을 반환합니다."""
+        step = unit_seconds(candle_unit)
+        minute = unit_seconds(RESAMPLE_BASE_UNIT)
+        await self.get_candles(
+            coin,
+            start_ts - start_ts % step,
+            end_ts - end_ts % step + step - minute,
+            RESAMPLE_BASE_UNIT,
+        )
+        timeframe = self._timeframe(coin)
+        previous = timeframe.candles(
+            candle_unit,
+            start_ts - start_ts % step - step,
+            start_ts - start_ts % step - step,
+        )
+        return fill_candle_gaps(
+            timeframe.candles(candle_unit, start_ts, end_ts),
+            candle_unit,
+            start_ts=start_ts,
+            seed_close=previous[0]["close"] if previous else None,
+        )
+
+    def timeframe_views(
+        self,
+        coin: str,
+        until_ts: int,
+        units: Iterable[str],
+        count: int = DEFAULT_TIMEFRAME_BARS,
+    ) -> Dict[str, Bars]:
+        """
+        이미 수집한 1분봉으로 until_ts 직전까지의 단위별 최근 캔들을 반환합니다(네트워크 요청 없음).
+
+        Args:
+            coin (str): 예) "KRW-BTC"
+            until_ts (int): 이 시각(epoch 초) 이전 데이터만 사용 (exclusive)
+            units (Iterable[str]): 캔들 단위 목록 (예: ["15m", "1h", "1d"])
+            count (int): 단위별 최대 캔들 수
+
+        Returns:
+            Dict[str, Bars]: 캔들 단위 -> (시작 시각, OHLCV 배열)
+        """
+        if not self.resample_from_minutes:
+            raise ValueError(
+                "멀티 타임프레임 조회에는 resample_from_minutes=True인 캔들 저장소가 필요합니다."
+            )
+        timeframe = self._timeframe(coin)
+        return {unit: timeframe.view(unit, until_ts, count) for unit in units}
+
+    def _timeframe(self, coin: str) -> MultiTimeframeCandles:
+        if coin not in self._timeframes:
+            self._timeframes[coin] = MultiTimeframeCandles()
+        return self._timeframes[coin]
+
+    def _is_covered(self, key: Tuple[str, str], start_ts: int, end_ts: int) -> bool:
+        return any(
+            covered_start <= start_ts and end_ts <= covered_end
+            for covered_start, covered_end in self._covered[key]
+        )
@@ -0,0 +1,153 @@
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from autogen_core import CancellationToken
+
+from v1.core.constants import DEFAULT_CASCADE_CONFIDENCE_THRESHOLD
+from v1.core.prompts import TRADING_EXPERT_CASCADE_SYSTEM_MESSAGE
+from v1.core.trading_expert import TradingExpert
+from v1.utils.market_features import compute_market_features, indicator_consensus
+from v1.utils.text_utils import extract_confidence
+
+
+class CascadeStats:
+    """
+    캐스케이드 티어별 호출 수, 응답 시간, 승급 사유, 티어 간 일치율을 집계합니다.
+    """
+
+    def __init__(self):
+        self.calls = {"small": 0, "large": 0}
+        self.latency = {"small": [], "large": []}
+        self.escalations = {"parse_failure": 0, "disagreement": 0, "low_confidence": 0}
+        # 승급된 스텝 중 소형 모델 신호를 얻을 수 있었던 경우의 일치 여부
+        self.agreements: List[bool] = []
+        self.consensus_agreements: List[bool] = []
+
+    def record_call(self, tier: str, elapsed: float):
+        self.calls[tier] += 1
+        self.latency[tier].append(elapsed)
+
+    def summary(self) -> Dict:
+        steps = self.calls["small"]
+        return {
+            "small_calls": self.calls["small"],
+            "large_calls": self.calls["large"],
+            "escalation_rate": (self.calls["large"] / steps * 100 if steps else 0.0),
+            "escalations": dict(self.escalations),
+            "avg_latency_small": (
+                sum(self.latency["small"]) / len(self.latency["small"])
+                if self.latency["small"]
+                else 0.0
+            ),
+            "avg_latency_large": (
+                sum(self.latency["large"]) / len(self.latency["large"])
+                if self.latency["large"]
+                else 0.0
+            ),
+            "tier_agreement_rate": (
+                sum(self.agreements) / len(self.agreements) * 100
+                if self.agreements
+                else 0.0
+            ),
+            "consensus_agreement_rate": (
+                sum(self.consensus_agreements) / len(self.consensus_agreements) * 100
+                if self.consensus_agreements
+                else 0.0
+            ),
+        }
+
+
+class CascadeTradingExpert:
+    """
+    소형 모델이 먼저 매매 신호를 생성하고, 필요할 때만 대형 모델로 승급합니다.
+
+    승급 조건:
+        - parse_failure: 소형 모델 응답에서 신호를 찾을 수 없음
+        - disagreement: 신호가 지표 합의(indicator_consensus)와 반대 방향
+        - low_confidence: 자기 보고 확신도가 confidence_threshold 미만이거나 없음
+
+    소형 모델은 TRADING_EXPERT_SMALL_MODEL, 대형 모델은 TRADING_EXPERT_MODEL 환경 변수를 사용합니다.
+    TradingExpert.generate_signal과 동일한 값을 반환하므로 시스템에서 그대로 교체해 사용할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        small_model: Optional[str] = None,
+        large_model: Optional[str] = None,
+        confidence_threshold: float = DEFAULT_CASCADE_CONFIDENCE_THRESHOLD,
+    ) -> None:
+        small_model = small_model or os.getenv("TRADING_EXPERT_SMALL_MODEL")
+        if not small_model:
+            raise ValueError(
+                "캐스케이드 모드에는 TRADING_EXPERT_SMALL_MODEL 환경 변수가 필요합니다."
+            )
+
+        self.small_expert = TradingExpert(
+            model_name=small_model,
+            system_message=TRADING_EXPERT_CASCADE_SYSTEM_MESSAGE,
+        )
+        self.large_expert = TradingExpert(model_name=large_model)
+        self.confidence_threshold = confidence_threshold
+        self.stats = CascadeStats()
+        self.last_tier: Optional[str] = None
+
+    async def generate_signal(
+        self, analysis_report: str, price_data: Optional[List[Dict]] = None
+    ) -> Tuple[int, str, float]:
+        """
+        소형 모델로 신호를 생성하고, 승급 조건에 해당하면 대형 모델로 다시 생성합니다.
+
+        Args:
+            analysis_report (str): PriceAnalysisExpert가 생성한 요약 리포트
+            price_data (Optional[List[Dict]]): 지표 합의 계산용 가격 데이터, None이면 합의 검사 생략
+
+        Returns:
+            int: 매매신호 (1, 0, -1)
+            str: 매매 근거
+            float: 전체 응답 소요 시간 (소형 + 대형)
+        """
+        start_time = time.time()
+
+        content = await self.small_expert.request(analysis_report)
+        small_end_time = time.time()
+        self.stats.record_call("small", small_end_time - start_time)
+
+        signal, reasons = self.small_expert.parse_signal_and_reasons(content)
+        consensus = (
+            indicator_consensus(compute_market_features(price_data))
+            if price_data
+            else 0
+        )
+
+        escalation = None
+        if signal is None:
+            escalation = "parse_failure"
+        elif consensus != 0 and signal == -consensus:
+            escalation = "disagreement"
+        else:
+            confidence = extract_confidence(content)
+            if confidence is None or confidence < self.confidence_threshold:
+                escalation = "low_confidence"
+
+        if escalation is None:
+            self.last_tier = "small"
+            self.small_expert.log_signal(signal, reasons, start_time, small_end_time)
+            return signal, reasons, (small_end_time - start_time)
+
+        self.stats.escalations[escalation] += 1
+        large_signal, large_reasons, large_time = (
+            await self.large_expert.generate_signal(analysis_report)
+        )
+        self.stats.record_call("large", large_time)
+        if signal is not None:
+            self.stats.agreements.append(signal == large_signal)
+        if consensus != 0:
+            self.stats.consensus_agreements.append(large_signal == consensus)
+
+        self.last_tier = "large"
+        return large_signal, large_reasons, (time.time() - start_time)
+
+    async def on_reset(self, cancellation_token: CancellationToken) -> None:
+        await self.small_expert.on_reset(cancellation_token)
+        await self.large_expert.on_reset(cancellation_token)
@@ -17,3 +17,113 @@ TIME_DELTA_MAP = {
 
 # 필요하다면 추가적인 상수나 매핑, 기본값 등도 같이 정의...
 DEFAULT_UNIT = "1d"
+
+# 이벤트 트리거(LLM 호출 게이팅) 기본값
+RSI_OVERSOLD = 30
+RSI_OVERBOUGHT = 70
+DEFAULT_ATR_MOVE_THRESHOLD = 1.0  # 마지막 평가 이후 ATR 대비 가격 변동 배수
+DEFAULT_TRIGGERS = ("rsi_zone", "macd_cross", "band_breach", "atr_move", "portfolio")
+
+# 캐스케이드(소형 모델 우선) 기본값
+DEFAULT_CASCADE_CONFIDENCE_THRESHOLD = 0.6  # 이 값 미만의 확신도는 대형 모델로 승급
+
+# 투표(self-consistency) 모드 기본 샘플 수
+DEFAULT_VOTE_SAMPLES = 5
+
+# PriceAnalysisExpert 분석 모드
+# - sequential: 단일 대화에서 도구를 순차적으로 호출
+# - parallel: 추세/모멘텀/변동성 전문 분석가를 동시에 호출한 뒤 병합
+ANALYSIS_MODES = ("sequential", "parallel")
+
+# 모델 클라이언트 풀 기본값
+# 백엔드별 동시 진행 요청 수 상한 (환경 변수 OPENAI_MAX_INFLIGHT, OLLAMA_MAX_INFLIGHT로 변경 가능)
+DEFAULT_MAX_INFLIGHT = {
+    "openai": 8,
+    "ollama": 2,
+}
+# 실행 중에는 Ollama 모델을 메모리에 고정(-1), 종료 후에는 Ollama 기본값으로 복원
+OLLAMA_KEEP_ALIVE_DURING_RUN = -1
+OLLAMA_KEEP_ALIVE_AFTER_RUN = "5m"
+
+# 공유 캔들 저장소의 거래소 동시 요청 수 상한 (Upbit 요청 제한 고려)
+DEFAULT_EXCHANGE_CONCURRENCY = 2
+
+# 1분봉 기반 리샘플링: 1분봉만 내려받고 상위 단위는 로컬에서 파생
+RESAMPLE_BASE_UNIT = "1m"
+RESAMPLE_UNITS = ("5m", "15m", "1h", "1d")
+DEFAULT_TIMEFRAME_BARS = 24  # 멀티 타임프레임 요약에 사용할 단위별 최근 캔들 수
+
+# 백그라운드 기록 큐 최대 대기 행 수 (가득 차면 매매 루프가 대기)
+DEFAULT_RECORD_QUEUE_SIZE = 32
+
+# 이벤트 로그 콘솔 출력 상세도 (0: 경고만, 1: 매매, 2: + 리포트/근거, 3: + 도구 호출)
+DEFAULT_VERBOSITY = 2
+
+# 라이브 모드 설정
+DEFAULT_LIVE_WINDOW = 200  # limit=0일 때 유지할 롤링 윈도우 캔들 수
+DEFAULT_DEADLINE_RATIO = 0.8  # 캔들 간격 대비 의사결정 마감 시한 비율
+DEFAULT_SETTLE_SECONDS = 2.0  # 캔들 마감 후 거래소 반영을 기다리는 시간(초)
+LIVE_CANDLE_RETRY_SECONDS = 1.0  # 마감 캔들 미반영 시 재조회 간격(초)
+
+# 제어 서버에서 동시에 진행할 최대 실행 수
+DEFAULT_CONTROL_PLANE_MAX_RUNS = 4
+
+# 실제 모델 클라이언트 생성 전(지연 생성)까지 에이전트 검증에 사용할 모델 정보
+# (에이전트 도구 사용을 위해 function_calling=True, 생성 후에는 실제 정보 사용)
+DEFERRED_MODEL_INFO = {
+    "vision": False,
+    "function_calling": True,
+    "json_output": True,
+    "family": "unknown",
+    "structured_output": True,
+}
+
+# 시작 시간 벤치마크 (python -X importtime) 모듈별 import 예산(ms)
+STARTUP_IMPORT_BUDGETS_MS = {
+    "v1.system.crypto_trading_system": 1000,
+    "v1.system.multi_asset_trading_system": 1000,
+    "v1.system.live_trading_system": 1000,
+    "v1.system.sweep_runner": 1000,
+    "v1.system.control_plane": 1500,
+}
+# import 시점에는 로드되면 안 되는 무거운 모듈 (사용 시점에 지연 로드)
+LAZY_IMPORT_MODULES = ("pandas", "matplotlib", "talib", "openai", "ollama", "requests")
+
+# 매매 원장(TradeLedger) 청크 크기 (행 수, 청크 단위로 늘려 가며 기록)
+LEDGER_CHUNK_SIZE = 1024
+
+# 리포트 저장소: 기록 폴더 안의 SQLite 파일 (압축 본문 + FTS5 색인)
+REPORT_STORE_FILE = "reports.sqlite"
+REPORT_FIELDS = ("price_analysis_report", "trading_reason")
+
+# 구간 분할 병렬 백테스트 기본 구간 수
+DEFAULT_BACKTEST_SEGMENTS = 4
+
+# 기준 전략(baseline) 비교표의 전략별 파라미터 목록
+BASELINE_PARAMS = {
+    "buy_and_hold": [{}],
+    "sma_cross": [
+        {"fast": 5, "slow": 20},
+        {"fast": 10, "slow": 30},
+        {"fast": 20, "slow": 60},
+    ],
+    "rsi_reversion": [
+        {"period": 14, "lower": 30, "upper": 70},
+        {"period": 7, "lower": 20, "upper": 80},
+    ],
+    "macd_cross": [{"fast": 12, "slow": 26, "signal": 9}],
+    "bollinger_breakout": [
+        {"period": 20, "nbdev": 2.0},
+        {"period": 20, "nbdev": 1.5},
+    ],
+}
+
+# 상태 공간 사전 계산 모드: 동시에 결정을 계산할 에이전트 작업자 수
+DEFAULT_DECISION_CONCURRENCY = 8
+
+# LLM 호출 마감 시한과 헤징 (환경 변수 LLM_CALL_DEADLINE_SECONDS, LLM_HEDGE_PERCENTILE로 변경 가능)
+DEFAULT_LLM_CALL_DEADLINE = None  # 호출 하나의 하드 마감 시한(초), None이면 제한 없음
+DEFAULT_HEDGE_PERCENTILE = 95  # 응답 시간이 이 백분위수를 넘기면 헤지 모델로 중복 요청
+HEDGE_MIN_SAMPLES = 10  # 헤징을 시작하기 전에 필요한 응답 시간 표본 수
+HEDGE_LATENCY_WINDOW = 200  # 백분위수 계산에 사용할 최근 응답 시간 수
+DEFAULT_FALLBACK_SIGNAL = 0  # 마감 시한 초과 시 대체 매매 신호 (HOLD)
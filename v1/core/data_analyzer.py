@@ -1,9 +1,18 @@
+from __future__ import annotations
+
 import json
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
+
+import numpy as np
+
+from v1.utils.lazy_import import lazy_module
+from v1.utils.timeline import to_kst_datetime64
+
+if TYPE_CHECKING:
+    from v1.core.trade_ledger import TradeLedger
 
-import pandas as pd
-import matplotlib.pyplot as plt
+pd = lazy_module("pandas")
 
 
 class DataAnalyzer:
@@ -24,6 +33,57 @@ class DataAnalyzer:
         self.df = self._load_data(encoding)
         self._prepare()
 
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "DataAnalyzer":
+        """
+        기록 CSV와 같은 컬럼을 가진 DataFrame으로 바로 분석기를 만듭니다(파일 I/O 없음).
+        """
+        missing = cls.REQUIRED_COLS.difference(df.columns) - {"datetime"}
+        if "datetime" not in df.columns and "timestamp" not in df.columns:
+            missing.add("datetime")
+        if missing:
+            raise ValueError(f"Missing required columns: {sorted(missing)}")
+        analyzer = cls.__new__(cls)
+        analyzer.csv_path = None
+        analyzer.df = df.copy()
+        analyzer._prepare()
+        return analyzer
+
+    @classmethod
+    def from_ledger(
+        cls, ledger: "TradeLedger", candles: Dict[str, np.ndarray]
+    ) -> "DataAnalyzer":
+        """
+        PortfolioManager의 원장과 캔들 배열로 기록 CSV와 같은 스텝별 표를 만들어 분석합니다.
+
+        원장은 다음 캔들 시가에 체결된 시각으로 기록되므로, 각 캔들 행의 next_action은
+        다음 캔들 시각의 체결 액션이고 current_cash/current_position은 그 캔들까지의
+        체결을 반영한 값입니다(기록 CSV와 동일한 의미). 압축된 보유 구간은 as-of 조회로 펼칩니다.
+
+        Args:
+            ledger (TradeLedger): 매매 원장
+            candles (Dict[str, np.ndarray]): "timestamp"와 OHLCV 배열. 마지막 캔들은
+                마지막 스텝의 체결 캔들로, 행에는 포함되지 않습니다.
+
+        Returns:
+            DataAnalyzer: 분석기
+        """
+        timestamps = np.asarray(candles["timestamp"], dtype=np.int64)
+        state = ledger.state_at(timestamps[:-1])
+        df = pd.DataFrame(
+            {
+                "timestamp": timestamps[:-1],
+                **{
+                    field: np.asarray(candles[field][:-1], dtype=np.float64)
+                    for field in ("open", "high", "low", "close", "volume")
+                },
+                "next_action": ledger.action_at(timestamps[1:]).astype(np.int64),
+                "current_cash": state["cash"],
+                "current_position": state["position"],
+            }
+        )
+        return cls.from_dataframe(df)
+
     # ------------------------------------------------------------------ #
     # I/O helpers
     # ------------------------------------------------------------------ #
@@ -42,8 +102,13 @@ class DataAnalyzer:
     # Pre‑processing
     # ------------------------------------------------------------------ #
     def _prepare(self) -> None:
-        self.df["datetime"] = pd.to_datetime(self.df["datetime"], utc=False)
-        self.df.sort_values("datetime", inplace=True, ignore_index=True)
+        if "timestamp" in self.df.columns:
+            # epoch 초 컬럼이 있으면 문자열 파싱 없이 정수로 정렬/변환
+            self.df.sort_values("timestamp", inplace=True, ignore_index=True)
+            self.df["datetime"] = to_kst_datetime64(self.df["timestamp"])
+        else:
+            self.df["datetime"] = pd.to_datetime(self.df["datetime"], utc=False)
+            self.df.sort_values("datetime", inplace=True, ignore_index=True)
 
         # Convenience labels
         self.df["action_label"] = (
@@ -138,6 +203,9 @@ class DataAnalyzer:
         figsize: tuple[int, int] = (12, 5),
         marker_size: int = 80,
     ) -> None:
+        # matplotlib은 그래프를 그릴 때만 로드
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=figsize)
         plt.plot(self.df["datetime"], self.df["close"], label="Close")
         if with_actions:
@@ -1,24 +1,204 @@
 import asyncio
-from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional, TYPE_CHECKING
 
-import requests
+from v1.core.candle_archive import CandleArchive
+from v1.core.candle_grid import fill_candle_gaps
+from v1.core.constants import UNIT_MAP
+from v1.utils.lazy_import import lazy_module
+from v1.utils.timeline import format_utc, now_epoch, to_epoch, unit_seconds
 
-from v1.core.constants import (
-    UNIT_MAP,
-    DEFAULT_UNIT,
-    TIME_DELTA_MAP,
-)
+requests = lazy_module("requests")
+
+if TYPE_CHECKING:
+    from v1.core.candle_store import CandleStore
+
+
+async def fetch_candles(
+    coin: str,
+    start_date: str,
+    end_date: str,
+    candle_unit: str,
+    strict: bool = False,
+) -> List[Dict]:
+    """
+    지정된 기간 동안 특정 코인 캔들을 외부 거래소(Upbit)에서 내려받습니다.
+
+    각 캔들에는 Upbit의 KST 문자열("date")과 함께 epoch 초("timestamp")가 한 번만 계산되어 담기며,
+    이후 정렬/비교는 모두 정수 timestamp로 수행합니다.
+
+    Args:
+        coin (str): 예) "KRW-BTC"
+        start_date (str): 시작 날짜, KST (예: "2020-10-10 09:00:00")
+        end_date (str): 종료 날짜, KST (예: "2024-10-09 09:00:00")
+        candle_unit (str): 캔들 단위 (예: "1d", "1h", "1m" 등)
+        strict (bool): True면 요청 실패(429 재시도 소진 포함) 시 지금까지 받은 캔들을
+            반환하지 않고 RuntimeError를 발생시킵니다.
+
+    Returns:
+        List[Dict]: 시각 오름차순으로 정렬된 캔들 리스트 (중복 없음, end_date 이후 캔들 제외)
+    """
+    base_url = "https://api.upbit.com/v1/candles"
+
+    candle_type = UNIT_MAP.get(candle_unit, "days")
+    step = unit_seconds(candle_unit)
+
+    start_ts = to_epoch(start_date)
+    end_ts = min(to_epoch(end_date), now_epoch())
+
+    # 만약 start_ts가 end_ts보다 미래라면, 데이터가 없음
+    if start_ts > end_ts:
+        print("[Warning] 시작일이 종료일보다 미래입니다. 수집할 데이터가 없습니다.")
+        return []
+
+    fetched: Dict[int, Dict] = {}
+
+    current_ts = end_ts
+    while True:
+        if current_ts < start_ts:
+            break
+
+        # Upbit의 to는 UTC 기준 exclusive이므로, current_ts 캔들까지 포함하도록 한 캔들 뒤로 지정
+        to_param = format_utc(current_ts + step)
+
+        # 캔들 단위 기준으로 남은 캔들 수 계산 (분/시간 단위도 한 번에 최대 200개)
+        candles_left = (current_ts - start_ts) // step + 1
+        n_candles_to_fetch = min(candles_left, 200)
+
+        url = (
+            f"{base_url}/{candle_type}"
+            f"?market={coin}"
+            f"&to={to_param}"
+            f"&count={n_candles_to_fetch}"
+        )
+
+        # 429 에러에 대한 리트라이 메커니즘 추가
+        max_retries = 5
+        retries = 0
+        while retries < max_retries:
+            # 동시에 여러 실행이 수집하더라도 이벤트 루프를 막지 않도록 스레드에서 요청
+            response = await asyncio.to_thread(requests.get, url)
+            if response.status_code == 429:
+                wait_time = int(response.headers.get("Retry-After", "1"))
+                print(f"[Rate Limit] 429 에러 발생. {wait_time}초 후 재시도합니다...")
+                await asyncio.sleep(wait_time)
+                retries += 1
+            else:
+                break
+
+        if response.status_code != 200:
+            if strict:
+                raise RuntimeError(
+                    f"{coin} {candle_unit} 캔들 수집 실패: "
+                    f"{response.status_code} / {response.text}"
+                )
+            print(f"[Error] {response.status_code} / {response.text}")
+            break
+
+        candles = response.json()
+        if not candles:
+            break
+
+        oldest_ts = None
+        for c in candles:
+            kst_time = c["candle_date_time_kst"]  # 예: "2024-10-09T09:00:00"
+            timestamp = to_epoch(kst_time)
+            if oldest_ts is None or timestamp < oldest_ts:
+                oldest_ts = timestamp
+            if timestamp <= end_ts and timestamp not in fetched:
+                fetched[timestamp] = {
+                    "date": kst_time,
+                    "timestamp": timestamp,
+                    "open": c["opening_price"],
+                    "close": c["trade_price"],
+                    "high": c["high_price"],
+                    "low": c["low_price"],
+                    "volume": c["candle_acc_trade_volume"],
+                }
+
+        current_ts = oldest_ts - step
+
+    return [fetched[timestamp] for timestamp in sorted(fetched)]
+
+
+async def fetch_archived_candles(
+    archive: CandleArchive,
+    coin: str,
+    start_date: str,
+    end_date: str,
+    candle_unit: str,
+) -> List[Dict]:
+    """
+    디스크 아카이브에서 캔들을 반환합니다. 아직 수집하지 않은 구간만 거래소에서 내려받아
+    고정 간격 격자로 아카이브에 추가하며, 진행 중인 캔들은 아카이브에 넣지 않고
+    매번 거래소에서 가져옵니다. 아카이브에는 실제로 받은 캔들이 걸친 구간만 수집 완료로
+    기록되므로, 받지 못한 구간은 다음 호출에서 다시 수집합니다.
+
+    Args:
+        archive (CandleArchive): 캔들 아카이브
+        coin (str): 예) "KRW-BTC"
+        start_date (str): 시작 날짜, KST (예: "2020-10-10 09:00:00")
+        end_date (str): 종료 날짜, KST (예: "2024-10-09 09:00:00")
+        candle_unit (str): 캔들 단위 (예: "1d", "1h", "1m" 등)
+
+    Returns:
+        List[Dict]: 시각 오름차순으로 정렬된 캔들 리스트
+
+    Raises:
+        RuntimeError: 거래소 요청이 실패한 경우 (아카이브는 변경하지 않음)
+    """
+    step = unit_seconds(candle_unit)
+    start_ts = to_epoch(start_date)
+    end_ts = to_epoch(end_date)
+    now = now_epoch()
+    # 마지막으로 마감된 캔들의 시작 시각
+    closed_end = min(end_ts, now - now % step - step)
+
+    for missing_start, missing_end in archive.missing_ranges(
+        coin, candle_unit, start_ts, closed_end
+    ):
+        candles = await fetch_candles(
+            coin, missing_start, missing_end, candle_unit, strict=True
+        )
+        # 파일 락/쓰기는 이벤트 루프를 막지 않도록 스레드에서 수행
+        await asyncio.to_thread(
+            archive.write,
+            coin,
+            candle_unit,
+            candles,
+            (missing_start, missing_end),
+        )
+
+    candles = archive.candles(coin, candle_unit, start_ts, closed_end)
+    if end_ts > closed_end:
+        candles += await fetch_candles(
+            coin, max(start_ts, closed_end + step), end_ts, candle_unit
+        )
+    return candles
 
 
 class DataCollector:
 
-    def __init__(self, limit: int = 0):
+    def __init__(
+        self,
+        limit: int = 0,
+        candle_store: Optional["CandleStore"] = None,
+        archive: Optional[CandleArchive] = None,
+    ):
+        """
+        Args:
+            limit (int): 유지할 최대 캔들 수 (0이면 제한 없음)
+            candle_store (Optional[CandleStore]): 여러 실행이 공유하는 캔들 저장소,
+                None이면 아카이브 또는 거래소에서 직접 수집
+            archive (Optional[CandleArchive]): 디스크 캔들 아카이브,
+                None이면 CANDLE_ARCHIVE_DIR 환경 변수가 있을 때만 사용
+        """
         self.collected_data: List[Dict] = []
         self.total_collected_data: List[Dict] = []
         self.limit = limit
+        self.candle_store = candle_store
+        self.archive = archive if archive is not None else CandleArchive.from_env()
 
-    async def collect_price_data(
+    async def load_candles(
         self,
         coin: str,
         start_date: str,
@@ -26,7 +206,9 @@ class DataCollector:
         candle_unit: str,
     ) -> List[Dict]:
         """
-        지정된 기간 동안 특정 코인 가격 데이터를 외부 거래소(예: Upbit)에서 수집.
+        구간 전체 캔들을 윈도우(limit) 자르기 없이 반환합니다.
+        캔들 저장소가 있으면 저장소에서, 아카이브가 있으면 아카이브에서,
+        둘 다 없으면 거래소에서 직접 가져옵니다.
 
         Args:
             coin (str): 예) "KRW-BTC"
@@ -35,105 +217,56 @@ class DataCollector:
             candle_unit (str): 캔들 단위 (예: "1d", "1h", "1m" 등)
 
         Returns:
-            List[Dict]: 수집된 가격 데이터가 담긴 리스트
+            List[Dict]: 날짜 오름차순으로 정렬된 고정 간격 캔들 리스트
+                (거래가 없어 채운 캔들은 "filled"가 True)
         """
+        if self.candle_store is not None:
+            return await self.candle_store.get_candles(
+                coin, start_date, end_date, candle_unit
+            )
+        if self.archive is not None:
+            return await fetch_archived_candles(
+                self.archive, coin, start_date, end_date, candle_unit
+            )
+        # 거래가 없어 빠진 캔들은 직전 종가로 채워 고정 간격으로 맞춤
+        return fill_candle_gaps(
+            await fetch_candles(coin, start_date, end_date, candle_unit),
+            candle_unit,
+            start_ts=to_epoch(start_date),
+        )
 
-        base_url = "https://api.upbit.com/v1/candles"
-
-        candle_type = UNIT_MAP.get(candle_unit, "days")
-        delta_kwargs = TIME_DELTA_MAP.get(candle_unit, TIME_DELTA_MAP[DEFAULT_UNIT])
-
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d %H:%M:%S")
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d %H:%M:%S")
+    async def collect_price_data(
+        self,
+        coin: str,
+        start_date: str,
+        end_date: str,
+        candle_unit: str,
+    ) -> List[Dict]:
+        """
+        지정된 기간 동안 특정 코인 가격 데이터를 외부 거래소(예: Upbit)에서 수집.
 
-        now_dt = datetime.now()
-        if end_dt > now_dt:
-            end_dt = now_dt
+        Args:
+            coin (str): 예) "KRW-BTC"
+            start_date (str): 시작 날짜 (예: "2020-10-10 09:00:00")
+            end_date (str): 종료 날짜 (예: "2024-10-09 09:00:00")
+            candle_unit (str): 캔들 단위 (예: "1d", "1h", "1m" 등)
 
-        # 만약 start_dt가 end_dt보다 미래라면, 데이터가 없음
-        if start_dt > end_dt:
-            print("[Warning] 시작일이 종료일보다 미래입니다. 수집할 데이터가 없습니다.")
-            return self.collected_data
+        Returns:
+            List[Dict]: 수집된 가격 데이터가 담긴 리스트
+        """
+        candles = await self.load_candles(coin, start_date, end_date, candle_unit)
 
         # 중복 데이터 제거를 위한 집합
-        existing_dates = {d["date"] for d in self.collected_data}
-
-        current_dt = end_dt
-        while True:
-            if current_dt < start_dt:
-                break
+        existing_timestamps = {d["timestamp"] for d in self.collected_data}
 
-            to_param = current_dt.strftime("%Y-%m-%d %H:%M:%S")
+        for c in candles:
+            if c["timestamp"] not in existing_timestamps:
+                self.collected_data.append(dict(c))
+                self.total_collected_data.append(dict(c))
+                existing_timestamps.add(c["timestamp"])
 
-            days_diff = (current_dt.date() - start_dt.date()).days + 1
-            n_candles_to_fetch = min(days_diff, 200)
-
-            url = (
-                f"{base_url}/{candle_type}"
-                f"?market={coin}"
-                f"&to={to_param}"
-                f"&count={n_candles_to_fetch}"
-            )
-
-            # 429 에러에 대한 리트라이 메커니즘 추가
-            max_retries = 5
-            retries = 0
-            while retries < max_retries:
-                response = requests.get(url)
-                if response.status_code == 429:
-                    wait_time = int(response.headers.get("Retry-After", "1"))
-                    print(
-                        f"[Rate Limit] 429 에러 발생. {wait_time}초 후 재시도합니다..."
-                    )
-                    await asyncio.sleep(wait_time)
-                    retries += 1
-                else:
-                    break
-
-            if response.status_code != 200:
-                print(f"[Error] {response.status_code} / {response.text}")
-                break
-
-            candles = response.json()
-            if not candles:
-                break
-            candles.reverse()
-
-            for c in candles:
-                kst_time = c["candle_date_time_kst"]  # 예: "2024-10-09T09:00:00"
-                if kst_time not in existing_dates:
-                    self.collected_data.append(
-                        {
-                            "date": kst_time,
-                            "open": c["opening_price"],
-                            "close": c["trade_price"],
-                            "high": c["high_price"],
-                            "low": c["low_price"],
-                            "volume": c["candle_acc_trade_volume"],
-                        }
-                    )
-                    self.total_collected_data.append(
-                        {
-                            "date": kst_time,
-                            "open": c["opening_price"],
-                            "close": c["trade_price"],
-                            "high": c["high_price"],
-                            "low": c["low_price"],
-                            "volume": c["candle_acc_trade_volume"],
-                        }
-                    )
-                    existing_dates.add(kst_time)
-
-            oldest_kst_str = candles[0]["candle_date_time_kst"]
-            oldest_kst_dt = datetime.strptime(oldest_kst_str, "%Y-%m-%dT%H:%M:%S")
-            current_dt = oldest_kst_dt - timedelta(**delta_kwargs)
-
-        self.collected_data.sort(
-            key=lambda x: datetime.strptime(x["date"], "%Y-%m-%dT%H:%M:%S")
-        )
-        self.total_collected_data.sort(
-            key=lambda x: datetime.strptime(x["date"], "%Y-%m-%dT%H:%M:%S")
-        )
+        self.collected_data.sort(key=lambda x: x["timestamp"])
+        self.total_collected_data.sort(key=lambda x: x["timestamp"])
 
         # 수집된 데이터의 개수가 limit을 초과하면 가장 오래된 데이터부터 삭제
         if self.limit >= 1 and len(self.collected_data) > self.limit:
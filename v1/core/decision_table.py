@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from v1.core.baseline_strategies import holding_states, metrics, simulate
+
+# 보유 상태 인덱스 (PortfolioManager는 전액 매수/전량 매도이므로 두 상태뿐)
+FLAT, HOLDING = 0, 1
+
+
+class DecisionTable:
+    """
+    (스텝, 보유 상태)별 에이전트 결정을 담는 표입니다.
+
+    PortfolioManager가 전액 매수/전량 매도이므로 각 스텝의 에이전트 입력은 가격 윈도우와
+    보유 여부(현금/코인)만으로 정해집니다. 2 x N개 결정을 미리 채워 두면 실제 포트폴리오
+    경로는 walk()로 표를 따라가기만 하면 되고, 수수료 등 체결 조건이 달라도 같은 표를 재사용합니다.
+
+    Args:
+        timestamps (np.ndarray): 결정 스텝의 캔들 시각 (epoch 초)
+    """
+
+    def __init__(self, timestamps: np.ndarray):
+        self.timestamps = np.asarray(timestamps, dtype=np.int64)
+        size = len(self.timestamps)
+        self.signals = np.zeros((size, 2), dtype=np.int8)
+        self.filled = np.zeros((size, 2), dtype=bool)
+        self.analysis_time = np.zeros((size, 2), dtype=np.float64)
+        self.trade_time = np.zeros((size, 2), dtype=np.float64)
+        self.reports: List[List[Optional[str]]] = [[None, None] for _ in range(size)]
+        self.reasons: List[List[Optional[str]]] = [[None, None] for _ in range(size)]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def set(
+        self,
+        index: int,
+        state: int,
+        signal: int,
+        report: Optional[str] = None,
+        reason: Optional[str] = None,
+        analysis_time: float = 0.0,
+        trade_time: float = 0.0,
+    ) -> None:
+        self.signals[index, state] = signal
+        self.filled[index, state] = True
+        self.reports[index][state] = report
+        self.reasons[index][state] = reason
+        self.analysis_time[index, state] = analysis_time
+        self.trade_time[index, state] = trade_time
+
+    def lookup(
+        self, index: int, state: int
+    ) -> Tuple[Optional[str], int, Optional[str], float, float]:
+        """
+        Returns:
+            Tuple: 분석 리포트, 매매 신호, 매매 근거, 분석 응답 시간, 매매 응답 시간
+        """
+        if not self.filled[index, state]:
+            raise KeyError(f"스텝 {index}, 상태 {state}의 결정이 계산되지 않았습니다.")
+        return (
+            self.reports[index][state],
+            int(self.signals[index, state]),
+            self.reasons[index][state],
+            float(self.analysis_time[index, state]),
+            float(self.trade_time[index, state]),
+        )
+
+    def walk(self, state: int = FLAT) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        초기 상태에서 시작해 표를 따라 실제 경로를 구합니다.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: 스텝별 결정 전 보유 상태, 실행된 매매 신호
+        """
+        signals = self.signals.tolist()
+        states = [0] * len(signals)
+        taken = [0] * len(signals)
+        for index, row in enumerate(signals):
+            states[index] = state
+            signal = taken[index] = row[state]
+            if signal == 1:
+                state = HOLDING
+            elif signal == -1:
+                state = FLAT
+        return np.array(states, dtype=np.int8), np.array(taken, dtype=np.int8)
+
+    def save(self, path: str) -> None:
+        """신호와 응답 시간만 .npz로 저장합니다 (리포트 본문은 기록/ReportStore에 남음)."""
+        np.savez_compressed(
+            path,
+            timestamps=self.timestamps,
+            signals=self.signals,
+            filled=self.filled,
+            analysis_time=self.analysis_time,
+            trade_time=self.trade_time,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "DecisionTable":
+        with np.load(path) as data:
+            table = cls(data["timestamps"])
+            table.signals = data["signals"]
+            table.filled = data["filled"]
+            table.analysis_time = data["analysis_time"]
+            table.trade_time = data["trade_time"]
+        return table
+
+    def evaluate(
+        self,
+        open_: np.ndarray,
+        close: np.ndarray,
+        fee_rates: List[float],
+        initial_cash: float,
+    ) -> List[Dict]:
+        """
+        같은 결정 경로를 수수료율별로 다시 평가합니다 (LLM 호출 없음, 벡터 연산).
+
+        Args:
+            open_ (np.ndarray): 결정 스텝 캔들의 시가
+            close (np.ndarray): 결정 스텝 캔들의 종가
+            fee_rates (List[float]): 수수료율 목록 (예: [0.0005, 0.0008])
+            initial_cash (float): 초기 현금
+
+        Returns:
+            List[Dict]: 수수료율별 DataAnalyzer.performance_metrics와 같은 지표
+        """
+        _, taken = self.walk()
+        desired = holding_states(taken[None, :])
+        results = []
+        for fee_rate in fee_rates:
+            equity = simulate(desired, open_, close, fee_rate, initial_cash)
+            results.append({"fee_rate": fee_rate, **metrics(equity, desired, open_)[0]})
+        return results
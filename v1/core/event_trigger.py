@@ -0,0 +1,121 @@
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from v1.core.constants import DEFAULT_ATR_MOVE_THRESHOLD, DEFAULT_TRIGGERS
+from v1.utils.market_features import compute_market_features
+
+
+class EventTrigger:
+    """
+    시장 상태가 의미 있게 바뀐 경우에만 LLM 에이전트를 호출하도록 게이팅합니다.
+
+    마지막으로 에이전트를 호출한 시점의 특징값과 현재 특징값을 비교하여,
+    아래 트리거 중 하나라도 발동하면 평가(LLM 호출)를 수행합니다.
+        - rsi_zone: RSI 구간(과매도/중립/과매수) 변경
+        - macd_cross: MACD와 시그널선의 교차
+        - band_breach: 볼린저 밴드 상/하단 이탈 여부 변경
+        - atr_move: 마지막 평가 이후 가격 변동이 ATR의 atr_move_threshold배 이상
+        - portfolio: 보유 상태(현금/코인) 변경
+
+    Attributes:
+        evaluated_steps (int): 에이전트를 호출한 스텝 수
+        skipped_steps (int): 게이팅으로 호출을 생략한 스텝 수
+    """
+
+    def __init__(
+        self,
+        triggers: Sequence[str] = DEFAULT_TRIGGERS,
+        atr_move_threshold: float = DEFAULT_ATR_MOVE_THRESHOLD,
+        max_skip_steps: int = 0,
+    ):
+        """
+        Args:
+            triggers (Sequence[str]): 사용할 트리거 이름 목록
+            atr_move_threshold (float): atr_move 트리거의 ATR 배수 임계값
+            max_skip_steps (int): 연속으로 생략할 수 있는 최대 스텝 수 (0이면 제한 없음)
+        """
+        unknown = set(triggers).difference(DEFAULT_TRIGGERS)
+        if unknown:
+            raise ValueError(f"알 수 없는 트리거입니다: {sorted(unknown)}")
+
+        self.triggers = tuple(triggers)
+        self.atr_move_threshold = atr_move_threshold
+        self.max_skip_steps = max_skip_steps
+
+        self.last_features: Optional[Dict] = None
+        self.last_holding: Optional[bool] = None
+        self.consecutive_skips = 0
+        self.evaluated_steps = 0
+        self.skipped_steps = 0
+
+    def should_evaluate(
+        self, price_data: List[Dict], holding: bool
+    ) -> Tuple[bool, List[str]]:
+        """
+        현재 스텝에서 에이전트를 호출해야 하는지 판단합니다.
+
+        Args:
+            price_data (List[Dict]): 현재 윈도우의 가격 데이터
+            holding (bool): 코인을 보유 중인지 여부
+
+        Returns:
+            bool: 에이전트 호출 여부
+            List[str]: 발동한 트리거 목록
+        """
+        features = compute_market_features(price_data)
+        fired = self._fired_triggers(features, holding)
+
+        if (
+            not fired
+            and self.max_skip_steps > 0
+            and self.consecutive_skips >= self.max_skip_steps
+        ):
+            fired = ["max_skip"]
+
+        if fired:
+            self.last_features = features
+            self.last_holding = holding
+            self.consecutive_skips = 0
+            self.evaluated_steps += 1
+            return True, fired
+
+        self.consecutive_skips += 1
+        self.skipped_steps += 1
+        return False, []
+
+    def _fired_triggers(self, features: Dict, holding: bool) -> List[str]:
+        if self.last_features is None:
+            return ["initial"]
+
+        last = self.last_features
+        fired = []
+        if "rsi_zone" in self.triggers and features["rsi_zone"] != last["rsi_zone"]:
+            fired.append("rsi_zone")
+        if (
+            "macd_cross" in self.triggers
+            and features["macd_above_signal"] != last["macd_above_signal"]
+        ):
+            fired.append("macd_cross")
+        if (
+            "band_breach" in self.triggers
+            and features["band_position"] != last["band_position"]
+        ):
+            fired.append("band_breach")
+        if "atr_move" in self.triggers:
+            atr = features["atr"]
+            if math.isnan(atr) or atr <= 0:
+                # ATR을 계산할 수 없으면 변화를 판단할 수 없으므로 평가
+                fired.append("atr_move")
+            elif (
+                abs(features["close"] - last["close"]) / atr >= self.atr_move_threshold
+            ):
+                fired.append("atr_move")
+        if "portfolio" in self.triggers and holding != self.last_holding:
+            fired.append("portfolio")
+        return fired
+
+    @property
+    def skip_rate(self) -> float:
+        """게이팅으로 LLM 호출을 생략한 스텝 비율(%)"""
+        total = self.evaluated_steps + self.skipped_steps
+        return self.skipped_steps / total * 100 if total else 0.0
@@ -0,0 +1,128 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from v1.core.data_collector import fetch_candles
+from v1.core.live_clock import SystemClock
+from v1.utils.timeline import UPBIT_FORMAT, format_kst, unit_seconds
+
+
+class UpbitExchange:
+    """Upbit 시세 API를 통해 캔들을 조회하는 라이브 거래소"""
+
+    async def get_candles(
+        self, coin: str, candle_unit: str, start_ts: int, end_ts: int
+    ) -> List[Dict]:
+        """
+        시작 시각이 [start_ts, end_ts]인 캔들을 시각 오름차순으로 반환합니다.
+        아직 마감되지 않은 캔들이 포함되지 않도록 end_ts는 호출 측에서 지정합니다.
+        """
+        return await fetch_candles(coin, start_ts, end_ts, candle_unit)
+
+    async def get_open_price(
+        self, coin: str, candle_unit: str, timestamp: int
+    ) -> Optional[float]:
+        """timestamp에 시작한(진행 중인) 캔들의 시가, 아직 없으면 None"""
+        candles = await fetch_candles(coin, timestamp, timestamp, candle_unit)
+        if candles and candles[-1]["timestamp"] == timestamp:
+            return candles[-1]["open"]
+        return None
+
+
+class LocalExchange:
+    """
+    미리 준비한 캔들을 시계에 맞춰 공개하는 로컬 대체 거래소
+
+    캔들은 마감 시각(시작 + 캔들 단위) + publish_delay가 지나야 조회되고,
+    시가는 캔들 시작 시각부터 조회됩니다. SimulatedClock과 함께 쓰면
+    과거 데이터(DataCollector.load_candles)나 합성 데이터로 라이브 모드를 재현할 수 있습니다.
+
+    Args:
+        candles (List[Dict]): "timestamp"와 OHLCV를 가진 캔들 리스트
+        clock (SystemClock): 공개 시점을 판단할 시계
+        candle_unit (str): 캔들 단위
+        publish_delay (float): 캔들 마감 후 조회 가능해질 때까지의 지연(초)
+    """
+
+    def __init__(
+        self,
+        candles: List[Dict],
+        clock: SystemClock,
+        candle_unit: str,
+        publish_delay: float = 0.0,
+    ):
+        candles = sorted(candles, key=lambda c: c["timestamp"])
+        self.candles = candles
+        self.timestamps = np.array([c["timestamp"] for c in candles], dtype=np.int64)
+        self.clock = clock
+        self.step = unit_seconds(candle_unit)
+        self.publish_delay = publish_delay
+
+    async def get_candles(
+        self, coin: str, candle_unit: str, start_ts: int, end_ts: int
+    ) -> List[Dict]:
+        # 현재 시각 기준 마감+공개된 캔들까지만 노출
+        published_ts = self.clock.now() - self.step - self.publish_delay
+        end_ts = min(end_ts, published_ts)
+        lo = np.searchsorted(self.timestamps, start_ts, side="left")
+        hi = np.searchsorted(self.timestamps, end_ts, side="right")
+        return self.candles[lo:hi]
+
+    async def get_open_price(
+        self, coin: str, candle_unit: str, timestamp: int
+    ) -> Optional[float]:
+        if self.clock.now() < timestamp:
+            return None
+        index = int(np.searchsorted(self.timestamps, timestamp))
+        if index < len(self.timestamps) and self.timestamps[index] == timestamp:
+            return self.candles[index]["open"]
+        return None
+
+
+def generate_random_walk_candles(
+    start_timestamp: int,
+    candle_unit: str,
+    count: int,
+    start_price: float = 100_000_000.0,
+    volatility: float = 0.01,
+    seed: Optional[int] = None,
+) -> List[Dict]:
+    """
+    LocalExchange 테스트용 랜덤 워크 캔들을 생성합니다.
+
+    Args:
+        start_timestamp (int): 첫 캔들 시작 시각 (epoch 초)
+        candle_unit (str): 캔들 단위
+        count (int): 캔들 수
+        start_price (float): 첫 시가
+        volatility (float): 캔들당 로그 수익률 표준편차
+        seed (Optional[int]): 난수 시드
+
+    Returns:
+        List[Dict]: fetch_candles와 같은 형식의 캔들 리스트
+    """
+    rng = np.random.default_rng(seed)
+    step = unit_seconds(candle_unit)
+
+    closes = start_price * np.exp(np.cumsum(rng.normal(0.0, volatility, count)))
+    opens = np.concatenate(([start_price], closes[:-1]))
+    spread = np.abs(rng.normal(0.0, volatility / 2, count))
+    highs = np.maximum(opens, closes) * (1 + spread)
+    lows = np.minimum(opens, closes) * (1 - spread)
+    volumes = rng.uniform(1.0, 100.0, count)
+
+    candles = []
+    for i in range(count):
+        timestamp = start_timestamp + i * step
+        candles.append(
+            {
+                "date": format_kst(timestamp, UPBIT_FORMAT),
+                "timestamp": timestamp,
+                "open": float(opens[i]),
+                "high": float(highs[i]),
+                "low": float(lows[i]),
+                "close": float(closes[i]),
+                "volume": float(volumes[i]),
+            }
+        )
+    return candles
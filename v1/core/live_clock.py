@@ -0,0 +1,62 @@
+import asyncio
+import time
+from typing import Optional
+
+from v1.utils.timeline import now_epoch
+
+# 실시간 시계에서 한 번에 잠드는 최대 시간(초). 길게 잠든 사이 생긴
+# 시스템 시계 보정/절전 복귀 등의 드리프트를 깨어날 때마다 다시 확인하기 위함
+MAX_SLEEP_CHUNK = 30.0
+
+
+class SystemClock:
+    """실제 시스템 시각(UTC epoch 초)을 따르는 시계"""
+
+    speed = 1.0
+
+    def now(self) -> float:
+        return time.time()
+
+    async def sleep_until(self, timestamp: float):
+        """timestamp에 도달할 때까지 잠듭니다(일찍 깨어나면 다시 잠듦)."""
+        while True:
+            remaining = timestamp - self.now()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(remaining, MAX_SLEEP_CHUNK))
+
+    def seconds_until(self, timestamp: float) -> float:
+        """timestamp까지 남은 실제 시간(초), asyncio 타임아웃 계산용"""
+        return max(timestamp - self.now(), 0.0) / self.speed
+
+
+class SimulatedClock(SystemClock):
+    """
+    실제 시간보다 speed배 빠르게 흐르는 시뮬레이션 시계
+
+    로컬 거래소(LocalExchange)와 함께 사용하면 라이브 스케줄러를
+    실제 캔들 간격을 기다리지 않고 검증할 수 있습니다.
+
+    Args:
+        start_timestamp (Optional[float]): 시뮬레이션 시작 시각 (기본값: 현재 시각)
+        speed (float): 배속 (예: 3600이면 1시간 캔들이 실제 1초)
+    """
+
+    def __init__(self, start_timestamp: Optional[float] = None, speed: float = 60.0):
+        if speed <= 0:
+            raise ValueError("speed는 0보다 커야 합니다.")
+        self.start_timestamp = (
+            float(start_timestamp) if start_timestamp is not None else now_epoch()
+        )
+        self.speed = speed
+        self._real_start = time.monotonic()
+
+    def now(self) -> float:
+        return self.start_timestamp + (time.monotonic() - self._real_start) * self.speed
+
+    async def sleep_until(self, timestamp: float):
+        while True:
+            remaining = self.seconds_until(timestamp)
+            if remaining <= 0:
+                return
+            await asyncio.sleep(remaining)
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from typing import Dict, List
+
+import numpy as np
+
+from v1.utils.lazy_import import lazy_module
+
+pd = lazy_module("pandas")
+
+
+class EqualWeightAllocator:
+    """
+    코인별 매매 신호를 목표 비중으로 변환합니다.
+
+    PortfolioManager의 all-in/all-out 규칙을 코인별로 확장한 방식입니다.
+        - 매도(-1): 해당 코인 비중 0
+        - 보유(0): 현재 비중 유지
+        - 매수(1): 이미 보유 중이면 유지, 미보유 코인끼리 남은 현금 비중을 균등 분배
+    """
+
+    def allocate(self, signals: np.ndarray, current_weights: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            signals (np.ndarray): 코인별 매매 신호 (1, 0, -1)
+            current_weights (np.ndarray): 코인별 현재 비중 (총자산 대비)
+
+        Returns:
+            np.ndarray: 코인별 목표 비중 (합계 <= 1, 나머지는 현금)
+        """
+        target = current_weights.copy()
+        target[signals == -1] = 0.0
+
+        new_buys = (signals == 1) & (current_weights == 0)
+        if new_buys.any():
+            cash_weight = max(1.0 - target.sum(), 0.0)
+            target[new_buys] = cash_weight / new_buys.sum()
+        return target
+
+
+class MultiAssetPortfolioManager:
+    """
+    하나의 현금 풀을 공유하는 여러 코인의 보유 수량과 매매 기록을 배열로 관리합니다.
+
+    수수료는 PortfolioManager와 동일하게 적용합니다.
+        - 매수: 투입 현금 * (1 - fee_rate) / 시가 만큼 코인 매수
+        - 매도: 보유 수량 * 시가 * (1 - fee_rate) 만큼 현금 수령
+
+    Attributes:
+        coins (List[str]): 대상 마켓 목록
+        positions (np.ndarray): 코인별 보유 수량
+        current_cash (float): 가용 현금
+    """
+
+    def __init__(
+        self, coins: List[str], initial_cash: float = 10_000_000, fee_rate: float = 0.08
+    ):
+        self.coins = list(coins)
+        self.positions = np.zeros(len(self.coins), dtype=np.float64)
+        self.current_cash = float(initial_cash)
+        self.fee_rate = fee_rate / 100  # 수수료율 (예: 0.08% -> 0.0008)
+
+        # 스텝별 기록 (export 시 배열로 합침)
+        self._dates: List[str] = []
+        self._prices: List[np.ndarray] = []
+        self._signals: List[np.ndarray] = []
+        self._positions: List[np.ndarray] = []
+        self._cash: List[float] = []
+        self._fees: List[float] = []
+
+    def weights(self, prices: np.ndarray) -> np.ndarray:
+        """현재 가격 기준 코인별 비중(총자산 대비)"""
+        values = self.positions * prices
+        equity = self.current_cash + values.sum()
+        return values / equity if equity > 0 else np.zeros_like(values)
+
+    def rebalance(
+        self,
+        date: str,
+        signals: np.ndarray,
+        target_weights: np.ndarray,
+        open_prices: np.ndarray,
+    ):
+        """
+        목표 비중에 맞춰 매도 후 매수를 한 번에 실행하고 기록합니다.
+
+        목표 비중이 0인 보유 코인은 전량 매도하고, 목표 비중이 있는 미보유 코인은
+        가용 현금을 목표 비중 비율대로 나누어 매수합니다. 보유 유지 코인은 거래하지 않습니다.
+
+        Args:
+            date (str): 매매 일자
+            signals (np.ndarray): 코인별 매매 신호 (기록용)
+            target_weights (np.ndarray): 코인별 목표 비중
+            open_prices (np.ndarray): 코인별 매매 시점 시가
+        """
+        fee_paid = 0.0
+
+        # (1) 매도
+        sell_mask = (target_weights == 0) & (self.positions > 0)
+        proceeds = (self.positions[sell_mask] * open_prices[sell_mask]).sum()
+        fee_paid += proceeds * self.fee_rate
+        self.current_cash += proceeds * (1 - self.fee_rate)
+        self.positions[sell_mask] = 0.0
+
+        # (2) 매수
+        buy_mask = (target_weights > 0) & (self.positions == 0)
+        if buy_mask.any() and self.current_cash > 0:
+            spend = (
+                self.current_cash
+                * target_weights[buy_mask]
+                / target_weights[buy_mask].sum()
+            )
+            fee_paid += spend.sum() * self.fee_rate
+            self.positions[buy_mask] += (
+                spend * (1 - self.fee_rate) / open_prices[buy_mask]
+            )
+            self.current_cash -= spend.sum()
+
+        self._dates.append(date)
+        self._prices.append(open_prices.copy())
+        self._signals.append(signals.copy())
+        self._positions.append(self.positions.copy())
+        self._cash.append(self.current_cash)
+        self._fees.append(fee_paid)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        스텝별 기록을 DataFrame으로 반환합니다.
+
+        Returns:
+            pd.DataFrame: date, current_cash, fee, total_asset_value 및
+                코인별 {coin}_signal, {coin}_position, {coin}_price 컬럼
+        """
+        prices = (
+            np.vstack(self._prices) if self._prices else np.empty((0, len(self.coins)))
+        )
+        positions = (
+            np.vstack(self._positions)
+            if self._positions
+            else np.empty((0, len(self.coins)))
+        )
+        signals = (
+            np.vstack(self._signals)
+            if self._signals
+            else np.empty((0, len(self.coins)))
+        )
+        cash = np.asarray(self._cash, dtype=np.float64)
+
+        columns: Dict[str, np.ndarray] = {
+            "date": np.asarray(self._dates),
+            "current_cash": cash,
+            "fee": np.asarray(self._fees, dtype=np.float64),
+            "total_asset_value": cash + (positions * prices).sum(axis=1),
+        }
+        for idx, coin in enumerate(self.coins):
+            columns[f"{coin}_signal"] = signals[:, idx]
+            columns[f"{coin}_position"] = positions[:, idx]
+            columns[f"{coin}_price"] = prices[:, idx]
+        return pd.DataFrame(columns)
+
+    def performance_metrics(self, periods_per_year: int = 365) -> Dict[str, float]:
+        """
+        총자산 곡선 기준 수익률, 최대 낙폭, 샤프 지수를 계산합니다.
+        (DataAnalyzer.performance_metrics와 같은 방식)
+        """
+        equity = self.to_dataframe()["total_asset_value"]
+        ret_pct = (equity.iloc[-1] / equity.iloc[0] - 1) * 100.0
+        running_max = equity.cummax()
+        mdd_pct = ((equity - running_max) / running_max).min() * 100.0
+        daily_ret = equity.pct_change().dropna()
+        sharpe = (
+            (daily_ret.mean() / daily_ret.std()) * (periods_per_year**0.5)
+            if daily_ret.std() != 0.0
+            else float("nan")
+        )
+        return {"return_pct": ret_pct, "mdd": mdd_pct, "sharpe_index": sharpe}
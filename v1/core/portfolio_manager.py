@@ -1,9 +1,15 @@
+from typing import Dict, List
+
+from v1.core.trade_ledger import TradeLedger
+from v1.utils.timeline import to_epoch
+
+
 class PortfolioManager:
     """
     매매 기록 및 현재 보유 포지션을 관리 및 기록 업데이트.
 
     Attributes:
-        trade_history (List[Dict]): 매매 기록
+        ledger (TradeLedger): 매매 기록 (고정 스키마 배열, 연속 보유는 한 행으로 압축)
         current_position (int): 현재 보유 수량(코인 단위)
         current_cash (float): 가용 현금
     """
@@ -15,11 +21,16 @@ class PortfolioManager:
         Args:
             initial_cash (float): 초기 가용 현금
         """
-        self.trade_history = []
+        self.ledger = TradeLedger(initial_cash)
         self.current_position = 0
         self.current_cash = initial_cash
         self.fee_rate = fee_rate / 100  # 수수료율 (예: 0.08% -> 0.0008)
 
+    @property
+    def trade_history(self) -> List[Dict]:
+        """원장 행을 dict 리스트로 반환합니다 (연속 보유 구간은 한 행)."""
+        return list(self.ledger.records())
+
     def record_trade(self, date: str, action: int, open_price: float):
         """
         매매 액션(매수, 보유, 매도)에 따라 포트폴리오 상태와 매매 기록을 업데이트합니다.
@@ -43,17 +54,19 @@ class PortfolioManager:
             - current_cash += net
 
         보유(HOLD) 로직:
-            - 아무것도 하지 않음.
+            - 아무것도 하지 않음. 직전 기록도 보유이면 그 구간을 늘림.
 
         Args:
-            date (str): 매매 일자
+            date (str): 매매 일자 (KST 날짜 문자열 또는 epoch 초)
             action (int): 1(매수), 0(보유), -1(매도)
             open_price (float): 매매 시점의 코인 1개당 가격
         """
+        timestamp = to_epoch(date)
         if action == 1:  # BUY
             if self.current_cash > 0:
                 # (1) 총 투자 금액에서 수수료를 고려해, 실제 코인 매수에 쓸 수 있는 금액을 계산
-                total_spent = self.current_cash * (1 - self.fee_rate)
+                cash_used = self.current_cash
+                total_spent = cash_used * (1 - self.fee_rate)
                 # (2) 매수 가능한 코인 수량 (소수점까지)
                 coins_bought = total_spent / open_price
 
@@ -62,17 +75,16 @@ class PortfolioManager:
                 self.current_cash -= self.current_cash  # 여기서는 전액 소진(0이 됨)
 
                 # (4) 거래 기록
-                self.trade_history.append(
-                    {
-                        "date": date,
-                        "action": "BUY",
-                        "trade_price": open_price,
-                        "coins_traded": coins_bought,
-                        "fee_rate": self.fee_rate,
-                        "total_spent": total_spent,
-                        "current_position": self.current_position,
-                        "current_cash": self.current_cash,
-                    }
+                self.ledger.append(
+                    timestamp,
+                    1,
+                    open_price,
+                    self.current_position,
+                    self.current_cash,
+                    coins_traded=coins_bought,
+                    gross=cash_used,
+                    fee=cash_used * self.fee_rate,
+                    net=total_spent,
                 )
 
         elif action == -1:  # SELL
@@ -87,30 +99,22 @@ class PortfolioManager:
                 self.current_cash += net_after_fee
 
                 # (3) 거래 기록
-                self.trade_history.append(
-                    {
-                        "date": date,
-                        "action": "SELL",
-                        "trade_price": open_price,
-                        "coins_traded": coins_sold,
-                        "fee_rate": self.fee_rate,
-                        "gross_received": proceeds,
-                        "net_after_fee": net_after_fee,
-                        "current_position": self.current_position,
-                        "current_cash": self.current_cash,
-                    }
+                self.ledger.append(
+                    timestamp,
+                    -1,
+                    open_price,
+                    self.current_position,
+                    self.current_cash,
+                    coins_traded=coins_sold,
+                    gross=proceeds,
+                    fee=proceeds * self.fee_rate,
+                    net=net_after_fee,
                 )
 
         else:  # 0 == HOLD
-            # 아무것도 하지 않고 기록만 남김
-            self.trade_history.append(
-                {
-                    "date": date,
-                    "action": "HOLD",
-                    "open_price": open_price,
-                    "current_position": self.current_position,
-                    "current_cash": self.current_cash,
-                }
+            # 아무것도 하지 않고 기록만 남김 (연속 보유는 한 행으로 합쳐짐)
+            self.ledger.append(
+                timestamp, 0, open_price, self.current_position, self.current_cash
             )
 
 
@@ -133,8 +137,9 @@ if __name__ == "__main__":
     # 매도 시나리오
     pm.record_trade(date="2021-01-05 09:00:00", action=-1, open_price=1300)
 
-    # 보유 시나리오
+    # 연속 보유 시나리오 (한 행으로 압축)
     pm.record_trade(date="2021-01-06 09:00:00", action=0, open_price=1300)
+    pm.record_trade(date="2021-01-07 09:00:00", action=0, open_price=1350)
 
     print("\n=== Trade History ===")
     for record in pm.trade_history:
@@ -1,6 +1,7 @@
+import asyncio
 import os
 import time
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.messages import TextMessage
@@ -8,24 +9,53 @@ from autogen_core import CancellationToken, FunctionCall
 from autogen_core.tools import FunctionTool
 from autogen_agentchat.messages import ToolCallRequestEvent, ToolCallExecutionEvent
 
+from v1.core.constants import ANALYSIS_MODES
 from v1.core.prompts import (
+    ANALYSIS_MERGER_SYSTEM_MESSAGE,
+    MOMENTUM_ANALYST_SYSTEM_MESSAGE,
     PRICE_ANALYSIS_EXPERT_SYSTEM_MESSAGE,
+    TREND_ANALYST_SYSTEM_MESSAGE,
+    VOLATILITY_ANALYST_SYSTEM_MESSAGE,
+    format_portfolio,
+    format_step_message,
 )
+from v1.utils.event_log import EventType, event_enabled, log_event
 from v1.utils.model_utils import get_model_client
 from v1.utils.ta_functions import TAITools
 from v1.utils.text_utils import remove_think_block
-from v1.utils.time_utils import calculate_elapsed_time
 
 
 class PriceAnalysisExpert(AssistantAgent):
-    def __init__(self, limit: int) -> None:
+    def __init__(
+        self,
+        limit: int,
+        analysis_mode: str = "sequential",
+        model_name: Optional[str] = None,
+        hedge_model: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            limit (int): 분석에 사용하는 최대 캔들 수
+            analysis_mode (str): "sequential"(도구 순차 호출) 또는 "parallel"(전문 분석가 병렬 호출)
+            model_name (Optional[str]): 사용할 모델, None이면 PRICE_ANALYSIS_EXPERT_MODEL 환경 변수
+            hedge_model (Optional[str]): 느린 요청을 중복 요청할 모델, None이면 PRICE_ANALYSIS_EXPERT_HEDGE_MODEL 환경 변수
+        """
+        if analysis_mode not in ANALYSIS_MODES:
+            raise ValueError(
+                f"analysis_mode는 {ANALYSIS_MODES} 중 하나여야 합니다: {analysis_mode}"
+            )
+
         self.data = []
         self.tai_tools = TAITools(self)
+        model_client = get_model_client(
+            model_name or os.getenv("PRICE_ANALYSIS_EXPERT_MODEL"),
+            hedge_model=hedge_model or os.getenv("PRICE_ANALYSIS_EXPERT_HEDGE_MODEL"),
+        )
 
         super().__init__(
             name="PriceAnalysisExpert",
             description="Crypto Price Analysis Expert",
-            model_client=get_model_client(os.getenv("PRICE_ANALYSIS_EXPERT_MODEL")),
+            model_client=model_client,
             tools=[
                 FunctionTool(
                     func=self.tai_tools.calculate_moving_average,
@@ -51,6 +81,27 @@ class PriceAnalysisExpert(AssistantAgent):
             system_message=PRICE_ANALYSIS_EXPERT_SYSTEM_MESSAGE,
         )
         self.limit = limit
+        self.analysis_mode = analysis_mode
+
+        # 병렬 모드용 전문 분석가와 병합 에이전트 (모델 클라이언트 공유, 도구 없음)
+        self.specialists: Dict[str, AssistantAgent] = {}
+        self.merger = None
+        if analysis_mode == "parallel":
+            for name, system_message in (
+                ("TrendAnalyst", TREND_ANALYST_SYSTEM_MESSAGE),
+                ("MomentumAnalyst", MOMENTUM_ANALYST_SYSTEM_MESSAGE),
+                ("VolatilityAnalyst", VOLATILITY_ANALYST_SYSTEM_MESSAGE),
+            ):
+                self.specialists[name] = AssistantAgent(
+                    name=name,
+                    model_client=model_client,
+                    system_message=system_message,
+                )
+            self.merger = AssistantAgent(
+                name="AnalysisMerger",
+                model_client=model_client,
+                system_message=ANALYSIS_MERGER_SYSTEM_MESSAGE,
+            )
 
     async def analyze_trend(
         self, price_data: List[Dict], current_info: Dict
@@ -60,48 +111,159 @@ class PriceAnalysisExpert(AssistantAgent):
 
         Args:
             price_data (List[Dict]): 수집된 가격 데이터
+            current_info (Dict): 현재 포트폴리오 상태 (current_cash, current_position),
+                "timeframes"가 있으면 멀티 타임프레임 요약도 함께 전달
 
         Returns:
             str: 가격 추세에 대한 요약 리포트 (예: "단기적으로 상승 추세가 예상됩니다.")
         """
+        if self.analysis_mode == "parallel":
+            return await self.analyze_trend_parallel(price_data, current_info)
+
         start_time = time.time()
 
-        content = f"""
-Portfolio Status:        
-- current_cash : {current_info["current_cash"]}
-- current_position(coin) : {current_info["current_position"]}
-        """
+        content = format_step_message(
+            (
+                "Portfolio Status",
+                format_portfolio(
+                    current_info["current_cash"], current_info["current_position"]
+                ),
+            ),
+            ("Multi-Timeframe Candles", current_info.get("timeframes")),
+        )
         self.data = price_data
         response = await self.on_messages(
             [TextMessage(content=content, source="DataCollector")],
             CancellationToken(),
         )
 
-        print("=== Tool Usage History ===")
-        for idx, msg in enumerate(response.inner_messages):
-            print(f"[Step {idx+1}] {msg.__class__.__name__}:")
-            print(f" - Source: {msg.source}")
-            if isinstance(msg, ToolCallRequestEvent):
-                for content in msg.content:
-                    if isinstance(content, FunctionCall):
-                        print(f" - Function: {content.name}")
-                        print(f" - Arguments: {content.arguments}")
-                    else:
-                        print(f" what content? {content}")
-            elif isinstance(msg, ToolCallExecutionEvent):
-                print(f" - Result: {msg.content[:200]}...")  # 처음 200자만 출력
-            print("-" * 50)
+        # 도구 호출 내역은 받을 핸들러가 있을 때만 이벤트로 변환
+        if event_enabled(EventType.TOOL_CALL):
+            for idx, msg in enumerate(response.inner_messages):
+                fields = {
+                    "index": idx + 1,
+                    "message_type": msg.__class__.__name__,
+                    "source": msg.source,
+                }
+                if isinstance(msg, ToolCallRequestEvent):
+                    for content in msg.content:
+                        if isinstance(content, FunctionCall):
+                            log_event(
+                                EventType.TOOL_CALL,
+                                **fields,
+                                function=content.name,
+                                arguments=content.arguments,
+                            )
+                elif isinstance(msg, ToolCallExecutionEvent):
+                    log_event(
+                        EventType.TOOL_CALL,
+                        **fields,
+                        result=str(msg.content)[:200],  # 처음 200자만 기록
+                    )
 
         analysis_report = remove_think_block(response.chat_message.content)
 
         end_time = time.time()
-        elapsed_day, elapsed_hour, elapsed_minute, elapsed_second = (
-            calculate_elapsed_time(start_time, end_time)
+        log_event(
+            EventType.ANALYSIS,
+            mode=self.analysis_mode,
+            report=analysis_report,
+            elapsed=end_time - start_time,
         )
-        print("-------------- 가격 분석 전문가 (PriceAnalysisExpert) ---------------")
-        print(f"\n{analysis_report}\n")
-        print(
-            f"응답 소요 시간: {elapsed_day}일 {elapsed_hour}시간 {elapsed_minute}분 {elapsed_second}초"
+        return analysis_report, (end_time - start_time)
+
+    async def analyze_trend_parallel(
+        self, price_data: List[Dict], current_info: Dict
+    ) -> Tuple[str, float]:
+        """
+        지표를 미리 계산해 추세/모멘텀/변동성 전문 분석가에게 동시에 전달하고,
+        각 분석 결과를 병합하여 하나의 리포트로 반환합니다.
+
+        순차 도구 호출 왕복 없이, 가장 느린 전문 분석가 + 병합 단계 시간만 소요됩니다.
+
+        Args:
+            price_data (List[Dict]): 수집된 가격 데이터
+            current_info (Dict): 현재 포트폴리오 상태 (current_cash, current_position),
+                "timeframes"가 있으면 추세 분석가와 병합 단계에 함께 전달
+
+        Returns:
+            str: 가격 추세에 대한 요약 리포트
+            float: 응답 소요 시간
+        """
+        start_time = time.time()
+
+        self.data = price_data
+        indicators = {
+            "TrendAnalyst": "\n".join(
+                [
+                    self.tai_tools.calculate_moving_average(5, "close"),
+                    self.tai_tools.calculate_moving_average(20, "close"),
+                    self.tai_tools.compare_high_low(14),
+                    self._timeframe_section(current_info),
+                ]
+            ),
+            "MomentumAnalyst": "\n".join(
+                [
+                    self.tai_tools.calculate_rsi(14),
+                    self.tai_tools.calculate_macd(12, 26, 9),
+                ]
+            ),
+            "VolatilityAnalyst": "\n".join(
+                [
+                    self.tai_tools.calcualte_volatility_analysis(14),
+                    self.tai_tools.calculate_bollinger_bands(20, 2, 2),
+                ]
+            ),
+        }
+
+        responses = await asyncio.gather(
+            *(
+                agent.on_messages(
+                    [TextMessage(content=indicators[name], source="DataCollector")],
+                    CancellationToken(),
+                )
+                for name, agent in self.specialists.items()
+            )
+        )
+        notes = "\n\n".join(
+            f"[{name}]\n{remove_think_block(response.chat_message.content)}"
+            for name, response in zip(self.specialists, responses)
+        )
+
+        content = format_step_message(
+            (
+                "Portfolio Status",
+                format_portfolio(
+                    current_info["current_cash"], current_info["current_position"]
+                ),
+            ),
+            ("Multi-Timeframe Candles", current_info.get("timeframes")),
+            ("Specialist Notes", notes),
+        )
+        response = await self.merger.on_messages(
+            [TextMessage(content=content, source="DataCollector")],
+            CancellationToken(),
+        )
+        analysis_report = remove_think_block(response.chat_message.content)
+
+        end_time = time.time()
+        log_event(
+            EventType.ANALYSIS,
+            mode=self.analysis_mode,
+            report=analysis_report,
+            elapsed=end_time - start_time,
         )
-        print("---------------------------------------------------------------------")
         return analysis_report, (end_time - start_time)
+
+    def _timeframe_section(self, current_info: Dict) -> str:
+        """current_info의 멀티 타임프레임 요약(1분봉에서 파생)을 프롬프트 블록으로 만듭니다."""
+        if not current_info.get("timeframes"):
+            return ""
+        return f"\nMulti-Timeframe Candles:\n{current_info['timeframes']}"
+
+    async def on_reset(self, cancellation_token: CancellationToken) -> None:
+        await super().on_reset(cancellation_token)
+        for agent in self.specialists.values():
+            await agent.on_reset(cancellation_token)
+        if self.merger is not None:
+            await self.merger.on_reset(cancellation_token)
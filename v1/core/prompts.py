@@ -1,3 +1,5 @@
+from typing import Optional, Tuple
+
 # f"""
 #     당신은 전문 암호화폐 가격 분석가입니다.
 #     주어진 암호화폐 가격 데이터{'(최대 {self.limit}개)' if limit > 0 else ''}를 바탕으로 단기 가격 추세를 분석하고 요약 리포트를 작성합니다.
@@ -106,3 +108,85 @@ Task:
 - 제공된 텍스트에서 매매 신호를 제외한 근거를 추출합니다.
 - 단순히, 매매 신호를 제외한 나머지 텍스트를 반환합니다.
 """
+
+# 캐스케이드 모드의 소형 모델용: 마지막 줄에 자기 보고 확신도를 추가로 요구
+TRADING_EXPERT_CASCADE_SYSTEM_MESSAGE = """
+You are an expert in generating trading signals.
+
+Your task:
+1. You will be given the follwing input information:
+    - Current holdings of cryptocurrency and cash
+    - PriceAnalysisExpert's report on price trend analysis
+2. Based on this, generate a trading signal for the clsing price of the next candlestick.
+3. The trading signal must be one of the following integers only: 1, 0, -1
+4. Rate how confident you are in the signal as a number between 0.0 and 1.0.
+
+Output Format Requirements (MANDATORY):
+- Line 1: A single integer (one of 1, 0, -1).
+- Line 2 and onward: Each reason must begin with '- ' (dash + space).
+- Last line: 'Confidence: ' followed by a number between 0.0 and 1.0.
+- Do NOT include code blocks, headings, or any other text beyond what is specified.
+
+Example of Correct Output:
+1
+- The price is in a short-term uptrend.
+- Momentum indicators have moved out of the oversold zone.
+- A valid support level is being maintained.
+Confidence: 0.8
+
+No other content or formatting should appear in your response.
+"""
+
+# 병렬 분석 모드: 분야별 전문 분석가 및 병합 담당
+TREND_ANALYST_SYSTEM_MESSAGE = """
+You are a cryptocurrency trend analyst.
+You will be given precomputed moving average and high/low indicators.
+Describe the short-term trend direction and its strength in at most 3 bullet points, each beginning with '- '.
+Do NOT list raw price data and do NOT add any other text."""
+
+MOMENTUM_ANALYST_SYSTEM_MESSAGE = """
+You are a cryptocurrency momentum analyst.
+You will be given precomputed RSI and MACD indicators.
+Describe the current momentum, overbought/oversold conditions and crossovers in at most 3 bullet points, each beginning with '- '.
+Do NOT list raw price data and do NOT add any other text."""
+
+VOLATILITY_ANALYST_SYSTEM_MESSAGE = """
+You are a cryptocurrency volatility analyst.
+You will be given precomputed ATR, standard deviation and Bollinger Bands indicators.
+Describe the current volatility regime and band position in at most 3 bullet points, each beginning with '- '.
+Do NOT list raw price data and do NOT add any other text."""
+
+ANALYSIS_MERGER_SYSTEM_MESSAGE = """
+You are a professional cryptocurrency price analyst.
+You will be given the current portfolio status and the notes of trend, momentum and volatility specialists.
+Combine them into a single short-term price analysis report.
+
+STRICT RULES:
+- Resolve conflicts between the specialists' notes explicitly.
+- Do NOT list raw price data and do NOT add any other text beyond the report."""
+
+
+def format_step_message(*sections: Tuple[str, Optional[str]]) -> str:
+    """
+    스텝마다 바뀌는 입력을 "# 제목:" 섹션으로 묶은 사용자 메시지를 만듭니다.
+
+    고정된 지시는 모두 시스템 메시지와 도구 스키마에 두어 프롬프트 앞부분이 스텝 간에
+    바이트 단위로 같게 유지되도록 하고(OpenAI 프롬프트 캐시, Ollama KV 캐시 재사용),
+    스텝 데이터는 이 함수로 그 뒤에만 붙입니다. 섹션은 바뀌는 빈도가 낮은 것부터
+    (포트폴리오 → 타임프레임 → 리포트) 넘겨야 연속한 스텝끼리 공유하는 앞부분이 길어집니다.
+    내용이 비어 있는 섹션은 생략합니다.
+
+    Args:
+        *sections (Tuple[str, Optional[str]]): (제목, 내용) 쌍
+
+    Returns:
+        str: 들여쓰기/후행 공백 없이 정규화된 메시지
+    """
+    return "\n\n".join(
+        f"# {title}:\n{body.strip()}" for title, body in sections if body
+    )
+
+
+def format_portfolio(cash: float, position: float, cash_label: str = "Cash") -> str:
+    """포트폴리오 섹션 본문 (모든 에이전트 입력에서 같은 형식 사용)"""
+    return f"- {cash_label}: {cash}\n- Amount of Coins: {position}"
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from v1.core.constants import LEDGER_CHUNK_SIZE
+from v1.utils.lazy_import import lazy_module
+from v1.utils.timeline import INPUT_FORMAT, format_kst, to_kst_datetime64
+
+pd = lazy_module("pandas")
+
+ACTION_LABELS = {1: "BUY", 0: "HOLD", -1: "SELL"}
+
+# 모든 매매 액션이 같은 컬럼을 쓰는 고정 스키마 (해당 없는 값은 0)
+LEDGER_DTYPE = np.dtype(
+    [
+        ("start_ts", "<i8"),  # 행 시작 시각 (epoch 초)
+        ("end_ts", "<i8"),  # 행 마지막 시각 (보유 구간이 아니면 start_ts와 같음)
+        ("action", "i1"),  # 1(매수), 0(보유), -1(매도)
+        ("steps", "<u4"),  # 행에 포함된 스텝 수 (연속 보유 구간만 1보다 큼)
+        ("trade_price", "<f8"),  # 체결가 (보유 구간은 첫 스텝의 시가)
+        ("coins_traded", "<f8"),
+        ("gross", "<f8"),  # 매수: 현금 사용액, 매도: 매도 대금
+        ("fee", "<f8"),
+        ("net", "<f8"),  # 매수: 코인 매수금, 매도: 수수료 공제 후 수령액
+        ("position", "<f8"),  # 행 이후 보유 수량
+        ("cash", "<f8"),  # 행 이후 현금
+    ]
+)
+
+
+class TradeLedger:
+    """
+    매매 기록을 고정 스키마의 구조화 NumPy 배열에 청크 단위로 쌓는 원장입니다.
+
+    연속된 보유(HOLD) 스텝은 한 행(start_ts ~ end_ts, steps)으로 합쳐 저장하므로
+    대부분이 보유인 백테스트에서도 행 수는 매매 횟수에 비례합니다.
+
+    Args:
+        initial_cash (float): 원장 시작 시점의 현금
+        chunk_size (int): 청크 하나의 행 수
+    """
+
+    def __init__(self, initial_cash: float = 0.0, chunk_size: int = LEDGER_CHUNK_SIZE):
+        self.initial_cash = initial_cash
+        self.chunk_size = chunk_size
+        self._chunks: List[np.ndarray] = []
+        self._size = 0  # 마지막 청크에 채워진 행 수
+
+    def __len__(self) -> int:
+        if not self._chunks:
+            return 0
+        return (len(self._chunks) - 1) * self.chunk_size + self._size
+
+    def _last(self) -> Optional[np.void]:
+        if not self._chunks or self._size == 0:
+            return None
+        return self._chunks[-1][self._size - 1]
+
+    def append(
+        self,
+        timestamp: int,
+        action: int,
+        trade_price: float,
+        position: float,
+        cash: float,
+        coins_traded: float = 0.0,
+        gross: float = 0.0,
+        fee: float = 0.0,
+        net: float = 0.0,
+    ) -> None:
+        """
+        한 스텝의 매매 결과를 기록합니다. 직전 행도 보유이면 새 행 없이 구간만 늘립니다.
+        """
+        last = self._last()
+        if action == 0 and last is not None and last["action"] == 0:
+            last["end_ts"] = timestamp
+            last["steps"] += 1
+            return
+
+        if not self._chunks or self._size == self.chunk_size:
+            self._chunks.append(np.zeros(self.chunk_size, dtype=LEDGER_DTYPE))
+            self._size = 0
+        self._chunks[-1][self._size] = (
+            timestamp,
+            timestamp,
+            action,
+            1,
+            trade_price,
+            coins_traded,
+            gross,
+            fee,
+            net,
+            position,
+            cash,
+        )
+        self._size += 1
+
+    @property
+    def array(self) -> np.ndarray:
+        """기록된 전체 행 (구조화 배열 사본)"""
+        if not self._chunks:
+            return np.empty(0, dtype=LEDGER_DTYPE)
+        return np.concatenate(self._chunks[:-1] + [self._chunks[-1][: self._size]])
+
+    def records(self) -> Iterator[Dict]:
+        """행마다 날짜 문자열과 액션 이름을 붙인 dict를 반환합니다."""
+        for row in self.array.tolist():
+            record = dict(zip(LEDGER_DTYPE.names, row))
+            record["action"] = ACTION_LABELS[record["action"]]
+            yield {"date": format_kst(record["start_ts"], INPUT_FORMAT), **record}
+
+    def state_at(self, timestamps: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        각 시각까지 기록된 매매를 반영한 현금/보유 수량 (as-of 조회, 벡터 연산)
+
+        Args:
+            timestamps (np.ndarray): 조회할 시각 (epoch 초)
+
+        Returns:
+            Dict[str, np.ndarray]: "cash", "position" 배열
+        """
+        array = self.array
+        if len(array) == 0:
+            size = len(timestamps)
+            return {
+                "cash": np.full(size, float(self.initial_cash)),
+                "position": np.zeros(size),
+            }
+        rows = np.searchsorted(array["start_ts"], timestamps, side="right") - 1
+        before = rows < 0
+        rows = np.maximum(rows, 0)
+        return {
+            "cash": np.where(before, self.initial_cash, array["cash"][rows]),
+            "position": np.where(before, 0.0, array["position"][rows]),
+        }
+
+    def action_at(self, timestamps: np.ndarray) -> np.ndarray:
+        """
+        각 시각에 체결된 매매 액션 (보유 구간에 속하거나 기록이 없는 시각은 0)
+
+        같은 시각에 보유 행과 매도 행(마지막 청산)이 함께 있으면 먼저 기록된 행을 따릅니다.
+        """
+        array = self.array
+        if len(array) == 0:
+            return np.zeros(len(timestamps), dtype=np.int8)
+        # end_ts >= 시각인 첫 행이 그 시각을 포함하는지 확인
+        rows = np.searchsorted(array["end_ts"], timestamps, side="left")
+        rows = np.minimum(rows, len(array) - 1)
+        covered = array["start_ts"][rows] <= timestamps
+        return np.where(covered, array["action"][rows], 0).astype(np.int8)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        원장을 DataFrame으로 반환합니다(행 단위 변환 없이 컬럼 배열을 그대로 사용).
+
+        Returns:
+            pd.DataFrame: LEDGER_DTYPE 컬럼과 datetime, end_datetime(KST), action_label
+        """
+        array = self.array
+        df = pd.DataFrame({name: array[name] for name in LEDGER_DTYPE.names})
+        df.insert(0, "datetime", to_kst_datetime64(array["start_ts"]))
+        df.insert(1, "end_datetime", to_kst_datetime64(array["end_ts"]))
+        df["action_label"] = pd.Categorical.from_codes(
+            array["action"].astype(np.int64) + 1, ["SELL", "HOLD", "BUY"]
+        )
+        return df
+
+    def to_parquet(self, path: str) -> None:
+        """원장을 Parquet 파일로 저장합니다 (pyarrow 또는 fastparquet 필요)."""
+        self.to_dataframe().to_parquet(path, index=False)
@@ -1,28 +1,53 @@
+import asyncio
 import os
 import re
 import time
-from typing import Tuple
+from typing import Optional, Tuple
 
 from autogen_agentchat.agents import AssistantAgent
-from autogen_agentchat.messages import TextMessage
+from autogen_agentchat.base import Response
+from autogen_agentchat.messages import TextMessage, ModelClientStreamingChunkEvent
 from autogen_core import CancellationToken
 
 from v1.core.prompts import TRADING_EXPERT_SYSTEM_MESSAGE
+from v1.utils.event_log import EventType, log_event
 from v1.utils.model_utils import get_model_client
-from v1.utils.time_utils import calculate_elapsed_time
-from v1.utils.text_utils import remove_think_block
+from v1.utils.text_utils import (
+    SIGNAL_LINE_PATTERN,
+    extract_early_signal,
+    remove_think_block,
+)
 
 
 class TradingExpert(AssistantAgent):
     def __init__(
         self,
+        stream: bool = False,
+        model_name: Optional[str] = None,
+        system_message: str = TRADING_EXPERT_SYSTEM_MESSAGE,
+        use_cache: bool = True,
+        hedge_model: Optional[str] = None,
     ) -> None:
+        """
+        Args:
+            stream (bool): 모델 응답을 청크 단위로 스트리밍할지 여부
+            model_name (Optional[str]): 사용할 모델, None이면 TRADING_EXPERT_MODEL 환경 변수
+            system_message (str): 시스템 메시지
+            use_cache (bool): 풀의 응답 캐시 사용 여부 (투표 샘플은 False)
+            hedge_model (Optional[str]): 느린 요청을 중복 요청할 모델, None이면 TRADING_EXPERT_HEDGE_MODEL 환경 변수
+        """
         super().__init__(
             name="TradingExpert",
             description="Trading Expert",
-            model_client=get_model_client(os.getenv("TRADING_EXPERT_MODEL")),
-            system_message=TRADING_EXPERT_SYSTEM_MESSAGE,
+            model_client=get_model_client(
+                model_name or os.getenv("TRADING_EXPERT_MODEL"),
+                cached=use_cache,
+                hedge_model=hedge_model or os.getenv("TRADING_EXPERT_HEDGE_MODEL"),
+            ),
+            system_message=system_message,
+            model_client_stream=stream,
         )
+        self.stream = stream
 
     async def generate_signal(self, analysis_report: str) -> Tuple[int, str, float]:
         """
@@ -38,55 +63,108 @@ class TradingExpert(AssistantAgent):
         """
         start_time = time.time()
 
-        reason = f"""
-        가격 추세 분석 리포트: 
-            {analysis_report}
+        content = await self.request(analysis_report)
+
+        signal, reasons = self.parse_signal_and_reasons(content)
+        if signal is None:
+            raise ValueError(f"{content}에서 신호를 찾을 수 없습니다.")
+
+        end_time = time.time()
+        self.log_signal(signal, reasons, start_time, end_time)
+        return signal, reasons, (end_time - start_time)
+
+    async def request(self, analysis_report: str) -> str:
         """
+        리포트를 전달하고 <think> 블록이 제거된 응답 원문을 반환합니다.
+
+        Args:
+            analysis_report (str): PriceAnalysisExpert가 생성한 요약 리포트
+
+        Returns:
+            str: 모델 응답
+        """
+        # 리포트는 format_step_message로 만든 스텝 입력이므로 그대로 전달 (고정 지시는 시스템 메시지에)
+        reason = analysis_report.strip()
 
         response = await self.on_messages(
             [TextMessage(content=reason, source="PriceAnalysisExpert")],
             CancellationToken(),
         )
+        return remove_think_block(response.chat_message.content)
 
-        content = remove_think_block(response.chat_message.content)
+    async def generate_signal_stream(
+        self, analysis_report: str
+    ) -> Tuple[int, "asyncio.Task[Tuple[str, float]]", float]:
+        """
+        응답을 스트리밍으로 받으며, 신호 줄(-1/0/1)이 완성되는 즉시 신호를 확정합니다.
+        근거(reasons)는 백그라운드 태스크에서 계속 수신되며, 완료 후 기록에 첨부합니다.
 
-        signal, reasons = self.parse_signal_and_reasons(content)
+        TradingExpert를 stream=True로 생성해야 토큰 단위 청크를 받을 수 있습니다.
+        근거 태스크가 끝나기 전에는 on_reset을 호출하면 안 됩니다.
 
-        if signal == 1:
-            reason = f"""
-# Signal: 
-    - Buy
-# Reason: 
-    {reasons}
-"""
-        elif signal == 0:
-            reason = f"""
-# Signal: 
-    - Hold
-# Reason: 
-    {reasons}
-"""
-        elif signal == -1:
-            reason = f"""
-# Signal: 
-    - Sell
-# Reason: 
-    {reasons}
-"""
-        else:
-            raise ValueError(f"{content}에서 신호를 찾을 수 없습니다.")
+        Args:
+            analysis_report (str): PriceAnalysisExpert가 생성한 요약 리포트
 
-        end_time = time.time()
-        elapsed_day, elapsed_hour, elapsed_minute, elapsed_second = (
-            calculate_elapsed_time(start_time, end_time)
-        )
-        print("-------------------- 투자 전문가 (TradingExpert) --------------------")
-        print(f"\n{reason}\n")
-        print(
-            f"응답 소요 시간: {elapsed_day}일 {elapsed_hour}시간 {elapsed_minute}분 {elapsed_second}초"
+        Returns:
+            int: 조기 확정된 매매 신호
+            asyncio.Task: (근거, 전체 응답 소요 시간)을 반환하는 태스크
+            float: 신호 확정까지 걸린 시간
+        """
+        start_time = time.time()
+
+        reason = analysis_report.strip()
+
+        loop = asyncio.get_running_loop()
+        signal_future: asyncio.Future = loop.create_future()
+
+        async def _consume() -> Tuple[str, float]:
+            buffer = ""
+            final_content = None
+            try:
+                async for event in self.on_messages_stream(
+                    [TextMessage(content=reason, source="PriceAnalysisExpert")],
+                    CancellationToken(),
+                ):
+                    if isinstance(event, ModelClientStreamingChunkEvent):
+                        buffer += event.content
+                        if not signal_future.done():
+                            early_signal = extract_early_signal(buffer)
+                            if early_signal is not None:
+                                signal_future.set_result((early_signal, time.time()))
+                    elif isinstance(event, Response):
+                        final_content = event.chat_message.content
+
+                content = remove_think_block(
+                    final_content if final_content is not None else buffer
+                )
+                signal, reasons = self.parse_signal_and_reasons(content)
+                if signal is None:
+                    raise ValueError(f"{content}에서 신호를 찾을 수 없습니다.")
+                if not signal_future.done():
+                    # 마지막 줄이 개행 없이 끝난 경우 등은 전체 응답으로 확정
+                    signal_future.set_result((signal, time.time()))
+            except BaseException as e:
+                if not signal_future.done():
+                    signal_future.set_exception(e)
+                raise
+
+            end_time = time.time()
+            self.log_signal(signal, reasons, start_time, end_time)
+            return reasons, (end_time - start_time)
+
+        reasons_task = asyncio.create_task(_consume())
+        signal, signal_time = await signal_future
+        return signal, reasons_task, (signal_time - start_time)
+
+    def log_signal(self, signal: int, reasons: str, start_time: float, end_time: float):
+        """매매 신호와 근거, 응답 소요 시간을 이벤트로 기록합니다."""
+        log_event(
+            EventType.SIGNAL,
+            agent=self.name,
+            signal=signal,
+            reasons=reasons,
+            elapsed=end_time - start_time,
         )
-        print("---------------------------------------------------------------------")
-        return signal, reasons, (end_time - start_time)
 
     def parse_signal_and_reasons(self, content: str):
         """content에서 신호와 이유를 추출합니다.
@@ -100,8 +178,7 @@ class TradingExpert(AssistantAgent):
             _type_: 신호(int), 이유(str)
         """
         # 1) 신호 추출
-        signal_pattern = re.compile(r"^\s*(-1|0|1)\s*$", re.MULTILINE)
-        signal_match = signal_pattern.search(content)
+        signal_match = SIGNAL_LINE_PATTERN.search(content)
         if signal_match:
             signal = int(signal_match.group(1))
         else:
@@ -0,0 +1,183 @@
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
+
+from autogen_core import CancellationToken
+
+from v1.core.constants import DEFAULT_VOTE_SAMPLES
+from v1.core.trading_expert import TradingExpert
+from v1.utils.event_log import EventType, log_event
+from v1.utils.model_utils import LLMDeadlineExceeded
+
+SIGNALS = (1, 0, -1)
+
+
+class VoteStats:
+    """
+    투표 모드의 스텝별 완료/취소 샘플 수, 조기 종료 비율, 만장일치 비율을 집계합니다.
+    """
+
+    def __init__(self):
+        self.steps = 0
+        self.early_stops = 0
+        self.unanimous = 0
+        self.completed_samples = 0
+        self.cancelled_samples = 0
+        self.failed_samples = 0
+        self.latency: List[float] = []
+
+    def record(self, votes: Dict, elapsed: float):
+        self.steps += 1
+        self.early_stops += votes["early_stop"]
+        self.completed_samples += votes["completed"]
+        self.cancelled_samples += votes["cancelled"]
+        self.failed_samples += votes["failed"]
+        if max(votes[str(signal)] for signal in SIGNALS) == votes["completed"]:
+            self.unanimous += 1
+        self.latency.append(elapsed)
+
+    def summary(self) -> Dict:
+        steps = self.steps
+        return {
+            "steps": steps,
+            "early_stop_rate": (self.early_stops / steps * 100 if steps else 0.0),
+            "unanimous_rate": (self.unanimous / steps * 100 if steps else 0.0),
+            "avg_completed_samples": (self.completed_samples / steps if steps else 0.0),
+            "cancelled_samples": self.cancelled_samples,
+            "failed_samples": self.failed_samples,
+            "avg_latency": (
+                sum(self.latency) / len(self.latency) if self.latency else 0.0
+            ),
+        }
+
+
+class VotingTradingExpert:
+    """
+    같은 리포트로 매매 신호를 samples번 동시에 샘플링하여 다수결로 확정합니다.
+
+    남은 샘플이 모두 다른 신호에 투표해도 1위가 바뀌지 않으면 즉시 확정하고
+    진행 중인 요청은 취소하므로, 응답 시간은 단일 호출과 비슷하게 유지됩니다.
+    최종 동률이면 보유(0)로 확정합니다.
+
+    샘플마다 별도의 TradingExpert(대화 기록 분리)를 사용하며, 샘플끼리 같은 응답을
+    받지 않도록 풀의 응답 캐시는 거치지 않습니다. 실제 동시 요청 수는
+    모델 클라이언트 풀의 백엔드별 상한(OPENAI_MAX_INFLIGHT, OLLAMA_MAX_INFLIGHT)을 따릅니다.
+    TradingExpert.generate_signal과 동일한 값을 반환하므로 시스템에서 그대로 교체해 사용할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        samples: int = DEFAULT_VOTE_SAMPLES,
+        model_name: Optional[str] = None,
+    ) -> None:
+        if samples < 2:
+            raise ValueError("투표 모드에는 2개 이상의 샘플이 필요합니다.")
+
+        self.name = "VotingTradingExpert"
+        self.samples = samples
+        self.experts = [
+            TradingExpert(model_name=model_name, use_cache=False)
+            for _ in range(samples)
+        ]
+        self.stats = VoteStats()
+        # 마지막 스텝의 득표 분포 (기록의 trading_votes 컬럼)
+        self.last_votes: Optional[Dict] = None
+
+    async def generate_signal(self, analysis_report: str) -> Tuple[int, str, float]:
+        """
+        신호를 동시에 샘플링하고, 1위 신호가 뒤집힐 수 없게 되는 즉시 확정합니다.
+
+        Args:
+            analysis_report (str): PriceAnalysisExpert가 생성한 요약 리포트
+
+        Returns:
+            int: 매매신호 (1, 0, -1)
+            str: 확정된 신호에 처음 투표한 샘플의 매매 근거
+            float: 신호 확정까지 걸린 시간
+        """
+        start_time = time.time()
+
+        counts = {signal: 0 for signal in SIGNALS}
+        reasons_by_signal: Dict[int, str] = {}
+        completed, failed = 0, 0
+        errors: List[BaseException] = []
+
+        tasks = [
+            asyncio.create_task(self._sample(expert, analysis_report))
+            for expert in self.experts
+        ]
+        try:
+            for next_sample in asyncio.as_completed(tasks):
+                try:
+                    signal, reasons = await next_sample
+                except Exception as e:
+                    failed += 1
+                    errors.append(e)
+                    continue
+
+                completed += 1
+                counts[signal] += 1
+                reasons_by_signal.setdefault(signal, reasons)
+
+                # 남은 샘플이 모두 2위에 투표해도 1위가 유지되면 조기 확정
+                remaining = self.samples - completed - failed
+                first, second = sorted(counts.values(), reverse=True)[:2]
+                if first > second + remaining:
+                    break
+        finally:
+            # 확정 후 남은 요청 취소 (세마포어 반환까지 기다림)
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        if completed == 0:
+            # 모든 샘플이 마감 시한을 넘겼으면 시스템이 대체 신호로 넘어가도록 그대로 전달
+            if all(isinstance(e, LLMDeadlineExceeded) for e in errors):
+                raise errors[0]
+            raise ValueError(
+                f"{self.samples}개 샘플 모두에서 신호를 찾을 수 없습니다: {errors[0]!r}"
+            )
+
+        top = max(counts.values())
+        leaders = [signal for signal in SIGNALS if counts[signal] == top]
+        signal = leaders[0] if len(leaders) == 1 else 0
+        reasons = reasons_by_signal.get(
+            signal,
+            f"득표 동률 ({', '.join(str(s) for s in leaders)})로 보유(0) 유지",
+        )
+
+        end_time = time.time()
+        self.last_votes = {
+            **{str(s): counts[s] for s in SIGNALS},
+            "samples": self.samples,
+            "completed": completed,
+            "failed": failed,
+            "cancelled": len(pending),
+            "early_stop": len(pending) > 0,
+        }
+        self.stats.record(self.last_votes, end_time - start_time)
+        log_event(
+            EventType.SIGNAL,
+            agent=self.name,
+            signal=signal,
+            reasons=reasons,
+            elapsed=end_time - start_time,
+            votes=self.last_votes,
+        )
+        return signal, reasons, (end_time - start_time)
+
+    async def _sample(
+        self, expert: TradingExpert, analysis_report: str
+    ) -> Tuple[int, str]:
+        content = await expert.request(analysis_report)
+        signal, reasons = expert.parse_signal_and_reasons(content)
+        if signal is None:
+            raise ValueError(f"{content}에서 신호를 찾을 수 없습니다.")
+        return signal, reasons
+
+    async def on_reset(self, cancellation_token: CancellationToken) -> None:
+        # 취소된 샘플의 대화 기록도 함께 초기화
+        await asyncio.gather(
+            *(expert.on_reset(cancellation_token) for expert in self.experts)
+        )
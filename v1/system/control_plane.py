@@ -0,0 +1,367 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Deque, Dict, List, Optional, Set
+
+import uvicorn
+from dotenv import load_dotenv
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from v1.core.candle_store import CandleStore
+from v1.core.constants import (
+    DEFAULT_ATR_MOVE_THRESHOLD,
+    DEFAULT_CONTROL_PLANE_MAX_RUNS,
+    DEFAULT_DECISION_CONCURRENCY,
+    DEFAULT_FALLBACK_SIGNAL,
+    DEFAULT_TRIGGERS,
+)
+from v1.core.event_trigger import EventTrigger
+from v1.system.crypto_trading_system import CryptoTradingSystem
+from v1.system.report_store import shared_report_store
+from v1.utils.event_log import EventType, event_to_dict
+from v1.utils.model_utils import model_client_pool
+
+# 실행별로 보관하는 최근 이벤트 수 (SSE 구독 시 먼저 재생)
+EVENT_BUFFER_SIZE = 500
+
+
+class RunRequest(BaseModel):
+    system_name: str
+    initial_cash: float = 10_000_000
+    fee_rate: float = 0.08
+    coin: str = "KRW-BTC"
+    start_date: str
+    end_date: str
+    candle_unit: str = "1d"
+    limit: int = 0
+    stream_signal: bool = False
+    cascade: bool = False
+    analysis_mode: str = "sequential"
+    price_analysis_model: Optional[str] = None
+    trading_model: Optional[str] = None
+    # 2 이상이면 투표 모드 (매매 신호 동시 샘플링 후 다수결)
+    vote_samples: int = 1
+    # 지정하면 1분봉에서 파생한 단위별 요약을 분석에 추가 (예: ["15m", "1h"])
+    timeframes: Optional[List[str]] = None
+    # True면 (캔들, 보유 상태)별 결정을 모두 동시에 미리 계산한 뒤 경로를 따라감
+    precompute_decisions: bool = False
+    decision_concurrency: int = DEFAULT_DECISION_CONCURRENCY
+    # LLM 호출이 마감 시한을 넘긴 스텝에서 사용할 매매 신호
+    fallback_signal: int = DEFAULT_FALLBACK_SIGNAL
+    # None이 아니면 해당 트리거가 발동한 스텝에서만 에이전트 호출
+    event_triggers: Optional[List[str]] = None
+    atr_move_threshold: float = DEFAULT_ATR_MOVE_THRESHOLD
+    # 서버 콘솔 출력 상세도 (진행 상황은 SSE로 확인)
+    verbosity: int = 0
+
+
+class _RunEventHandler(logging.Handler):
+    """리스너 스레드에서 받은 이벤트를 이벤트 루프의 RunHandle로 넘깁니다."""
+
+    def __init__(self, handle: "RunHandle", loop: asyncio.AbstractEventLoop):
+        super().__init__(level=logging.DEBUG)
+        # logging.Handler.handle과 이름이 겹치지 않도록 run_handle로 보관
+        self.run_handle = handle
+        self.loop = loop
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            event = json.loads(
+                json.dumps(event_to_dict(record), ensure_ascii=False, default=str)
+            )
+            self.loop.call_soon_threadsafe(self.run_handle.publish, event)
+        except RuntimeError:
+            # 서버 종료로 루프가 닫힌 경우
+            pass
+        except Exception:
+            self.handleError(record)
+
+
+class RunHandle:
+    """실행 하나의 상태, 최근 이벤트, 구독자(SSE) 목록"""
+
+    def __init__(self, run_id: str, request: RunRequest, system: CryptoTradingSystem):
+        self.run_id = run_id
+        self.request = request
+        self.system = system
+        self.status = "pending"
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.task: Optional[asyncio.Task] = None
+
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=EVENT_BUFFER_SIZE)
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.steps = 0
+        self.last_trade: Optional[Dict[str, Any]] = None
+        self.metrics: Optional[Dict[str, Any]] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "failed", "cancelled")
+
+    def publish(self, event: Dict[str, Any]):
+        if event["event"] == EventType.STEP_END.value:
+            self.steps += 1
+        elif event["event"] == EventType.TRADE.value:
+            self.last_trade = event
+        elif event["event"] == EventType.METRICS.value:
+            self.metrics = event
+        self.events.append(event)
+        for subscriber in self.subscribers:
+            subscriber.put_nowait(event)
+
+    def finish(self, status: str, error: Optional[str] = None):
+        self.status = status
+        self.error = error
+        self.finished_at = time.time()
+        self.publish({"ts": self.finished_at, "event": "status", "status": status})
+        for subscriber in self.subscribers:
+            subscriber.put_nowait(None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """실행 상태와 실시간 지표 (마지막 매매 기준 평가 금액 포함)"""
+        total_steps = len(self.system.backtest_clock)
+        portfolio = {
+            "cash": self.system.portfolio_manager.current_cash,
+            "position": self.system.portfolio_manager.current_position,
+        }
+        if self.last_trade is not None and self.last_trade.get("open_price"):
+            portfolio["total_asset_value"] = (
+                portfolio["cash"]
+                + portfolio["position"] * self.last_trade["open_price"]
+            )
+            portfolio["return_pct"] = (
+                portfolio["total_asset_value"] / self.request.initial_cash - 1
+            ) * 100
+        return {
+            "run_id": self.run_id,
+            "system_name": self.request.system_name,
+            "status": self.status,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "steps": self.steps,
+            "total_steps": total_steps,
+            "portfolio": portfolio,
+            "last_trade": self.last_trade,
+            "metrics": self.metrics,
+            "skip_rate": (
+                self.system.event_trigger.skip_rate
+                if self.system.event_trigger is not None
+                else None
+            ),
+        }
+
+
+class RunManager:
+    """
+    한 프로세스 안에서 여러 CryptoTradingSystem 실행을 asyncio 태스크로 관리합니다.
+
+    모든 실행이 캔들 저장소, 모델 클라이언트 풀(응답 캐시 포함)을 공유하며,
+    동시에 진행되는 실행 수는 max_concurrent_runs로 제한합니다.
+    """
+
+    def __init__(self, max_concurrent_runs: int = DEFAULT_CONTROL_PLANE_MAX_RUNS):
+        self.max_concurrent_runs = max_concurrent_runs
+        self.candle_store = CandleStore()
+        # 멀티 타임프레임 실행은 1분봉 기반 저장소를 공유
+        self.minute_candle_store = CandleStore(resample_from_minutes=True)
+        self.runs: Dict[str, RunHandle] = {}
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def launch(self, request: RunRequest) -> RunHandle:
+        if any(
+            handle.request.system_name == request.system_name and not handle.finished
+            for handle in self.runs.values()
+        ):
+            raise ValueError(f"{request.system_name} 실행이 이미 진행 중입니다.")
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_runs)
+
+        params = request.model_dump(exclude={"event_triggers", "atr_move_threshold"})
+        event_trigger = None
+        if request.event_triggers is not None:
+            event_trigger = EventTrigger(
+                triggers=request.event_triggers or DEFAULT_TRIGGERS,
+                atr_move_threshold=request.atr_move_threshold,
+            )
+        system = CryptoTradingSystem(
+            **params,
+            event_trigger=event_trigger,
+            candle_store=(
+                self.minute_candle_store if request.timeframes else self.candle_store
+            ),
+        )
+
+        handle = RunHandle(uuid.uuid4().hex[:12], request, system)
+        system.event_logger.add_handler(
+            _RunEventHandler(handle, asyncio.get_running_loop())
+        )
+        handle.task = asyncio.create_task(self._run(handle))
+        self.runs[handle.run_id] = handle
+        return handle
+
+    async def _run(self, handle: RunHandle):
+        status, error = "completed", None
+        try:
+            async with self._semaphore:
+                handle.status = "running"
+                await handle.system.run()
+        except asyncio.CancelledError:
+            status = "cancelled"
+        except Exception as e:
+            status, error = "failed", str(e)
+        await self._cleanup(handle)
+        # 리스너가 넘긴 마지막 이벤트들이 먼저 전달되도록 한 번 양보한 뒤 종료 알림
+        await asyncio.sleep(0)
+        handle.finish(status, error)
+
+    async def _cleanup(self, handle: RunHandle):
+        try:
+            # 취소/실패 시 남은 기록을 정리하고 소비 태스크 종료
+            await handle.system.record_writer.close()
+        except BaseException as e:
+            print(f"[Warning] {handle.run_id} 기록 정리 실패: {e!r}")
+        handle.system.event_logger.stop()
+
+    def get(self, run_id: str) -> RunHandle:
+        if run_id not in self.runs:
+            raise KeyError(run_id)
+        return self.runs[run_id]
+
+    def cancel(self, run_id: str) -> RunHandle:
+        handle = self.get(run_id)
+        if handle.task is not None and not handle.task.done():
+            handle.task.cancel()
+        return handle
+
+    async def shutdown(self):
+        tasks = [h.task for h in self.runs.values() if h.task and not h.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await model_client_pool.close()
+
+
+def create_app(
+    max_concurrent_runs: int = DEFAULT_CONTROL_PLANE_MAX_RUNS, llm_cache: bool = True
+) -> FastAPI:
+    """
+    실행 시작/조회/취소와 진행 상황 스트리밍(SSE)을 제공하는 제어 서버를 생성합니다.
+
+    Args:
+        max_concurrent_runs (int): 동시에 진행할 최대 실행 수
+        llm_cache (bool): 실행 간 LLM 응답 캐시 공유 여부
+    """
+    load_dotenv()
+    if llm_cache:
+        model_client_pool.enable_cache()
+    manager = RunManager(max_concurrent_runs=max_concurrent_runs)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        yield
+        await manager.shutdown()
+
+    app = FastAPI(title="Crypto Trading Control Plane", lifespan=lifespan)
+    app.state.run_manager = manager
+
+    def _get_handle(run_id: str) -> RunHandle:
+        try:
+            return manager.get(run_id)
+        except KeyError:
+            raise HTTPException(status_code=404, detail=f"run {run_id} not found")
+
+    @app.post("/runs", status_code=201)
+    async def launch_run(request: RunRequest):
+        try:
+            handle = manager.launch(request)
+        except ValueError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        return handle.snapshot()
+
+    @app.get("/runs")
+    async def list_runs():
+        return [handle.snapshot() for handle in manager.runs.values()]
+
+    @app.get("/runs/{run_id}")
+    async def get_run(run_id: str):
+        return _get_handle(run_id).snapshot()
+
+    @app.delete("/runs/{run_id}")
+    async def cancel_run(run_id: str):
+        _get_handle(run_id)
+        return manager.cancel(run_id).snapshot()
+
+    @app.get("/runs/{run_id}/records")
+    async def get_records(
+        run_id: str,
+        offset: int = Query(0, ge=0),
+        limit: int = Query(100, ge=1, le=1000),
+    ):
+        handle = _get_handle(run_id)
+        total, rows = handle.system.record_manager.page(offset=offset, limit=limit)
+        return {"total": total, "offset": offset, "limit": limit, "records": rows}
+
+    @app.get("/runs/{run_id}/events")
+    async def stream_events(run_id: str):
+        """최근 이벤트를 먼저 보낸 뒤, 실행이 끝날 때까지 새 이벤트를 SSE로 전송합니다."""
+        handle = _get_handle(run_id)
+        subscriber: asyncio.Queue = asyncio.Queue()
+        backlog = list(handle.events)
+        if handle.finished:
+            subscriber.put_nowait(None)
+        else:
+            handle.subscribers.add(subscriber)
+
+        async def _stream():
+            try:
+                for event in backlog:
+                    yield f"event: {event['event']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+                while True:
+                    event = await subscriber.get()
+                    if event is None:
+                        break
+                    yield f"event: {event['event']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+            finally:
+                handle.subscribers.discard(subscriber)
+
+        return StreamingResponse(_stream(), media_type="text/event-stream")
+
+    @app.get("/reports/search")
+    async def search_reports(
+        q: str,
+        field: Optional[str] = None,
+        run: Optional[str] = None,
+        limit: int = Query(100, ge=1, le=1000),
+    ):
+        """모든 실행의 리포트/매매 근거를 FTS5 질의로 검색합니다."""
+        store = shared_report_store()
+        try:
+            results = await asyncio.to_thread(store.search, q, field, run, limit)
+        except sqlite3.OperationalError as e:
+            raise HTTPException(status_code=400, detail=f"잘못된 검색어: {e}")
+        return {"query": q, "results": results}
+
+    @app.get("/reports/{key}")
+    async def get_report(key: str):
+        text = await asyncio.to_thread(shared_report_store().get, key)
+        if text is None:
+            raise HTTPException(status_code=404, detail=f"report {key} not found")
+        return {"hash": key, "text": text}
+
+    return app
+
+
+if __name__ == "__main__":
+    # import만으로 풀 상태(.env, LLM 캐시)가 바뀌지 않도록 앱은 실행 시에만 생성
+    # (uvicorn v1.system.control_plane:create_app --factory 로도 실행 가능)
+    uvicorn.run(create_app(), host="127.0.0.1", port=8000)
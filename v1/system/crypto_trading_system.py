@@ -1,26 +1,50 @@
 import asyncio
+import json
+import os
 import time
 from datetime import datetime, timedelta
-from typing import Tuple
+from typing import Dict, Optional, Sequence, Tuple
 
 from autogen_core import CancellationToken
 from dotenv import load_dotenv
 
 from v1.core.constants import (
     TIME_DELTA_MAP,
+    DEFAULT_DECISION_CONCURRENCY,
+    DEFAULT_FALLBACK_SIGNAL,
     DEFAULT_UNIT,
+    DEFAULT_VERBOSITY,
 )
+from v1.core.backtest_clock import BacktestClock
+from v1.core.baseline_strategies import format_baseline_table, run_baselines
+from v1.core.candle_resampler import format_timeframe_summary
+from v1.core.candle_store import CandleStore
+from v1.core.cascade_trading_expert import CascadeTradingExpert
 from v1.core.data_analyzer import DataAnalyzer
 from v1.core.data_collector import DataCollector
+from v1.core.decision_table import FLAT, HOLDING, DecisionTable
+from v1.core.event_trigger import EventTrigger
 from v1.core.portfolio_manager import (
     PortfolioManager,
 )
 from v1.core.price_analysis_expert import (
     PriceAnalysisExpert,
 )
+from v1.core.prompts import format_portfolio, format_step_message
 from v1.core.trading_expert import TradingExpert
+from v1.core.voting_trading_expert import VotingTradingExpert
 from v1.system.record_manager import RecordManager
+from v1.system.record_writer import AsyncRecordWriter
+from v1.utils.event_log import (
+    EventLogger,
+    EventType,
+    bind_event_logger,
+    log_event,
+    unbind_event_logger,
+)
+from v1.utils.model_utils import LLMDeadlineExceeded, model_client_pool
 from v1.utils.time_utils import calculate_elapsed_time
+from v1.utils.timeline import unit_seconds
 
 
 class CryptoTradingSystem:
@@ -34,7 +58,40 @@ class CryptoTradingSystem:
         end_date: str,
         candle_unit: str,
         limit: int = 0,
+        stream_signal: bool = False,
+        event_trigger: Optional[EventTrigger] = None,
+        cascade: bool = False,
+        analysis_mode: str = "sequential",
+        price_analysis_model: Optional[str] = None,
+        trading_model: Optional[str] = None,
+        vote_samples: int = 1,
+        timeframes: Optional[Sequence[str]] = None,
+        precompute_decisions: bool = False,
+        decision_concurrency: int = DEFAULT_DECISION_CONCURRENCY,
+        fallback_signal: int = DEFAULT_FALLBACK_SIGNAL,
+        candle_store: Optional[CandleStore] = None,
+        verbosity: int = DEFAULT_VERBOSITY,
+        rich_console: bool = False,
     ):
+        if cascade and stream_signal:
+            raise ValueError(
+                "캐스케이드 모드는 스트리밍 신호와 함께 사용할 수 없습니다."
+            )
+        if vote_samples > 1 and (cascade or stream_signal):
+            raise ValueError(
+                "투표 모드는 캐스케이드 모드, 스트리밍 신호와 함께 사용할 수 없습니다."
+            )
+        if precompute_decisions and (
+            cascade or stream_signal or vote_samples > 1 or event_trigger is not None
+        ):
+            raise ValueError(
+                "결정 사전 계산 모드는 캐스케이드/투표 모드, 스트리밍 신호, 이벤트 트리거와 함께 사용할 수 없습니다."
+            )
+        if fallback_signal not in (1, 0, -1):
+            raise ValueError(
+                f"fallback_signal은 1, 0, -1 중 하나여야 합니다: {fallback_signal}"
+            )
+
         self.system_name = system_name
         self.initial_cash = initial_cash
         self.fee_rate = fee_rate
@@ -43,14 +100,72 @@ class CryptoTradingSystem:
         self.end_date = end_date
         self.candle_unit = candle_unit
         self.limit = limit
+        # True면 TradingExpert 응답을 스트리밍하여 신호 줄이 나오는 즉시 매매
+        self.stream_signal = stream_signal
+        # None이 아니면 트리거가 발동한 스텝에서만 에이전트 호출
+        self.event_trigger = event_trigger
+        # True면 소형 모델이 먼저 신호를 생성하고 필요 시 대형 모델로 승급
+        self.cascade = cascade
+        # 2 이상이면 매매 신호를 vote_samples번 동시에 샘플링하여 다수결로 확정
+        self.voting = vote_samples > 1
+        # True면 모든 (스텝, 보유 상태) 결정을 동시에 미리 계산한 뒤 표를 따라 매매
+        self.precompute_decisions = precompute_decisions
+        self.decision_concurrency = decision_concurrency
+        self.decision_table: Optional[DecisionTable] = None
+        # LLM 호출이 마감 시한(LLM_CALL_DEADLINE_SECONDS)을 넘기면 대신 사용할 매매 신호
+        self.fallback_signal = fallback_signal
+        self.deadline_fallbacks = 0
+        self.analysis_mode = analysis_mode
+        self.price_analysis_model = price_analysis_model
+        self.trading_model = trading_model
+        # 지정하면 스텝마다 1분봉에서 파생한 단위별 최근 캔들 요약을 분석 입력에 추가
+        self.timeframes = list(timeframes) if timeframes else []
+        if self.timeframes:
+            if candle_store is None:
+                candle_store = CandleStore(resample_from_minutes=True)
+            elif not candle_store.resample_from_minutes:
+                raise ValueError(
+                    "멀티 타임프레임 분석에는 resample_from_minutes=True인 캔들 저장소가 필요합니다."
+                )
+        self.candle_store = candle_store
 
-        self.data_collector = DataCollector(limit=limit)
-        self.price_analysis_expert = PriceAnalysisExpert(limit=limit)
-        self.trading_expert = TradingExpert()
+        self.data_collector = DataCollector(limit=limit, candle_store=candle_store)
+        self.backtest_clock = BacktestClock(
+            coin=coin,
+            start_date=start_date,
+            end_date=end_date,
+            candle_unit=candle_unit,
+            limit=limit,
+            data_collector=self.data_collector,
+        )
+        self.price_analysis_expert = PriceAnalysisExpert(
+            limit=limit, analysis_mode=analysis_mode, model_name=price_analysis_model
+        )
+        if cascade:
+            self.trading_expert = CascadeTradingExpert(large_model=trading_model)
+        elif self.voting:
+            self.trading_expert = VotingTradingExpert(
+                samples=vote_samples, model_name=trading_model
+            )
+        else:
+            self.trading_expert = TradingExpert(
+                stream=stream_signal, model_name=trading_model
+            )
         self.portfolio_manager = PortfolioManager(
             initial_cash=initial_cash, fee_rate=fee_rate
         )
         self.record_manager = RecordManager(system_name=system_name)
+        # 기록(CSV 저장)은 백그라운드에서 처리하여 LLM 호출과 겹치도록 함
+        self.record_writer = AsyncRecordWriter(self.record_manager)
+        # 스텝별 진행 상황은 구조화 이벤트(JSONL)로 기록하고 콘솔에는 상세도에 맞게 출력
+        self.event_logger = EventLogger(
+            name=system_name,
+            path=os.path.join(
+                self.record_manager.folder_path, f"{system_name}_events.jsonl"
+            ),
+            verbosity=verbosity,
+            rich_console=rich_console,
+        )
 
         # 설정한 투자 기간 동안 동적으로 바뀔 변수들
         self.tmp_start_date = start_date
@@ -76,6 +191,18 @@ class CryptoTradingSystem:
         print("초기 현금:", self.portfolio_manager.current_cash)
         print("---------------------------------------------------------------------")
         start_time = time.time()
+        event_token = bind_event_logger(self.event_logger)
+        log_event(
+            EventType.RUN_START,
+            coin=self.coin,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            candle_unit=self.candle_unit,
+            initial_cash=self.initial_cash,
+        )
+
+        # 에이전트가 사용하는 모델을 미리 로드하여 첫 캔들의 콜드 스타트 방지
+        await model_client_pool.warm_up()
 
         # # 1) 첫 수행 시, 지정된 기간의 일부(예: 5%)만 우선 수집
         # self.tmp_end_date = await self._calculate_partial_end_date(
@@ -85,90 +212,147 @@ class CryptoTradingSystem:
         #     candle_unit=self.candle_unit,
         # )
 
-        await self.collect_dummy_data()
-
-        self.tmp_end_date = self.start_date
-
-        while True:
-            if self.tmp_end_date >= self.end_date:
-                break
-
-            data = await self.data_collector.collect_price_data(
-                coin=self.coin,
-                start_date=self.start_date,
-                end_date=self.tmp_end_date,
-                candle_unit=self.candle_unit,
+        # 워밍업을 포함한 전체 구간을 한 번만 수집하고, 이후에는 인덱스로만 진행
+        await self.backtest_clock.load()
+        if len(self.backtest_clock) == 0:
+            raise ValueError(
+                f"{self.start_date} ~ {self.end_date} 구간에 백테스트할 캔들이 없습니다."
             )
 
-            current_info = {
-                "current_cash": self.portfolio_manager.current_cash,
-                "current_position": self.portfolio_manager.current_position,
-            }
+        if self.precompute_decisions:
+            self.decision_table = await self.precompute_decision_table()
 
-            # 2) 수집된 데이터 기반 가격 분석 리포트 생성
-            analysis_report, analysis_time = (
-                await self.price_analysis_expert.analyze_trend(
-                    price_data=data, current_info=current_info
-                )
-            )
-            await self.price_analysis_expert.on_reset(CancellationToken())
+        self.record_writer.start()
+        # 이전 스텝의 스트리밍 근거 수신 (다음 매매 신호 생성 전에만 기다림)
+        pending_stream: Optional[asyncio.Task] = None
 
-            analysis_report = await self.generate_report(
-                analysis_report=analysis_report
-            )
+        for step in self.backtest_clock:
+            step_start_time = time.time()
+            data = self.backtest_clock.window(step)
+            current_candle = self.backtest_clock.candle(step)
+            log_event(EventType.STEP_START, step=step, date=current_candle["date"])
 
-            # 3) 분석 리포트 기반 매매 신호를 생성
-            signal, signal_reason, trade_time = (
-                await self.trading_expert.generate_signal(
-                    analysis_report=analysis_report
-                )
+            current_info = self._step_info(
+                current_candle,
+                self.portfolio_manager.current_cash,
+                self.portfolio_manager.current_position,
             )
-            await self.trading_expert.on_reset(CancellationToken())
 
-            # 4) 다음 틱 데이터 수집
-            self.tmp_start_date, self.tmp_end_date = await self.set_dates(
-                self.tmp_end_date, self.candle_unit
-            )
-            price_data = await self.data_collector.collect_price_data(
-                self.coin, self.tmp_start_date, self.tmp_end_date, self.candle_unit
-            )
+            # 이벤트 트리거가 발동하지 않으면 LLM 호출 없이 HOLD 유지
+            gated = False
+            if self.event_trigger is not None:
+                should_evaluate, _ = self.event_trigger.should_evaluate(
+                    price_data=data,
+                    holding=current_info["current_position"] > 0,
+                )
+                gated = not should_evaluate
+
+            # 이번 스텝의 신호를 매매 전문가가 직접 생성했는지 (티어/득표 기록용)
+            expert_signal = False
+            step_stream = None
+            if self.decision_table is not None:
+                # 미리 계산한 표에서 현재 보유 상태의 결정을 조회 (LLM 호출 없음)
+                analysis_report, signal, signal_reason, analysis_time, trade_time = (
+                    self.decision_table.lookup(
+                        step - self.backtest_clock.start_index,
+                        HOLDING if current_info["current_position"] > 0 else FLAT,
+                    )
+                )
+            elif gated:
+                analysis_report = None
+                signal = 0
+                signal_reason = "주요 지표 및 포트폴리오 상태 변화 없음 (HOLD 유지)"
+                analysis_time, trade_time = 0.0, 0.0
+            else:
+                try:
+                    # 2) 수집된 데이터 기반 가격 분석 리포트 생성
+                    analysis_report, analysis_time = (
+                        await self.price_analysis_expert.analyze_trend(
+                            price_data=data, current_info=current_info
+                        )
+                    )
+                    await self.price_analysis_expert.on_reset(CancellationToken())
+
+                    analysis_report = await self.generate_report(
+                        analysis_report=analysis_report, current_info=current_info
+                    )
+
+                    # 3) 분석 리포트 기반 매매 신호를 생성
+                    if pending_stream is not None:
+                        # 에이전트 초기화가 끝나야 다음 신호를 요청할 수 있음
+                        await pending_stream
+                        pending_stream = None
+
+                    if self.stream_signal:
+                        # 신호만 먼저 확정하고, 근거는 백그라운드에서 계속 수신
+                        signal, reasons_task, _ = (
+                            await self.trading_expert.generate_signal_stream(
+                                analysis_report=analysis_report
+                            )
+                        )
+                        step_stream = pending_stream = asyncio.create_task(
+                            self._finish_stream(reasons_task)
+                        )
+                        signal_reason, trade_time = None, None
+                    elif self.cascade:
+                        # 지표 합의와 비교할 수 있도록 가격 데이터도 함께 전달
+                        signal, signal_reason, trade_time = (
+                            await self.trading_expert.generate_signal(
+                                analysis_report=analysis_report, price_data=data
+                            )
+                        )
+                        await self.trading_expert.on_reset(CancellationToken())
+                    else:
+                        signal, signal_reason, trade_time = (
+                            await self.trading_expert.generate_signal(
+                                analysis_report=analysis_report
+                            )
+                        )
+                        await self.trading_expert.on_reset(CancellationToken())
+                    expert_signal = True
+                except LLMDeadlineExceeded:
+                    # 마감 시한을 넘긴 스텝은 대체 신호로 진행 (루프가 멈추지 않음)
+                    analysis_report = None
+                    signal, signal_reason = await self._deadline_fallback(
+                        current_candle["date"]
+                    )
+                    analysis_time, trade_time = None, None
+
+            # 4) 다음 캔들 (이미 불러온 데이터에서 인덱스로 조회)
+            next_candle = self.backtest_clock.next_candle(step)
+            self.tmp_start_date = current_candle["date"]
+            self.tmp_end_date = next_candle["date"]
 
             current_cash = self.portfolio_manager.current_cash
             current_position = self.portfolio_manager.current_position
 
             # 5) 매매 실행
-            if price_data:
-                latest_open = price_data[-1]["open"]
-                self.portfolio_manager.record_trade(
-                    date=price_data[-1]["date"],
-                    action=signal,
-                    open_price=latest_open,
-                )
-
-            print(
-                f"-------------- {self.tmp_end_date} 기준 포트폴리오 현황 -------------\n"
-            )
-            if signal == 1:
-                print("Position: Buy")
-            elif signal == 0:
-                print("Position: Hold")
-            else:
-                print("Position: Sell")
-            print(
-                f"\nCash: {self.portfolio_manager.current_cash}, Amount of Coins: {self.portfolio_manager.current_position}"
+            self.portfolio_manager.record_trade(
+                date=next_candle["date"],
+                action=signal,
+                open_price=self.backtest_clock.next_open(step),
             )
-            print(
-                "---------------------------------------------------------------------"
+
+            log_event(
+                EventType.TRADE,
+                date=self.tmp_end_date,
+                signal=signal,
+                open_price=self.backtest_clock.next_open(step),
+                cash=self.portfolio_manager.current_cash,
+                position=self.portfolio_manager.current_position,
+                gated=gated,
             )
 
-            self.record_manager.record_step(
+            # 6) 기록은 큐에 넣고 바로 다음 스텝으로 진행
+            #    (스트리밍 근거는 기록 태스크가 수신 완료 후 채워 넣음)
+            await self.record_writer.submit(
                 {
-                    "datetime": price_data[-2]["date"],
-                    "open": price_data[-2]["open"],
-                    "high": price_data[-2]["high"],
-                    "low": price_data[-2]["low"],
-                    "close": price_data[-2]["close"],
-                    "volume": price_data[-2]["volume"],
+                    "timestamp": current_candle["timestamp"],
+                    "open": current_candle["open"],
+                    "high": current_candle["high"],
+                    "low": current_candle["low"],
+                    "close": current_candle["close"],
+                    "volume": current_candle["volume"],
                     "next_action": signal,
                     "current_cash": current_cash,
                     "current_position": current_position,
@@ -176,19 +360,40 @@ class CryptoTradingSystem:
                     "trading_reason": signal_reason,
                     "response_time_analysis": analysis_time,
                     "response_time_trade": trade_time,
-                }
+                    "gated": gated,
+                    "trade_model_tier": (
+                        self.trading_expert.last_tier
+                        if self.cascade and expert_signal
+                        else None
+                    ),
+                    "trading_votes": (
+                        json.dumps(self.trading_expert.last_votes)
+                        if self.voting and expert_signal
+                        else None
+                    ),
+                },
+                pending=step_stream,
             )
+            log_event(
+                EventType.STEP_END,
+                step=step,
+                date=current_candle["date"],
+                elapsed=time.time() - step_start_time,
+            )
+
+        if pending_stream is not None:
+            await pending_stream
+        await self.record_writer.close()
 
         if self.portfolio_manager.current_position > 0:
             # 전체 코인을 팔아서 현금화
             self.portfolio_manager.record_trade(
                 date=self.tmp_end_date,
                 action=-1,
-                open_price=price_data[-1]["close"],
+                open_price=next_candle["close"],
             )
 
-        data_path = f"data/{self.system_name}.csv"
-        performance_metrics = DataAnalyzer(data_path).performance_metrics()
+        performance_metrics = self.analyzer().performance_metrics()
 
         print("***멀티 에이전트 시스템 전략 성과 지표***")
         print(f"최종 수익률: {performance_metrics['return_pct']:.2f}%")
@@ -197,7 +402,78 @@ class CryptoTradingSystem:
             f"승률: {performance_metrics['win_rate']}% ({performance_metrics['total_trades']})"
         )
         print(f"샤프 지수: {performance_metrics['sharpe_index']:.2f}\n")
-        await self.backtest_buy_and_hold()
+        log_event(EventType.METRICS, **performance_metrics)
+        self.backtest_baselines(performance_metrics)
+        if self.event_trigger is not None:
+            print(
+                f"LLM 호출 생략 비율: {self.event_trigger.skip_rate:.2f}% "
+                f"({self.event_trigger.skipped_steps}/"
+                f"{self.event_trigger.skipped_steps + self.event_trigger.evaluated_steps})\n"
+            )
+        if self.cascade:
+            cascade_summary = self.trading_expert.stats.summary()
+            print("***캐스케이드 티어별 통계***")
+            print(
+                f"호출 수: 소형 {cascade_summary['small_calls']}회 / 대형 {cascade_summary['large_calls']}회 "
+                f"(승급 비율 {cascade_summary['escalation_rate']:.2f}%)"
+            )
+            print(f"승급 사유: {cascade_summary['escalations']}")
+            print(
+                f"평균 응답 시간: 소형 {cascade_summary['avg_latency_small']:.2f}초 / "
+                f"대형 {cascade_summary['avg_latency_large']:.2f}초"
+            )
+            print(
+                f"티어 간 일치율: {cascade_summary['tier_agreement_rate']:.2f}%, "
+                f"대형 모델-지표 합의 일치율: {cascade_summary['consensus_agreement_rate']:.2f}%\n"
+            )
+
+        if self.voting:
+            vote_summary = self.trading_expert.stats.summary()
+            print("***투표 모드 통계***")
+            print(
+                f"조기 확정 비율: {vote_summary['early_stop_rate']:.2f}%, "
+                f"만장일치 비율: {vote_summary['unanimous_rate']:.2f}%"
+            )
+            print(
+                f"스텝당 완료 샘플 수: {vote_summary['avg_completed_samples']:.2f}/"
+                f"{self.trading_expert.samples} "
+                f"(취소 {vote_summary['cancelled_samples']}, 실패 {vote_summary['failed_samples']})"
+            )
+            print(f"평균 신호 확정 시간: {vote_summary['avg_latency']:.2f}초\n")
+
+        latency = model_client_pool.latency_summary()
+        if latency:
+            print("***LLM 응답 시간 통계***")
+            for model_name, summary in latency.items():
+                print(
+                    f"{model_name}: 호출 {summary['calls']}회, p50 {summary['p50']:.2f}초 / "
+                    f"p95 {summary['p95']:.2f}초, 헤징 {summary['hedges']}회 "
+                    f"(헤지 승리 {summary['hedge_wins']}회), 마감 시한 초과 {summary['timeouts']}회"
+                )
+            if self.deadline_fallbacks:
+                print(
+                    f"대체 신호({self.fallback_signal})로 진행한 스텝: {self.deadline_fallbacks}개"
+                )
+            print()
+
+        prompt_cache = model_client_pool.prompt_cache_summary()
+        if prompt_cache:
+            print("***프롬프트 캐시 통계***")
+            for model_name, summary in prompt_cache.items():
+                details = [
+                    f"호출 {summary['calls']}회, 프롬프트 {summary['prompt_tokens']}토큰",
+                    f"앞부분 변경 {summary['prefix_switches']}회",
+                ]
+                if summary["cache_hit_rate"] is not None:
+                    details.append(f"캐시 적중률 {summary['cache_hit_rate']:.2f}%")
+                if summary["avg_prefill_tokens"] is not None:
+                    details.append(
+                        f"평균 프리필 {summary['avg_prefill_tokens']:.0f}토큰"
+                    )
+                if summary["avg_ttft"] is not None:
+                    details.append(f"평균 첫 토큰 {summary['avg_ttft']:.2f}초")
+                print(f"{model_name}: " + ", ".join(details))
+            print()
 
         end_time = time.time()
         elapsed_day, elapsed_hour, elapsed_minute, elapsed_second = (
@@ -209,12 +485,12 @@ class CryptoTradingSystem:
 
         self.record_manager.record_step(
             {
-                "datetime": price_data[-1]["date"],
-                "open": price_data[-1]["open"],
-                "high": price_data[-1]["high"],
-                "low": price_data[-1]["low"],
-                "close": price_data[-1]["close"],
-                "volume": price_data[-1]["volume"],
+                "timestamp": next_candle["timestamp"],
+                "open": next_candle["open"],
+                "high": next_candle["high"],
+                "low": next_candle["low"],
+                "close": next_candle["close"],
+                "volume": next_candle["volume"],
                 "next_action": None,
                 "current_cash": self.portfolio_manager.current_cash,
                 "current_position": self.portfolio_manager.current_position,
@@ -222,51 +498,222 @@ class CryptoTradingSystem:
                 "trading_reason": None,
                 "response_time_analysis": None,
                 "response_time_trade": None,
+                "gated": None,
+                "trade_model_tier": None,
+                "trading_votes": None,
             }
         )
 
+        log_event(EventType.RUN_END, elapsed=end_time - start_time)
+        unbind_event_logger(event_token)
+        self.event_logger.stop()
+
         print(
             f"######################## 투자 시스템 종료 ############################\n"
         )
 
-    async def collect_dummy_data(self):
+    async def _finish_stream(self, reasons_task: asyncio.Task) -> dict:
         """
-        백테스팅 전 limit 기간만큼의 더미 데이터를 미리 수집합니다(기술 지표 분석을 위해).
-        limit이 없다면 약 40개 데이터 수집(macd 계산을 위해)
+        스트리밍 근거 수신을 마치고 TradingExpert를 초기화합니다.
+
+        Returns:
+            dict: 기록 행에 합칠 trading_reason, response_time_trade
         """
-        fmt = "%Y-%m-%d %H:%M:%S"
-        start_dt = datetime.strptime(self.start_date, fmt)
-        limit = self.limit if self.limit > 0 else 40
-        adjusted_start_dt_1 = start_dt - timedelta(days=limit - 1)
-        adjusted_start_dt_2 = (start_dt - timedelta(days=1)).strftime(fmt)
-        tmp_start_date = adjusted_start_dt_1.strftime(fmt)
+        try:
+            signal_reason, trade_time = await reasons_task
+        except LLMDeadlineExceeded:
+            # 신호는 이미 확정되었으므로 근거만 비워 둠
+            signal_reason, trade_time = "LLM 마감 시한 초과 (근거 수신 중단)", None
+        await self.trading_expert.on_reset(CancellationToken())
+        return {"trading_reason": signal_reason, "response_time_trade": trade_time}
+
+    async def _deadline_fallback(self, date: str) -> Tuple[int, str]:
+        """
+        LLM 호출이 마감 시한을 넘긴 스텝의 대체 결정을 반환하고 에이전트를 초기화합니다.
 
-        _ = await self.data_collector.collect_price_data(
-            coin=self.coin,
-            start_date=tmp_start_date,
-            end_date=adjusted_start_dt_2,
-            candle_unit=self.candle_unit,
+        Args:
+            date (str): 스텝 캔들 시각
+
+        Returns:
+            int: 대체 매매 신호 (fallback_signal)
+            str: 매매 근거
+        """
+        self.deadline_fallbacks += 1
+        await self.price_analysis_expert.on_reset(CancellationToken())
+        await self.trading_expert.on_reset(CancellationToken())
+        log_event(
+            EventType.DEADLINE_EXCEEDED,
+            date=date,
+            stage="llm",
+            signal=self.fallback_signal,
+        )
+        return (
+            self.fallback_signal,
+            f"LLM 마감 시한 초과 (대체 신호 {self.fallback_signal})",
+        )
+
+    def analyzer(self) -> DataAnalyzer:
+        """
+        기록 CSV를 다시 읽지 않고 원장과 캔들 배열로 스텝별 성과 분석기를 만듭니다.
+        (마지막 청산 전 상태 기준, 기록 CSV의 스텝 행과 동일)
+        """
+        clock = self.backtest_clock
+        step_range = slice(clock.start_index, clock.end_index + 1)
+        return DataAnalyzer.from_ledger(
+            self.portfolio_manager.ledger,
+            {
+                "timestamp": clock.timestamps[step_range],
+                **{
+                    field: column[step_range] for field, column in clock.columns.items()
+                },
+            },
+        )
+
+    def warmup_start_date(self) -> str:
+        """
+        기술 지표 계산용 워밍업 캔들을 포함한 수집 시작일을 반환합니다.
+
+        Returns:
+            str: 워밍업 수집 시작일 (예: "2020-08-23 09:00:00")
+        """
+        return self.backtest_clock.warmup_start_date()
+
+    def _step_info(self, candle: Dict, cash: float, position: float) -> Dict:
+        """스텝의 에이전트 입력용 포트폴리오 상태 (+ 멀티 타임프레임 요약)"""
+        current_info = {"current_cash": cash, "current_position": position}
+        if self.timeframes:
+            # 현재 캔들 마감 시각 이전의 1분봉만 사용 (네트워크 요청 없음)
+            current_info["timeframes"] = format_timeframe_summary(
+                self.candle_store.timeframe_views(
+                    self.coin,
+                    candle["timestamp"] + unit_seconds(self.candle_unit),
+                    self.timeframes,
+                )
+            )
+        return current_info
+
+    async def precompute_decision_table(self) -> DecisionTable:
+        """
+        모든 (스텝, 보유 상태) 쌍의 분석 리포트와 매매 결정을 동시에 계산합니다.
+
+        전액 매수/전량 매도이므로 에이전트에게는 상태별 대표 포트폴리오를 보여 줍니다.
+            - 현금 보유: 현금 = 초기 현금, 코인 = 0
+            - 코인 보유: 현금 = 0, 코인 = 초기 현금으로 해당 캔들 종가에 산 수량(수수료 차감)
+        에이전트는 대화 기록을 가지므로 작업자마다 별도의 PriceAnalysisExpert/TradingExpert를
+        두고, 실제 동시 요청 수는 decision_concurrency와 모델 클라이언트 풀 상한을 따릅니다.
+        표는 "{system_name}_decisions.npz"로도 저장되어 수수료 변경 등에 재사용할 수 있습니다.
+
+        Returns:
+            DecisionTable: 2 x 스텝 수 결정이 채워진 표
+        """
+        clock = self.backtest_clock
+        table = DecisionTable(clock.timestamps[clock.start_index : clock.end_index])
+        jobs = iter(
+            [(index, state) for index in range(len(table)) for state in (FLAT, HOLDING)]
         )
+        fee_rate = self.portfolio_manager.fee_rate
+        start_time = time.time()
+
+        async def _worker(
+            price_analysis_expert: PriceAnalysisExpert, trading_expert: TradingExpert
+        ):
+            # 이벤트 루프는 단일 스레드이므로 공유 이터레이터에서 작업을 나눠 가짐
+            for index, state in jobs:
+                step = clock.start_index + index
+                candle = clock.candle(step)
+                if state == FLAT:
+                    current_info = self._step_info(candle, self.initial_cash, 0.0)
+                else:
+                    position = self.initial_cash * (1 - fee_rate) / candle["close"]
+                    current_info = self._step_info(candle, 0.0, position)
+
+                try:
+                    report, analysis_time = await price_analysis_expert.analyze_trend(
+                        price_data=clock.window(step), current_info=current_info
+                    )
+                    await price_analysis_expert.on_reset(CancellationToken())
+                    report = await self.generate_report(
+                        report, current_info=current_info
+                    )
+                    signal, reason, trade_time = await trading_expert.generate_signal(
+                        analysis_report=report
+                    )
+                except LLMDeadlineExceeded:
+                    report, analysis_time, trade_time = None, 0.0, 0.0
+                    signal, reason = self.fallback_signal, (
+                        f"LLM 마감 시한 초과 (대체 신호 {self.fallback_signal})"
+                    )
+                    self.deadline_fallbacks += 1
+                    log_event(
+                        EventType.DEADLINE_EXCEEDED,
+                        date=candle["date"],
+                        stage="llm",
+                        signal=self.fallback_signal,
+                    )
+                    await price_analysis_expert.on_reset(CancellationToken())
+                await trading_expert.on_reset(CancellationToken())
+                table.set(
+                    index, state, signal, report, reason, analysis_time, trade_time
+                )
 
-    async def generate_report(self, analysis_report: str) -> str:
+        workers = [(self.price_analysis_expert, self.trading_expert)] + [
+            (
+                PriceAnalysisExpert(
+                    limit=self.limit,
+                    analysis_mode=self.analysis_mode,
+                    model_name=self.price_analysis_model,
+                ),
+                TradingExpert(model_name=self.trading_model),
+            )
+            for _ in range(min(self.decision_concurrency, 2 * len(table)) - 1)
+        ]
+        tasks = [asyncio.create_task(_worker(*worker)) for worker in workers]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # 하나라도 실패하면 나머지 작업자도 중단
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        table.save(
+            os.path.join(
+                self.record_manager.folder_path, f"{self.system_name}_decisions.npz"
+            )
+        )
+        print(
+            f"[Decisions] {int(table.filled.sum())}개 결정 사전 계산 완료 "
+            f"({time.time() - start_time:.2f}초, 작업자 {len(workers)}개)"
+        )
+        return table
+
+    async def generate_report(
+        self, analysis_report: str, current_info: Optional[Dict] = None
+    ) -> str:
         """
         포트폴리오 및 가격 분석 리포트에 기반한 최종 리포트를 생성합니다.
 
         Args:
             analysis_report (str): 가격 분석 리포트
+            current_info (Optional[Dict]): 포트폴리오 상태, None이면 현재 포트폴리오
 
         Returns:
             str: 생성된 리포트
         """
-        report = f"""
-# Current Portfolio:
-- Cash: {self.portfolio_manager.current_cash}
-- Amount of Coins: {self.portfolio_manager.current_position}
-
-# Price Analysis Report:
-{analysis_report}
-        """
-        return report
+        if current_info is None:
+            current_info = {
+                "current_cash": self.portfolio_manager.current_cash,
+                "current_position": self.portfolio_manager.current_position,
+            }
+        return format_step_message(
+            (
+                "Current Portfolio",
+                format_portfolio(
+                    current_info["current_cash"], current_info["current_position"]
+                ),
+            ),
+            ("Price Analysis Report", analysis_report),
+        )
 
     async def _calculate_partial_end_date(
         self,
@@ -311,32 +758,39 @@ class CryptoTradingSystem:
         partial_end_dt = start_dt + candle_interval * partial_candles
         return partial_end_dt.strftime(fmt)
 
-    async def set_dates(self, end_date: str, candle_unit: str) -> Tuple[str, str]:
+    def backtest_baselines(self, system_metrics: Optional[Dict] = None):
         """
-        시작일과 종료일을 설정합니다.
+        같은 캔들/수수료로 기준 전략들(buy-and-hold, SMA, RSI, MACD, 볼린저)을 벡터 연산으로
+        백테스트하여 시스템 성과와 함께 비교표를 출력하고 "{system_name}_baselines.csv"로 저장합니다.
 
         Args:
-            end_date (str): 종료 날짜
-            candle_unit(str): 캔들 단위
+            system_metrics (Optional[Dict]): 시스템의 performance_metrics 결과
 
         Returns:
-            Tuple[str, str]: 시작일, 종료일
+            pd.DataFrame: 수익률 순 비교표
         """
-        fmt = "%Y-%m-%d %H:%M:%S"
-
-        start_dt = datetime.strptime(end_date, fmt)
-        end_dt = datetime.strptime(end_date, fmt)
-
-        delta_args = TIME_DELTA_MAP.get(candle_unit, TIME_DELTA_MAP[DEFAULT_UNIT])
-        new_end_dt = end_dt + timedelta(**delta_args)
-        return start_dt.strftime(fmt), new_end_dt.strftime(fmt)
-
-    async def backtest_buy_and_hold(self):
-        buy_amount = self.data_collector.total_collected_data[self.limit - 1]["open"]
-        sell_amount = self.data_collector.total_collected_data[-1]["close"]
-        # 수익률 계산
-        profit = (sell_amount - buy_amount) / buy_amount * 100
-        print(f"*Buy and Hold 전략 수익률: {profit:.2f}%")
+        clock = self.backtest_clock
+        table = format_baseline_table(
+            run_baselines(
+                clock.columns,
+                clock.start_index,
+                clock.end_index,
+                self.portfolio_manager.fee_rate,
+                self.initial_cash,
+            ),
+            system_metrics,
+        )
+        table.to_csv(
+            os.path.join(
+                self.record_manager.folder_path, f"{self.system_name}_baselines.csv"
+            ),
+            index=False,
+            encoding="utf-8",
+        )
+        print("***기준 전략 비교***")
+        print(table.to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+        print()
+        return table
 
 
 class AsyncCryptoTradingSystem(CryptoTradingSystem):
@@ -350,6 +804,20 @@ class AsyncCryptoTradingSystem(CryptoTradingSystem):
         end_date: str,
         candle_unit: str,
         limit: int,
+        stream_signal: bool = False,
+        event_trigger: Optional[EventTrigger] = None,
+        cascade: bool = False,
+        analysis_mode: str = "sequential",
+        price_analysis_model: Optional[str] = None,
+        trading_model: Optional[str] = None,
+        vote_samples: int = 1,
+        timeframes: Optional[Sequence[str]] = None,
+        precompute_decisions: bool = False,
+        decision_concurrency: int = DEFAULT_DECISION_CONCURRENCY,
+        fallback_signal: int = DEFAULT_FALLBACK_SIGNAL,
+        candle_store: Optional[CandleStore] = None,
+        verbosity: int = DEFAULT_VERBOSITY,
+        rich_console: bool = False,
     ):
         super().__init__(
             system_name=system_name,
@@ -360,10 +828,32 @@ class AsyncCryptoTradingSystem(CryptoTradingSystem):
             end_date=end_date,
             candle_unit=candle_unit,
             limit=limit,
+            stream_signal=stream_signal,
+            event_trigger=event_trigger,
+            cascade=cascade,
+            analysis_mode=analysis_mode,
+            price_analysis_model=price_analysis_model,
+            trading_model=trading_model,
+            vote_samples=vote_samples,
+            timeframes=timeframes,
+            precompute_decisions=precompute_decisions,
+            decision_concurrency=decision_concurrency,
+            fallback_signal=fallback_signal,
+            candle_store=candle_store,
+            verbosity=verbosity,
+            rich_console=rich_console,
         )
 
     def run(self):
-        asyncio.run(super().run())
+        asyncio.run(self._run())
+
+    async def _run(self):
+        try:
+            await super().run()
+        finally:
+            self.event_logger.stop()
+            # 이벤트 루프가 끝나면 클라이언트도 재사용할 수 없으므로 풀을 정리
+            await model_client_pool.close()
 
 
 def create_system(
@@ -375,6 +865,20 @@ def create_system(
     end_date: str,
     candle_unit: str,
     limit: int = 0,
+    stream_signal: bool = False,
+    event_trigger: Optional[EventTrigger] = None,
+    cascade: bool = False,
+    analysis_mode: str = "sequential",
+    price_analysis_model: Optional[str] = None,
+    trading_model: Optional[str] = None,
+    vote_samples: int = 1,
+    timeframes: Optional[Sequence[str]] = None,
+    precompute_decisions: bool = False,
+    decision_concurrency: int = DEFAULT_DECISION_CONCURRENCY,
+    fallback_signal: int = DEFAULT_FALLBACK_SIGNAL,
+    candle_store: Optional[CandleStore] = None,
+    verbosity: int = DEFAULT_VERBOSITY,
+    rich_console: bool = False,
 ):
     load_dotenv()
 
@@ -387,4 +891,18 @@ def create_system(
         end_date=end_date,
         candle_unit=candle_unit,
         limit=limit,
+        stream_signal=stream_signal,
+        event_trigger=event_trigger,
+        cascade=cascade,
+        analysis_mode=analysis_mode,
+        price_analysis_model=price_analysis_model,
+        trading_model=trading_model,
+        vote_samples=vote_samples,
+        timeframes=timeframes,
+        precompute_decisions=precompute_decisions,
+        decision_concurrency=decision_concurrency,
+        fallback_signal=fallback_signal,
+        candle_store=candle_store,
+        verbosity=verbosity,
+        rich_console=rich_console,
     )
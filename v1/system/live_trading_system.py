@@ -0,0 +1,447 @@
+import asyncio
+import os
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple, Union
+
+from autogen_core import CancellationToken
+from dotenv import load_dotenv
+
+from v1.core.constants import (
+    DEFAULT_DEADLINE_RATIO,
+    DEFAULT_LIVE_WINDOW,
+    DEFAULT_SETTLE_SECONDS,
+    DEFAULT_VERBOSITY,
+    LIVE_CANDLE_RETRY_SECONDS,
+)
+from v1.core.exchange import LocalExchange, UpbitExchange
+from v1.core.live_clock import SystemClock
+from v1.core.portfolio_manager import PortfolioManager
+from v1.core.price_analysis_expert import PriceAnalysisExpert
+from v1.core.prompts import format_portfolio, format_step_message
+from v1.core.trading_expert import TradingExpert
+from v1.system.record_manager import RecordManager
+from v1.system.record_writer import AsyncRecordWriter
+from v1.utils.event_log import (
+    EventLogger,
+    EventType,
+    bind_event_logger,
+    log_event,
+    unbind_event_logger,
+)
+from v1.utils.model_utils import model_client_pool
+from v1.utils.time_utils import calculate_elapsed_time
+from v1.utils.timeline import UPBIT_FORMAT, format_kst, unit_seconds
+
+
+class LiveTradingSystem:
+    """
+    캔들 마감 시각마다 깨어나 매매 결정을 내리는 이벤트 기반(페이퍼/라이브) 투자 시스템
+
+    스케줄러는 candle_unit 경계(+ settle_seconds)에 맞춰 잠들었다가,
+    새로 마감된 캔들만 롤링 윈도우에 추가하고 에이전트를 실행합니다.
+    의사결정은 다음 경계 전 마감 시한(캔들 간격 × deadline_ratio) 안에 끝나야 하며,
+    넘기면 HOLD로 대체합니다. 매매는 방금 시작된 캔들의 시가로 체결합니다.
+
+    늦게 깨어나 경계를 여러 개 지나친 경우(절전, 긴 GC, 시계 보정 등)에는
+    놓친 경계를 건너뛰고 가장 최근 경계 기준으로 재개하며,
+    롤링 윈도우는 그 사이 캔들까지 한 번에 채웁니다.
+
+    Args:
+        exchange: 캔들/시가 조회 거래소 (기본값: UpbitExchange)
+        clock: 시계 (기본값: SystemClock, 테스트에는 SimulatedClock)
+        deadline_ratio (float): 캔들 간격 대비 의사결정 마감 시한 비율
+        settle_seconds (float): 캔들 마감 후 거래소 반영을 기다리는 시간(초)
+        max_steps (Optional[int]): 실행할 최대 스텝 수 (None이면 stop() 호출 시까지)
+    """
+
+    def __init__(
+        self,
+        system_name: str,
+        initial_cash: float,
+        fee_rate: float,
+        coin: str,
+        candle_unit: str,
+        limit: int = 0,
+        exchange: Optional[Union[UpbitExchange, LocalExchange]] = None,
+        clock: Optional[SystemClock] = None,
+        deadline_ratio: float = DEFAULT_DEADLINE_RATIO,
+        settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+        max_steps: Optional[int] = None,
+        analysis_mode: str = "sequential",
+        price_analysis_model: Optional[str] = None,
+        trading_model: Optional[str] = None,
+        verbosity: int = DEFAULT_VERBOSITY,
+        rich_console: bool = False,
+    ):
+        if not 0 < deadline_ratio <= 1:
+            raise ValueError("deadline_ratio는 0보다 크고 1 이하여야 합니다.")
+
+        self.system_name = system_name
+        self.initial_cash = initial_cash
+        self.fee_rate = fee_rate
+        self.coin = coin
+        self.candle_unit = candle_unit
+        self.limit = limit
+        self.exchange = exchange if exchange is not None else UpbitExchange()
+        self.clock = clock if clock is not None else SystemClock()
+        self.deadline_ratio = deadline_ratio
+        self.settle_seconds = settle_seconds
+        self.max_steps = max_steps
+
+        self.step_seconds = unit_seconds(candle_unit)
+        self.window: Deque[Dict] = deque(
+            maxlen=limit if limit > 0 else DEFAULT_LIVE_WINDOW
+        )
+
+        self.price_analysis_expert = PriceAnalysisExpert(
+            limit=limit, analysis_mode=analysis_mode, model_name=price_analysis_model
+        )
+        self.trading_expert = TradingExpert(model_name=trading_model)
+        self.portfolio_manager = PortfolioManager(
+            initial_cash=initial_cash, fee_rate=fee_rate
+        )
+        self.record_manager = RecordManager(system_name=system_name)
+        self.record_writer = AsyncRecordWriter(self.record_manager)
+        self.event_logger = EventLogger(
+            name=system_name,
+            path=os.path.join(
+                self.record_manager.folder_path, f"{system_name}_events.jsonl"
+            ),
+            verbosity=verbosity,
+            rich_console=rich_console,
+        )
+
+        # 실행 통계
+        self.steps = 0
+        self.missed_candles = 0
+        self.deadline_misses = 0
+        self._stopping = False
+
+    def stop(self):
+        """현재 스텝을 마친 뒤 스케줄러를 종료합니다."""
+        self._stopping = True
+
+    def next_boundary(self, timestamp: float) -> int:
+        """timestamp 이후 첫 캔들 경계 (epoch 기준 정렬, 일봉은 09:00 KST)"""
+        return (int(timestamp) // self.step_seconds + 1) * self.step_seconds
+
+    async def run(self):
+        print("###################### 라이브 투자 시스템 시작 ######################")
+        print("---------------------------------------------------------------------")
+        print("시스템명:", self.system_name)
+        print("투자 대상 코인:", self.coin)
+        print("캔들 단위:", self.candle_unit)
+        print("초기 현금:", self.portfolio_manager.current_cash)
+        print(
+            f"마감 시한: 캔들 마감 후 {self.step_seconds * self.deadline_ratio:.0f}초"
+        )
+        print("---------------------------------------------------------------------")
+        start_time = time.time()
+        event_token = bind_event_logger(self.event_logger)
+        log_event(
+            EventType.RUN_START,
+            coin=self.coin,
+            candle_unit=self.candle_unit,
+            initial_cash=self.initial_cash,
+            deadline_ratio=self.deadline_ratio,
+        )
+
+        await model_client_pool.warm_up()
+        self.record_writer.start()
+
+        # 1) 롤링 윈도우 초기화: 직전까지 마감된 캔들로 채움
+        now = self.clock.now()
+        boundary = self.next_boundary(now)
+        await self._pull_candles(boundary - 2 * self.step_seconds, deadline=now)
+        print(f"초기 윈도우: {len(self.window)}개 캔들")
+
+        while not self._stopping and (
+            self.max_steps is None or self.steps < self.max_steps
+        ):
+            # 2) 다음 경계(+ 반영 대기)까지 대기
+            wake_at = boundary + self.settle_seconds
+            await self.clock.sleep_until(wake_at)
+            drift = self.clock.now() - wake_at
+
+            # 늦게 깨어나 지나친 경계는 건너뛰고 가장 최근 경계로 이동
+            latest_boundary = (
+                int(self.clock.now() - self.settle_seconds) // self.step_seconds
+            ) * self.step_seconds
+            if latest_boundary > boundary:
+                skipped = (latest_boundary - boundary) // self.step_seconds
+                self.missed_candles += skipped
+                boundary = latest_boundary
+                log_event(
+                    EventType.MISSED_CANDLES,
+                    date=format_kst(boundary, UPBIT_FORMAT),
+                    skipped=skipped,
+                    drift=drift,
+                )
+
+            await self._step(boundary, drift)
+            self.steps += 1
+            boundary += self.step_seconds
+
+        await self.record_writer.close()
+
+        print("***라이브 실행 요약***")
+        print(f"실행 스텝: {self.steps}")
+        print(f"놓친 캔들 경계: {self.missed_candles}")
+        print(f"마감 시한 초과: {self.deadline_misses}")
+        print(
+            f"Cash: {self.portfolio_manager.current_cash}, Amount of Coins: {self.portfolio_manager.current_position}\n"
+        )
+        log_event(
+            EventType.METRICS,
+            steps=self.steps,
+            missed_candles=self.missed_candles,
+            deadline_misses=self.deadline_misses,
+            cash=self.portfolio_manager.current_cash,
+            position=self.portfolio_manager.current_position,
+        )
+
+        end_time = time.time()
+        elapsed_day, elapsed_hour, elapsed_minute, elapsed_second = (
+            calculate_elapsed_time(start_time, end_time)
+        )
+        print(
+            f"총 소요 시간: {elapsed_day}일 {elapsed_hour}시간 {elapsed_minute}분 {elapsed_second}초"
+        )
+        log_event(EventType.RUN_END, elapsed=end_time - start_time)
+        unbind_event_logger(event_token)
+        self.event_logger.stop()
+        print("###################### 라이브 투자 시스템 종료 ######################\n")
+
+    async def _step(self, boundary: int, drift: float):
+        """
+        boundary 경계에서 한 스텝을 수행합니다.
+        (방금 마감된 캔들 = boundary - 캔들 간격, 매매 = boundary 캔들 시가)
+        """
+        step_start_time = time.time()
+        closed_ts = boundary - self.step_seconds
+        deadline = boundary + self.step_seconds * self.deadline_ratio
+        date = format_kst(boundary, UPBIT_FORMAT)
+        log_event(
+            EventType.STEP_START,
+            step=self.steps,
+            date=format_kst(closed_ts, UPBIT_FORMAT),
+            drift=drift,
+        )
+
+        current_cash = self.portfolio_manager.current_cash
+        current_position = self.portfolio_manager.current_position
+
+        # 3) 새로 마감된 캔들만 가져와 롤링 윈도우에 추가
+        await self._pull_candles(closed_ts, deadline=deadline)
+
+        analysis_report, signal_reason = None, None
+        analysis_time, trade_time = None, None
+        signal = 0
+        if not self.window or self.window[-1]["timestamp"] != closed_ts:
+            self.deadline_misses += 1
+            signal_reason = "마감 캔들 미수신 (HOLD 유지)"
+            log_event(EventType.DEADLINE_EXCEEDED, date=date, stage="candle")
+        else:
+            # 4) 마감 시한 안에서만 에이전트 실행, 넘기면 HOLD
+            try:
+                (
+                    signal,
+                    analysis_report,
+                    signal_reason,
+                    analysis_time,
+                    trade_time,
+                ) = await asyncio.wait_for(
+                    self._decide(
+                        list(self.window),
+                        {
+                            "current_cash": current_cash,
+                            "current_position": current_position,
+                        },
+                    ),
+                    timeout=self.clock.seconds_until(deadline),
+                )
+            except asyncio.TimeoutError:
+                self.deadline_misses += 1
+                signal, signal_reason = 0, "마감 시한 초과 (HOLD 유지)"
+                log_event(EventType.DEADLINE_EXCEEDED, date=date, stage="decision")
+                # 중간에 취소된 대화 기록이 다음 스텝에 섞이지 않도록 초기화
+                await self.price_analysis_expert.on_reset(CancellationToken())
+                await self.trading_expert.on_reset(CancellationToken())
+
+        # 5) 방금 시작된 캔들의 시가로 체결
+        open_price = await self.exchange.get_open_price(
+            self.coin, self.candle_unit, boundary
+        )
+        if open_price is None:
+            open_price = self.window[-1]["close"] if self.window else None
+        if open_price is not None:
+            self.portfolio_manager.record_trade(
+                date=date, action=signal, open_price=open_price
+            )
+        log_event(
+            EventType.TRADE,
+            date=date,
+            signal=signal,
+            open_price=open_price,
+            cash=self.portfolio_manager.current_cash,
+            position=self.portfolio_manager.current_position,
+        )
+
+        if self.window and self.window[-1]["timestamp"] == closed_ts:
+            candle = self.window[-1]
+            await self.record_writer.submit(
+                {
+                    "timestamp": candle["timestamp"],
+                    "open": candle["open"],
+                    "high": candle["high"],
+                    "low": candle["low"],
+                    "close": candle["close"],
+                    "volume": candle["volume"],
+                    "next_action": signal,
+                    "current_cash": current_cash,
+                    "current_position": current_position,
+                    "price_analysis_report": analysis_report,
+                    "trading_reason": signal_reason,
+                    "response_time_analysis": analysis_time,
+                    "response_time_trade": trade_time,
+                }
+            )
+        log_event(
+            EventType.STEP_END,
+            step=self.steps,
+            date=format_kst(closed_ts, UPBIT_FORMAT),
+            elapsed=time.time() - step_start_time,
+        )
+
+    async def _pull_candles(self, closed_ts: int, deadline: float):
+        """
+        윈도우 마지막 캔들 이후 ~ closed_ts까지 마감된 캔들을 가져옵니다.
+        거래소 반영이 늦으면 deadline까지 재조회합니다.
+        """
+        while True:
+            if self.window:
+                start_ts = self.window[-1]["timestamp"] + self.step_seconds
+            else:
+                start_ts = closed_ts - self.step_seconds * (self.window.maxlen - 1)
+
+            if start_ts <= closed_ts:
+                candles = await self.exchange.get_candles(
+                    self.coin, self.candle_unit, start_ts, closed_ts
+                )
+                for candle in candles:
+                    if (
+                        not self.window
+                        or candle["timestamp"] > self.window[-1]["timestamp"]
+                    ):
+                        self.window.append(candle)
+
+            if self.window and self.window[-1]["timestamp"] >= closed_ts:
+                return
+            retry_at = self.clock.now() + LIVE_CANDLE_RETRY_SECONDS
+            if retry_at >= deadline:
+                return
+            await self.clock.sleep_until(retry_at)
+
+    async def _decide(
+        self, price_data: List[Dict], current_info: Dict
+    ) -> Tuple[int, str, str, float, float]:
+        """가격 분석 → 매매 신호 생성 (마감 시한은 호출 측에서 적용)"""
+        analysis_report, analysis_time = await self.price_analysis_expert.analyze_trend(
+            price_data=price_data, current_info=current_info
+        )
+        await self.price_analysis_expert.on_reset(CancellationToken())
+
+        analysis_report = format_step_message(
+            (
+                "Current Portfolio",
+                format_portfolio(
+                    current_info["current_cash"], current_info["current_position"]
+                ),
+            ),
+            ("Price Analysis Report", analysis_report),
+        )
+
+        signal, signal_reason, trade_time = await self.trading_expert.generate_signal(
+            analysis_report=analysis_report
+        )
+        await self.trading_expert.on_reset(CancellationToken())
+        return signal, analysis_report, signal_reason, analysis_time, trade_time
+
+
+class AsyncLiveTradingSystem(LiveTradingSystem):
+    def run(self):
+        asyncio.run(self._run())
+
+    async def _run(self):
+        try:
+            await super().run()
+        finally:
+            self.event_logger.stop()
+            await model_client_pool.close()
+
+
+def create_live_system(
+    system_name: str,
+    initial_cash: float,
+    fee_rate: float,
+    coin: str,
+    candle_unit: str,
+    limit: int = 0,
+    exchange: Optional[Union[UpbitExchange, LocalExchange]] = None,
+    clock: Optional[SystemClock] = None,
+    deadline_ratio: float = DEFAULT_DEADLINE_RATIO,
+    settle_seconds: float = DEFAULT_SETTLE_SECONDS,
+    max_steps: Optional[int] = None,
+    analysis_mode: str = "sequential",
+    price_analysis_model: Optional[str] = None,
+    trading_model: Optional[str] = None,
+    verbosity: int = DEFAULT_VERBOSITY,
+    rich_console: bool = False,
+):
+    load_dotenv()
+
+    return AsyncLiveTradingSystem(
+        system_name=system_name,
+        initial_cash=initial_cash,
+        fee_rate=fee_rate,
+        coin=coin,
+        candle_unit=candle_unit,
+        limit=limit,
+        exchange=exchange,
+        clock=clock,
+        deadline_ratio=deadline_ratio,
+        settle_seconds=settle_seconds,
+        max_steps=max_steps,
+        analysis_mode=analysis_mode,
+        price_analysis_model=price_analysis_model,
+        trading_model=trading_model,
+        verbosity=verbosity,
+        rich_console=rich_console,
+    )
+
+
+if __name__ == "__main__":
+    from v1.core.exchange import generate_random_walk_candles
+    from v1.core.live_clock import SimulatedClock
+
+    # 1시간 캔들을 600배속(실제 6초)으로 재생하는 로컬 시뮬레이션
+    clock = SimulatedClock(speed=600)
+    first_ts = int(clock.now()) // 3600 * 3600 - 3600 * 100
+    exchange = LocalExchange(
+        generate_random_walk_candles(first_ts, "1h", count=120, seed=0),
+        clock=clock,
+        candle_unit="1h",
+    )
+    create_live_system(
+        system_name="live_simulation",
+        initial_cash=10_000_000,
+        fee_rate=0.08,
+        coin="KRW-BTC",
+        candle_unit="1h",
+        limit=40,
+        exchange=exchange,
+        clock=clock,
+        settle_seconds=0,
+        max_steps=5,
+    ).run()
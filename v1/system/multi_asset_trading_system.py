@@ -0,0 +1,473 @@
+import asyncio
+import os
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+from autogen_core import CancellationToken
+from dotenv import load_dotenv
+
+from v1.core.backtest_clock import BacktestClock
+from v1.core.constants import DEFAULT_FALLBACK_SIGNAL, DEFAULT_VERBOSITY
+from v1.core.candle_store import CandleStore
+from v1.core.data_collector import DataCollector
+from v1.core.multi_asset_portfolio_manager import (
+    EqualWeightAllocator,
+    MultiAssetPortfolioManager,
+)
+from v1.core.price_analysis_expert import PriceAnalysisExpert
+from v1.core.prompts import format_portfolio, format_step_message
+from v1.core.trading_expert import TradingExpert
+from v1.system.record_manager import RecordManager
+from v1.system.record_writer import AsyncRecordWriter
+from v1.utils.event_log import (
+    EventLogger,
+    EventType,
+    bind_event_logger,
+    log_event,
+    unbind_event_logger,
+)
+from v1.utils.model_utils import LLMDeadlineExceeded, model_client_pool
+from v1.utils.time_utils import calculate_elapsed_time
+
+
+class CoinPipeline:
+    """
+    코인 하나에 대한 수집기, 분석/투자 에이전트, 기록 관리자 묶음.
+    에이전트는 대화 상태를 가지므로 코인마다 별도 인스턴스를 사용합니다.
+    """
+
+    def __init__(
+        self,
+        system_name: str,
+        coin: str,
+        start_date: str,
+        end_date: str,
+        candle_unit: str,
+        limit: int,
+        analysis_mode: str,
+        price_analysis_model: Optional[str],
+        trading_model: Optional[str],
+        candle_store: Optional[CandleStore],
+    ):
+        self.coin = coin
+        self.data_collector = DataCollector(limit=limit, candle_store=candle_store)
+        self.backtest_clock = BacktestClock(
+            coin=coin,
+            start_date=start_date,
+            end_date=end_date,
+            candle_unit=candle_unit,
+            limit=limit,
+            data_collector=self.data_collector,
+        )
+        self.price_analysis_expert = PriceAnalysisExpert(
+            limit=limit, analysis_mode=analysis_mode, model_name=price_analysis_model
+        )
+        self.trading_expert = TradingExpert(model_name=trading_model)
+        self.record_manager = RecordManager(system_name=f"{system_name}_{coin}")
+        self.record_writer = AsyncRecordWriter(self.record_manager)
+
+
+class MultiAssetTradingSystem:
+    """
+    여러 코인을 하나의 현금 풀로 운용하는 투자 시스템.
+
+    매 스텝마다 코인별 파이프라인(수집 → 가격 분석 → 매매 신호)을 이벤트 루프에서 동시에 실행하고,
+    EqualWeightAllocator로 신호를 목표 비중으로 바꾼 뒤 MultiAssetPortfolioManager로 한 번에 매매합니다.
+    코인 수가 늘어도 스텝 지연은 가장 느린 코인 파이프라인 수준으로 유지됩니다
+    (LLM 동시 요청 수는 모델 클라이언트 풀의 백엔드별 상한을 따름).
+    """
+
+    def __init__(
+        self,
+        system_name: str,
+        initial_cash: float,
+        fee_rate: float,
+        coins: List[str],
+        start_date: str,
+        end_date: str,
+        candle_unit: str,
+        limit: int = 0,
+        analysis_mode: str = "sequential",
+        price_analysis_model: Optional[str] = None,
+        trading_model: Optional[str] = None,
+        candle_store: Optional[CandleStore] = None,
+        fallback_signal: int = DEFAULT_FALLBACK_SIGNAL,
+        verbosity: int = DEFAULT_VERBOSITY,
+        rich_console: bool = False,
+    ):
+        if fallback_signal not in (1, 0, -1):
+            raise ValueError(
+                f"fallback_signal은 1, 0, -1 중 하나여야 합니다: {fallback_signal}"
+            )
+
+        self.system_name = system_name
+        self.initial_cash = initial_cash
+        self.fee_rate = fee_rate
+        self.coins = list(coins)
+        self.start_date = start_date
+        self.end_date = end_date
+        self.candle_unit = candle_unit
+        self.limit = limit
+        # LLM 호출이 마감 시한(LLM_CALL_DEADLINE_SECONDS)을 넘긴 코인에 대신 사용할 매매 신호
+        self.fallback_signal = fallback_signal
+        self.deadline_fallbacks = 0
+
+        self.pipelines = [
+            CoinPipeline(
+                system_name=system_name,
+                coin=coin,
+                start_date=start_date,
+                end_date=end_date,
+                candle_unit=candle_unit,
+                limit=limit,
+                analysis_mode=analysis_mode,
+                price_analysis_model=price_analysis_model,
+                trading_model=trading_model,
+                candle_store=candle_store,
+            )
+            for coin in self.coins
+        ]
+        self.allocator = EqualWeightAllocator()
+        self.portfolio_manager = MultiAssetPortfolioManager(
+            coins=self.coins, initial_cash=initial_cash, fee_rate=fee_rate
+        )
+        self.event_logger = EventLogger(
+            name=system_name,
+            path=os.path.join(
+                self.pipelines[0].record_manager.folder_path,
+                f"{system_name}_events.jsonl",
+            ),
+            verbosity=verbosity,
+            rich_console=rich_console,
+        )
+
+        self.tmp_start_date = start_date
+        self.tmp_end_date = end_date
+
+    async def run(self):
+        """
+        전체 투자 프로세스를 실행합니다.
+
+        1. 코인별 전체 구간(+ 워밍업)을 동시에 한 번씩 불러옴
+        2. 코인별 파이프라인을 동시에 실행하여 매매 신호 생성
+        3. 신호를 목표 비중으로 변환하고 다음 캔들 시가에 일괄 매매
+        4. 반복 수행 후 전량 청산 및 성과 지표 출력
+        """
+        print(
+            "###################### 멀티 에셋 투자 시스템 시작 ######################"
+        )
+        print("시스템명:", self.system_name)
+        print("투자 대상 코인:", ", ".join(self.coins))
+        print("투자 기간:", self.start_date, "~", self.end_date)
+        print("캔들 단위:", self.candle_unit)
+        print("초기 현금:", self.portfolio_manager.current_cash)
+        print("---------------------------------------------------------------------")
+        start_time = time.time()
+        event_token = bind_event_logger(self.event_logger)
+        log_event(
+            EventType.RUN_START,
+            coins=self.coins,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            candle_unit=self.candle_unit,
+            initial_cash=self.initial_cash,
+        )
+
+        await model_client_pool.warm_up()
+        await asyncio.gather(
+            *(pipeline.backtest_clock.load() for pipeline in self.pipelines)
+        )
+
+        # 첫 번째 코인의 캔들 시각을 기준 타임라인으로 사용하고,
+        # 나머지 코인은 같은 시각의 캔들 인덱스를 찾아 정렬
+        master_clock = self.pipelines[0].backtest_clock
+        if len(master_clock) == 0:
+            raise ValueError(
+                f"{self.start_date} ~ {self.end_date} 구간에 백테스트할 캔들이 없습니다."
+            )
+        last_closes = np.zeros(len(self.coins), dtype=np.float64)
+        for pipeline in self.pipelines:
+            pipeline.record_writer.start()
+
+        for master_step in master_clock:
+            date = master_clock.candle(master_step)["date"]
+            next_date = master_clock.next_candle(master_step)["date"]
+            timestamp = int(master_clock.timestamps[master_step])
+            next_timestamp = int(master_clock.timestamps[master_step + 1])
+            steps = []
+            for pipeline in self.pipelines:
+                step = pipeline.backtest_clock.index_of(timestamp)
+                if (
+                    step is not None
+                    and pipeline.backtest_clock.index_of(next_timestamp) != step + 1
+                ):
+                    step = None
+                steps.append(step)
+
+            # 1) 코인별 파이프라인 동시 실행 (해당 시각 캔들이 없는 코인은 HOLD)
+            step_start_time = time.time()
+            log_event(EventType.STEP_START, step=master_step, date=date)
+            decisions = await asyncio.gather(
+                *(
+                    self._decide(idx, pipeline, step)
+                    for idx, (pipeline, step) in enumerate(zip(self.pipelines, steps))
+                )
+            )
+            signals = np.array([decision[0] for decision in decisions], dtype=np.int64)
+
+            # 2) 다음 캔들 시가 (이미 불러온 데이터에서 인덱스로 조회)
+            open_prices = np.empty(len(self.coins), dtype=np.float64)
+            for idx, (pipeline, step) in enumerate(zip(self.pipelines, steps)):
+                if step is not None:
+                    open_prices[idx] = pipeline.backtest_clock.next_open(step)
+                    last_closes[idx] = pipeline.backtest_clock.next_candle(step)[
+                        "close"
+                    ]
+                else:
+                    open_prices[idx] = last_closes[idx]
+            self.tmp_start_date, self.tmp_end_date = date, next_date
+
+            # 3) 신호 → 목표 비중 → 일괄 매매
+            current_cash = self.portfolio_manager.current_cash
+            current_positions = self.portfolio_manager.positions.copy()
+            target_weights = self.allocator.allocate(
+                signals, self.portfolio_manager.weights(open_prices)
+            )
+            self.portfolio_manager.rebalance(
+                date=next_date,
+                signals=signals,
+                target_weights=target_weights,
+                open_prices=open_prices,
+            )
+
+            for coin, signal, weight, position, open_price in zip(
+                self.coins,
+                signals,
+                target_weights,
+                self.portfolio_manager.positions,
+                open_prices,
+            ):
+                log_event(
+                    EventType.TRADE,
+                    coin=coin,
+                    date=next_date,
+                    signal=int(signal),
+                    target_weight=float(weight),
+                    open_price=float(open_price),
+                    cash=self.portfolio_manager.current_cash,
+                    position=float(position),
+                )
+
+            for idx, (pipeline, step, decision) in enumerate(
+                zip(self.pipelines, steps, decisions)
+            ):
+                if step is None:
+                    continue
+                candle = pipeline.backtest_clock.candle(step)
+                _, analysis_report, signal_reason, analysis_time, trade_time = decision
+                await pipeline.record_writer.submit(
+                    {
+                        "timestamp": candle["timestamp"],
+                        "open": candle["open"],
+                        "high": candle["high"],
+                        "low": candle["low"],
+                        "close": candle["close"],
+                        "volume": candle["volume"],
+                        "next_action": int(signals[idx]),
+                        "current_cash": current_cash,
+                        "current_position": current_positions[idx],
+                        "price_analysis_report": analysis_report,
+                        "trading_reason": signal_reason,
+                        "response_time_analysis": analysis_time,
+                        "response_time_trade": trade_time,
+                    }
+                )
+
+            log_event(
+                EventType.STEP_END,
+                step=master_step,
+                date=date,
+                elapsed=time.time() - step_start_time,
+            )
+
+        await asyncio.gather(
+            *(pipeline.record_writer.close() for pipeline in self.pipelines)
+        )
+
+        # 보유 코인 전량 청산
+        self.portfolio_manager.rebalance(
+            date=self.tmp_end_date,
+            signals=np.full(len(self.coins), -1, dtype=np.int64),
+            target_weights=np.zeros(len(self.coins), dtype=np.float64),
+            open_prices=last_closes,
+        )
+
+        ledger_path = os.path.join(
+            self.pipelines[0].record_manager.folder_path,
+            f"{self.system_name}_portfolio.csv",
+        )
+        self.portfolio_manager.to_dataframe().to_csv(
+            ledger_path, index=False, encoding="utf-8"
+        )
+
+        performance_metrics = self.portfolio_manager.performance_metrics()
+        log_event(EventType.METRICS, **performance_metrics)
+        print("***멀티 에셋 포트폴리오 성과 지표***")
+        print(f"최종 수익률: {performance_metrics['return_pct']:.2f}%")
+        print(f"최대 낙폭: {performance_metrics['mdd']:.2f}%")
+        print(f"샤프 지수: {performance_metrics['sharpe_index']:.2f}\n")
+        if self.deadline_fallbacks:
+            print(
+                f"대체 신호({self.fallback_signal})로 진행한 코인 스텝: {self.deadline_fallbacks}개\n"
+            )
+
+        end_time = time.time()
+        elapsed_day, elapsed_hour, elapsed_minute, elapsed_second = (
+            calculate_elapsed_time(start_time, end_time)
+        )
+        print(
+            f"총 소요 시간: {elapsed_day}일 {elapsed_hour}시간 {elapsed_minute}분 {elapsed_second}초"
+        )
+        log_event(EventType.RUN_END, elapsed=end_time - start_time)
+        unbind_event_logger(event_token)
+        self.event_logger.stop()
+
+        print(
+            "###################### 멀티 에셋 투자 시스템 종료 ######################\n"
+        )
+
+    async def _decide(
+        self, idx: int, pipeline: CoinPipeline, step: Optional[int]
+    ) -> Tuple[int, Optional[str], Optional[str], Optional[float], Optional[float]]:
+        """
+        코인 하나의 가격 분석 → 매매 신호 생성을 수행합니다.
+        LLM 호출이 마감 시한을 넘기면 해당 코인만 대체 신호(fallback_signal)로 진행합니다.
+
+        Args:
+            idx (int): 코인 순번
+            pipeline (CoinPipeline): 코인 파이프라인
+            step (Optional[int]): 코인 캔들 인덱스, None이면 해당 시각 캔들이 없어 HOLD
+
+        Returns:
+            Tuple[int, str, str, float, float]: 신호, 분석 리포트, 매매 근거, 분석 시간, 투자 결정 시간
+        """
+        if step is None:
+            return 0, None, None, 0.0, 0.0
+
+        data = pipeline.backtest_clock.window(step)
+        current_info = {
+            "current_cash": self.portfolio_manager.current_cash,
+            "current_position": self.portfolio_manager.positions[idx],
+        }
+
+        try:
+            analysis_report, analysis_time = (
+                await pipeline.price_analysis_expert.analyze_trend(
+                    price_data=data, current_info=current_info
+                )
+            )
+            await pipeline.price_analysis_expert.on_reset(CancellationToken())
+
+            analysis_report = format_step_message(
+                ("Market", pipeline.coin),
+                (
+                    "Current Portfolio",
+                    format_portfolio(
+                        self.portfolio_manager.current_cash,
+                        self.portfolio_manager.positions[idx],
+                        cash_label="Shared Cash",
+                    ),
+                ),
+                ("Price Analysis Report", analysis_report),
+            )
+
+            signal, signal_reason, trade_time = (
+                await pipeline.trading_expert.generate_signal(
+                    analysis_report=analysis_report
+                )
+            )
+            await pipeline.trading_expert.on_reset(CancellationToken())
+        except LLMDeadlineExceeded:
+            signal, signal_reason = await self._deadline_fallback(
+                pipeline, pipeline.backtest_clock.candle(step)["date"]
+            )
+            return signal, None, signal_reason, None, None
+        return signal, analysis_report, signal_reason, analysis_time, trade_time
+
+    async def _deadline_fallback(
+        self, pipeline: CoinPipeline, date: str
+    ) -> Tuple[int, str]:
+        """
+        LLM 호출이 마감 시한을 넘긴 코인의 대체 결정을 반환하고 해당 파이프라인의 에이전트를 초기화합니다.
+
+        Args:
+            pipeline (CoinPipeline): 코인 파이프라인
+            date (str): 스텝 캔들 시각
+
+        Returns:
+            int: 대체 매매 신호 (fallback_signal)
+            str: 매매 근거
+        """
+        self.deadline_fallbacks += 1
+        await pipeline.price_analysis_expert.on_reset(CancellationToken())
+        await pipeline.trading_expert.on_reset(CancellationToken())
+        log_event(
+            EventType.DEADLINE_EXCEEDED,
+            coin=pipeline.coin,
+            date=date,
+            stage="llm",
+            signal=self.fallback_signal,
+        )
+        return (
+            self.fallback_signal,
+            f"LLM 마감 시한 초과 (대체 신호 {self.fallback_signal})",
+        )
+
+
+class AsyncMultiAssetTradingSystem(MultiAssetTradingSystem):
+    def run(self):
+        asyncio.run(self._run())
+
+    async def _run(self):
+        try:
+            await super().run()
+        finally:
+            self.event_logger.stop()
+            await model_client_pool.close()
+
+
+def create_multi_asset_system(
+    system_name: str,
+    initial_cash: float,
+    fee_rate: float,
+    coins: List[str],
+    start_date: str,
+    end_date: str,
+    candle_unit: str,
+    limit: int = 0,
+    analysis_mode: str = "sequential",
+    price_analysis_model: Optional[str] = None,
+    trading_model: Optional[str] = None,
+    fallback_signal: int = DEFAULT_FALLBACK_SIGNAL,
+    verbosity: int = DEFAULT_VERBOSITY,
+    rich_console: bool = False,
+):
+    load_dotenv()
+
+    return AsyncMultiAssetTradingSystem(
+        system_name=system_name,
+        initial_cash=initial_cash,
+        fee_rate=fee_rate,
+        coins=coins,
+        start_date=start_date,
+        end_date=end_date,
+        candle_unit=candle_unit,
+        limit=limit,
+        analysis_mode=analysis_mode,
+        price_analysis_model=price_analysis_model,
+        trading_model=trading_model,
+        fallback_signal=fallback_signal,
+        verbosity=verbosity,
+        rich_console=rich_console,
+    )
@@ -1,20 +1,37 @@
+from __future__ import annotations
+
 import os
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional, Tuple
+
+from v1.core.constants import REPORT_FIELDS
+from v1.system.report_store import ReportStore, shared_report_store
+from v1.utils.lazy_import import lazy_module
+from v1.utils.timeline import to_epoch, to_kst_datetime64
 
-import pandas as pd
+pd = lazy_module("pandas")
 
 
 class RecordManager:
-    def __init__(self, system_name: str):
+    """
+    스텝별 기록을 CSV로 저장합니다.
+
+    분석 리포트와 매매 근거 본문(REPORT_FIELDS)은 ReportStore에 압축 저장되고
+    CSV에는 "{필드}_hash" 컬럼으로 해시만 남습니다.
+    """
+
+    def __init__(self, system_name: str, report_store: Optional[ReportStore] = None):
+        self.system_name = system_name
         self.folder_path = os.path.abspath(
             os.path.join(os.path.dirname(__file__), "../data")
         )
         os.makedirs(self.folder_path, exist_ok=True)
 
         self.file_path = os.path.join(self.folder_path, f"{system_name}.csv")
+        self.report_store = report_store or shared_report_store(self.folder_path)
 
         self.column_types = {
             "datetime": "datetime64[ns]",
+            "timestamp": "Int64",  # 캔들 시각 (UTC epoch 초), 행 식별 키
             "open": "float64",
             "high": "float64",
             "low": "float64",
@@ -23,20 +40,26 @@ class RecordManager:
             "next_action": "Int64",  # 다음 틱의 종가에 대해 시가에 어떤 액션을 취할지 결정
             "current_cash": "float64",  # 현재 보유 현금
             "current_position": "float64",  # 현재 보유 수량(코인 단위)
-            "price_analysis_report": "string",  # 가격 분석 리포트
-            "trading_reason": "string",  # 매매 신호 생성 이유
+            "price_analysis_report_hash": "string",  # 가격 분석 리포트 (ReportStore 키)
+            "trading_reason_hash": "string",  # 매매 신호 생성 이유 (ReportStore 키)
             "response_time_analysis": "Float64",  # 분석 응답 시간
             "response_time_trade": "Float64",  # 투자 결정 응답 시간
+            "gated": "boolean",  # 이벤트 트리거 미발동으로 LLM 호출을 생략했는지 여부
+            "trade_model_tier": "string",  # 캐스케이드 모드에서 최종 신호를 낸 모델 티어
+            "trading_votes": "string",  # 투표 모드의 신호별 득표 분포 (JSON)
         }
 
         # 👉 이미 파일이 존재하면 지우고 빈 데이터프레임으로 시작
         if os.path.exists(self.file_path):
             os.remove(self.file_path)
+        self.report_store.drop_run(system_name)
 
         # 새 파일(혹은 방금 삭제한 파일) 기준으로 초기 데이터프레임 생성
         self.df = pd.DataFrame(
             {col: pd.Series(dtype=dtype) for col, dtype in self.column_types.items()}
         )
+        # timestamp -> 행 인덱스 (기존 행 조회를 O(1)로)
+        self._row_index: Dict[int, int] = {}
         self.save()
 
     def _cast_types(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -48,21 +71,38 @@ class RecordManager:
                 df[col] = pd.Series(df[col], dtype=dtype)
         return df
 
-    def record_step(self, data: Dict[str, Any]):
-        """기존 datetime 있으면 업데이트, 없으면 새로 추가"""
-        dt = pd.to_datetime(data.get("datetime"))
-        if dt is None:
-            raise ValueError("datetime 값은 반드시 존재해야 합니다.")
-
-        # datetime 기준으로 기존 행 있는지 확인
-        existing_idx = self.df.index[self.df["datetime"] == dt]
+    def record_step(self, data: Dict[str, Any], save: bool = True):
+        """
+        기존 timestamp 있으면 업데이트, 없으면 새로 추가
+
+        "timestamp"(epoch 초) 또는 "datetime"(epoch 초 / KST 문자열) 중 하나는
+        반드시 있어야 하며, datetime 컬럼은 timestamp에서 파생됩니다.
+        REPORT_FIELDS 본문은 ReportStore에 저장하고 해시 컬럼에 키를 기록합니다.
+        save=False면 파일 저장은 호출 측에서 모아서 수행합니다.
+        """
+        value = data.get("timestamp", data.get("datetime"))
+        if value is None:
+            raise ValueError("timestamp 또는 datetime 값은 반드시 존재해야 합니다.")
+        timestamp = to_epoch(value)
+
+        data = {
+            **data,
+            **{
+                f"{field}_hash": self.report_store.add(
+                    self.system_name, timestamp, field, data.get(field)
+                )
+                for field in REPORT_FIELDS
+            },
+        }
 
         row = {}
         for col, dtype in self.column_types.items():
             val = data.get(col, None)
             try:
-                if dtype.startswith("datetime") and val is not None:
-                    row[col] = pd.to_datetime(val)
+                if col == "timestamp":
+                    row[col] = timestamp
+                elif dtype.startswith("datetime"):
+                    row[col] = pd.Timestamp(to_kst_datetime64(timestamp))
                 else:
                     row[col] = pd.Series([val], dtype=dtype)[0]
             except Exception as e:
@@ -74,24 +114,53 @@ class RecordManager:
 
         warnings.filterwarnings("ignore")
 
-        if not existing_idx.empty:
+        idx = self._row_index.get(timestamp)
+        if idx is not None:
             # 이미 존재하면 해당 행 업데이트
-            idx = existing_idx[0]
             for key, value in row.items():
                 self.df.at[idx, key] = value
         else:
             # 존재하지 않으면 새 row 추가
+            idx = len(self.df)
             self.df = pd.concat([self.df, pd.DataFrame([row])], ignore_index=True)
+            self._row_index[timestamp] = idx
 
-        self.save()
+        if save:
+            self.save()
 
     def save(self):
-        self.df = self.df.sort_values(by="datetime")  # 기본은 ascending=True → 오름차순
-        self.df.to_csv(self.file_path, index=False, encoding="utf-8")
+        self.report_store.commit()
+        # 행 인덱스는 그대로 두고 timestamp 순으로 기록 (정수 비교)
+        self.df.sort_values(by="timestamp").to_csv(
+            self.file_path, index=False, encoding="utf-8"
+        )
 
     def get_dataframe(self) -> pd.DataFrame:
         return self.df
 
+    def page(
+        self, offset: int = 0, limit: int = 100
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        메모리의 기록을 timestamp 순으로 잘라 반환합니다(CSV를 다시 읽지 않음).
+        해시로 저장된 리포트/매매 근거는 본문으로 풀어 함께 반환합니다.
+
+        Args:
+            offset (int): 시작 행
+            limit (int): 최대 행 수
+
+        Returns:
+            Tuple[int, List[Dict[str, Any]]]: 전체 행 수, 해당 구간 행 목록 (결측값은 None)
+        """
+        df = self.df  # 백그라운드 기록 중에도 같은 프레임을 보도록 참조를 고정
+        frame = df.sort_values(by="timestamp").iloc[offset : offset + limit]
+        frame = frame.astype(object).where(frame.notna(), None)
+        rows = frame.to_dict(orient="records")
+        for row in rows:
+            for field in REPORT_FIELDS:
+                row[field] = self.report_store.get(row[f"{field}_hash"])
+        return len(df), rows
+
 
 if __name__ == "__main__":
     recorder = RecordManager(system_name="hi")
@@ -0,0 +1,97 @@
+import asyncio
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+
+from v1.core.constants import DEFAULT_RECORD_QUEUE_SIZE
+from v1.system.record_manager import RecordManager
+
+_STOP = object()
+
+
+class AsyncRecordWriter:
+    """
+    RecordManager 기록을 백그라운드 태스크에서 처리하는 비동기 기록기
+
+    매매 루프는 submit()으로 행을 큐에 넣기만 하고 곧바로 다음 스텝의
+    LLM 호출로 넘어갑니다. 소비 태스크 하나가 큐를 순서대로 비우므로
+    기록 순서는 제출 순서와 같으며(ordered commit), 큐가 가득 차면
+    submit()이 대기하여 기록이 밀리지 않도록 합니다(backpressure).
+    CSV 저장은 큐에 쌓인 행을 모아 스레드에서 한 번에 수행합니다.
+    """
+
+    def __init__(
+        self,
+        record_manager: RecordManager,
+        max_pending: int = DEFAULT_RECORD_QUEUE_SIZE,
+    ):
+        self.record_manager = record_manager
+        self.max_pending = max_pending
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # 저장 횟수 (행 수보다 적으면 배치 저장이 일어난 것)
+        self.save_count = 0
+
+    def start(self):
+        """현재 이벤트 루프에서 소비 태스크를 시작합니다."""
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._task = asyncio.create_task(self._consume())
+
+    async def submit(
+        self,
+        row: Dict[str, Any],
+        pending: Optional[Awaitable[Dict[str, Any]]] = None,
+    ):
+        """
+        기록할 행을 큐에 넣습니다.
+
+        Args:
+            row (Dict[str, Any]): RecordManager.record_step에 전달할 행
+            pending (Optional[Awaitable[Dict[str, Any]]]): 아직 끝나지 않은 값
+                (예: 스트리밍 중인 매매 근거). 기록 직전에 기다려 row에 합칩니다.
+        """
+        self.start()
+        if self._task.done():
+            # 소비 태스크가 실패했다면 더 쌓지 않고 바로 예외 전달
+            await self._task
+        await self._queue.put((row, pending))
+
+    async def close(self):
+        """남은 행을 모두 기록한 뒤 소비 태스크를 종료합니다."""
+        if self._task is None:
+            return
+        if not self._task.done():
+            await self._queue.put(_STOP)
+        task, self._task = self._task, None
+        await task
+
+    async def _consume(self):
+        while True:
+            item = await self._queue.get()
+            batch: List[Tuple[Dict[str, Any], Optional[Awaitable]]] = []
+            stop = item is _STOP
+            if not stop:
+                batch.append(item)
+            # 이미 쌓여 있는 행은 한 번에 모아 저장
+            while not stop and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+
+            rows = []
+            for row, pending in batch:
+                if pending is not None:
+                    row = {**row, **(await pending)}
+                rows.append(row)
+            if rows:
+                await asyncio.to_thread(self._commit, rows)
+
+            if stop:
+                return
+
+    def _commit(self, rows: List[Dict[str, Any]]):
+        for row in rows:
+            self.record_manager.record_step(row, save=False)
+        self.record_manager.save()
+        self.save_count += 1
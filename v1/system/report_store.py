@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import zlib
+from typing import Dict, List, Optional
+
+from v1.core.constants import REPORT_STORE_FILE
+from v1.utils.timeline import format_kst
+
+# RecordManager 기록 폴더 (CSV와 같은 위치)
+DEFAULT_RECORD_FOLDER = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "../data")
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    id INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS refs (
+    run TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    field TEXT NOT NULL,
+    blob_id INTEGER NOT NULL REFERENCES blobs(id),
+    PRIMARY KEY (run, timestamp, field)
+);
+CREATE INDEX IF NOT EXISTS refs_blob ON refs(blob_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS blob_text USING fts5(
+    text, content='', tokenize='unicode61'
+);
+"""
+
+
+def content_hash(text: str) -> str:
+    """본문의 SHA-256 해시 (저장소 키)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ReportStore:
+    """
+    분석 리포트/매매 근거 본문을 해시 키로 한 번만 압축 저장하고 전문 검색 색인을 유지합니다.
+
+    - blobs: SHA-256 해시 -> zlib 압축 본문 (같은 본문은 실행/스텝이 달라도 한 번만 저장)
+    - refs: (실행 이름, 캔들 시각, 필드) -> 본문
+    - blob_text: 본문의 FTS5 색인 (contentless, 본문은 blobs에만 보관)
+    기록 CSV에는 본문 대신 해시만 남기며, 여러 실행(프로세스)이 같은 파일을 공유합니다.
+
+    Args:
+        path (str): SQLite 파일 경로
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        # 기록은 백그라운드 스레드(AsyncRecordWriter)에서도 수행되므로 잠금으로 직렬화
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def add(self, run: str, timestamp: int, field: str, text: Optional[str]):
+        """
+        본문을 저장하고 (run, timestamp, field) 참조를 기록합니다. commit()까지 반영되지 않습니다.
+
+        Returns:
+            Optional[str]: 본문 해시 (본문이 비어 있으면 참조를 지우고 None)
+        """
+        with self._lock:
+            if not text:
+                self._conn.execute(
+                    "DELETE FROM refs WHERE run = ? AND timestamp = ? AND field = ?",
+                    (run, timestamp, field),
+                )
+                return None
+            key = content_hash(text)
+            row = self._conn.execute(
+                "SELECT id FROM blobs WHERE hash = ?", (key,)
+            ).fetchone()
+            if row is None:
+                blob_id = self._conn.execute(
+                    "INSERT INTO blobs (hash, size, data) VALUES (?, ?, ?)",
+                    (key, len(text), zlib.compress(text.encode("utf-8"))),
+                ).lastrowid
+                self._conn.execute(
+                    "INSERT INTO blob_text (rowid, text) VALUES (?, ?)",
+                    (blob_id, text),
+                )
+            else:
+                blob_id = row[0]
+            self._conn.execute(
+                "INSERT OR REPLACE INTO refs (run, timestamp, field, blob_id) "
+                "VALUES (?, ?, ?, ?)",
+                (run, timestamp, field, blob_id),
+            )
+            return key
+
+    def commit(self) -> None:
+        with self._lock:
+            self._conn.commit()
+
+    def drop_run(self, run: str) -> None:
+        """실행의 참조를 지웁니다 (본문은 다른 실행이 참조할 수 있어 유지)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM refs WHERE run = ?", (run,))
+            self._conn.commit()
+
+    def get(self, key: Optional[str]) -> Optional[str]:
+        """해시로 본문을 조회합니다 (없으면 None)."""
+        if not key:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM blobs WHERE hash = ?", (key,)
+            ).fetchone()
+        return zlib.decompress(row[0]).decode("utf-8") if row else None
+
+    def search(
+        self,
+        query: str,
+        field: Optional[str] = None,
+        run: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict]:
+        """
+        FTS5 질의(예: '"RSI oversold"', 'RSI AND oversold')와 일치하는 스텝을 찾습니다.
+
+        Args:
+            query (str): FTS5 MATCH 질의
+            field (Optional[str]): "price_analysis_report" 또는 "trading_reason"으로 제한
+            run (Optional[str]): 실행 이름으로 제한
+            limit (int): 최대 결과 수
+
+        Returns:
+            List[Dict]: run, timestamp, field, hash (실행/시각 순)
+        """
+        sql = (
+            "SELECT refs.run, refs.timestamp, refs.field, blobs.hash "
+            "FROM blob_text JOIN refs ON refs.blob_id = blob_text.rowid "
+            "JOIN blobs ON blobs.id = blob_text.rowid WHERE blob_text MATCH ?"
+        )
+        params: list = [query]
+        if field is not None:
+            sql += " AND refs.field = ?"
+            params.append(field)
+        if run is not None:
+            sql += " AND refs.run = ?"
+            params.append(run)
+        sql += " ORDER BY refs.run, refs.timestamp LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {"run": r, "timestamp": ts, "field": f, "hash": key}
+            for r, ts, f, key in rows
+        ]
+
+    def stats(self) -> Dict[str, int]:
+        """저장된 본문 수, 참조 수, 원본/압축 바이트 수"""
+        with self._lock:
+            blobs, raw, packed = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), "
+                "COALESCE(SUM(LENGTH(data)), 0) FROM blobs"
+            ).fetchone()
+            refs = self._conn.execute("SELECT COUNT(*) FROM refs").fetchone()[0]
+        return {
+            "blobs": blobs,
+            "refs": refs,
+            "raw_bytes": raw,
+            "compressed_bytes": packed,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_stores: Dict[str, ReportStore] = {}
+_stores_lock = threading.Lock()
+
+
+def shared_report_store(folder_path: str = DEFAULT_RECORD_FOLDER) -> ReportStore:
+    """기록 폴더별로 하나의 ReportStore를 공유합니다 (같은 프로세스의 여러 실행)."""
+    path = os.path.join(folder_path, REPORT_STORE_FILE)
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = ReportStore(path)
+        return _stores[path]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="기록된 리포트/매매 근거 전문 검색")
+    parser.add_argument("query", help="FTS5 질의 (예: '\"RSI oversold\"')")
+    parser.add_argument("--field", default=None)
+    parser.add_argument("--run", default=None)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument(
+        "--db", default=os.path.join(DEFAULT_RECORD_FOLDER, REPORT_STORE_FILE)
+    )
+    args = parser.parse_args(argv)
+
+    store = ReportStore(args.db)
+    results = store.search(args.query, args.field, args.run, args.limit)
+    for result in results:
+        text = store.get(result["hash"]) or ""
+        print(f"[{result['run']}] {format_kst(result['timestamp'])} {result['field']}")
+        print(f"  {text[:200].replace(chr(10), ' ')}")
+    print(f"{len(results)}건")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
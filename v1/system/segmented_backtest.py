@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from v1.core.candle_store import CandleStore
+from v1.core.constants import DEFAULT_BACKTEST_SEGMENTS, DEFAULT_EXCHANGE_CONCURRENCY
+from v1.core.data_analyzer import DataAnalyzer
+from v1.system.crypto_trading_system import CryptoTradingSystem
+from v1.utils.lazy_import import lazy_module
+from v1.utils.model_utils import model_client_pool
+from v1.utils.time_utils import calculate_elapsed_time
+from v1.utils.timeline import format_kst, to_epoch, unit_seconds
+
+pd = lazy_module("pandas")
+
+
+def split_segments(
+    start_date: str, end_date: str, candle_unit: str, segments: int
+) -> List[Tuple[str, str]]:
+    """
+    [start_date, end_date] 구간을 캔들 경계에 맞춰 segments개의 연속 구간으로 나눕니다.
+
+    구간 k의 종료 캔들은 구간 k+1의 시작 캔들과 같습니다(마지막 스텝이 그 캔들 시가에 체결).
+
+    Args:
+        start_date (str): 시작 날짜 (예: "2020-10-01 09:00:00")
+        end_date (str): 종료 날짜
+        candle_unit (str): 캔들 단위
+        segments (int): 구간 수 (스텝 수보다 많으면 스텝 수로 줄어듦)
+
+    Returns:
+        List[Tuple[str, str]]: 구간별 (시작 날짜, 종료 날짜)
+    """
+    step = unit_seconds(candle_unit)
+    start_ts = to_epoch(start_date)
+    start_ts -= start_ts % step
+    steps = (to_epoch(end_date) - start_ts) // step
+    segments = max(1, min(segments, steps))
+    bounds = [start_ts + steps * k // segments * step for k in range(segments)]
+    bounds.append(start_ts + steps * step)
+    return [(format_kst(lo), format_kst(hi)) for lo, hi in zip(bounds, bounds[1:])]
+
+
+class SegmentedBacktest:
+    """
+    긴 백테스트 구간을 여러 구간으로 나눠 동시에 실행하고 결과를 하나로 이어 붙입니다.
+
+    - 구간마다 CryptoTradingSystem을 하나씩 만들고, 각 구간은 자체 워밍업 캔들과
+      빈 포트폴리오(전액 현금)로 시작합니다. 구간 끝에서는 보유 코인을 청산합니다.
+    - 모든 구간이 하나의 CandleStore를 공유하여 캔들은 한 번만 내려받습니다.
+    - LLM 동시 요청 수는 모델 클라이언트 풀(llm_concurrency)로 제한되므로,
+      처리량은 허용한 동시 요청 수에 비례해 늘어납니다.
+    - 이어 붙인 기록("{name}_stitched.csv")에는 segment/segment_start 컬럼과,
+      구간 수익을 복리로 이어 붙인 총자산(stitched_asset_value)이 추가됩니다.
+
+    Args:
+        system_name (str): 실행 이름 (구간 기록은 "{system_name}_seg{k}")
+        segments (int): 구간 수
+        max_concurrent_segments (Optional[int]): 동시에 실행할 구간 수 (None이면 전체)
+        llm_concurrency (Optional[Dict[str, int]]): 백엔드별 LLM 동시 요청 수 상한
+        exchange_concurrency (int): 거래소 동시 요청 수 상한
+        **system_kwargs: 구간별 CryptoTradingSystem에 전달할 설정
+            (initial_cash, fee_rate, coin, start_date, end_date, candle_unit, limit 등)
+    """
+
+    def __init__(
+        self,
+        system_name: str,
+        segments: int = DEFAULT_BACKTEST_SEGMENTS,
+        max_concurrent_segments: Optional[int] = None,
+        llm_concurrency: Optional[Dict[str, int]] = None,
+        exchange_concurrency: int = DEFAULT_EXCHANGE_CONCURRENCY,
+        **system_kwargs: Any,
+    ):
+        self.system_name = system_name
+        self.system_kwargs = system_kwargs
+        self.llm_concurrency = llm_concurrency or {}
+        self.candle_store = system_kwargs.pop("candle_store", None) or CandleStore(
+            exchange_concurrency=exchange_concurrency
+        )
+        self.bounds = split_segments(
+            system_kwargs["start_date"],
+            system_kwargs["end_date"],
+            system_kwargs["candle_unit"],
+            segments,
+        )
+        self.max_concurrent_segments = max_concurrent_segments or len(self.bounds)
+        self.systems = [
+            CryptoTradingSystem(
+                system_name=f"{system_name}_seg{idx}",
+                candle_store=self.candle_store,
+                **{**system_kwargs, "start_date": start, "end_date": end},
+            )
+            for idx, (start, end) in enumerate(self.bounds)
+        ]
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        모든 구간을 동시에 실행한 뒤 기록과 성과 지표를 이어 붙입니다.
+
+        Returns:
+            Dict[str, Any]: "segments"(구간별 성과 표), "metrics"(이어 붙인 전체 성과 지표)
+        """
+        load_dotenv()
+        model_client_pool.max_inflight.update(self.llm_concurrency)
+        start_time = time.time()
+
+        try:
+            # 1) 워밍업을 포함한 전체 구간을 한 번만 수집
+            first = self.systems[0]
+            await self.candle_store.prefetch(
+                first.coin,
+                first.warmup_start_date(),
+                self.systems[-1].end_date,
+                first.candle_unit,
+            )
+            print(
+                f"[Segments] {self.system_name}: {len(self.systems)}개 구간 "
+                f"(동시 {self.max_concurrent_segments}개)"
+            )
+
+            # 2) 구간 동시 실행 (하나라도 실패하면 이어 붙일 수 없으므로 예외 전달)
+            semaphore = asyncio.Semaphore(self.max_concurrent_segments)
+
+            async def _run_one(system: CryptoTradingSystem):
+                async with semaphore:
+                    try:
+                        await system.run()
+                    finally:
+                        system.event_logger.stop()
+
+            await asyncio.gather(*(_run_one(system) for system in self.systems))
+        finally:
+            await model_client_pool.close()
+
+        result = self.stitch()
+        end_time = time.time()
+        elapsed_day, elapsed_hour, elapsed_minute, elapsed_second = (
+            calculate_elapsed_time(start_time, end_time)
+        )
+        print(
+            f"총 소요 시간: {elapsed_day}일 {elapsed_hour}시간 {elapsed_minute}분 {elapsed_second}초"
+        )
+        return result
+
+    def stitch(self) -> Dict[str, Any]:
+        """
+        구간별 기록을 하나의 CSV로 이어 붙이고 전체 성과 지표를 계산합니다.
+
+        구간 k의 총자산은 직전 구간까지의 누적 수익 배율(청산 후 현금 / 초기 현금의 곱)을 곱해
+        이어 붙이므로, 구간마다 새로 시작해도 전체 기간의 복리 수익 곡선이 됩니다.
+        승률과 거래 수는 구간 경계를 넘는 매수/매도 쌍이 생기지 않도록 구간별 값을 합산합니다.
+        """
+        initial_cash = self.systems[0].initial_cash
+        factor = 1.0
+        frames, records, rows = [], [], []
+        for idx, system in enumerate(self.systems):
+            analyzer = system.analyzer()
+            metrics = analyzer.performance_metrics()
+            final_cash = system.portfolio_manager.current_cash
+            rows.append(
+                {
+                    "segment": idx,
+                    "start_date": system.start_date,
+                    "end_date": system.end_date,
+                    "steps": len(analyzer.df),
+                    "final_cash": final_cash,
+                    **metrics,
+                }
+            )
+
+            frame = analyzer.df[
+                [
+                    "timestamp",
+                    "open",
+                    "high",
+                    "low",
+                    "close",
+                    "volume",
+                    "current_cash",
+                    "current_position",
+                ]
+            ].copy()
+            frame["current_cash"] *= factor
+            frame["current_position"] *= factor
+            frame["next_action"] = 0  # 매매 쌍은 구간별 지표에서 집계
+            frames.append(frame)
+
+            record = pd.read_csv(system.record_manager.file_path)
+            if idx < len(self.systems) - 1:
+                # 마지막(청산 후) 행은 다음 구간의 첫 행과 같은 캔들
+                record = record.iloc[:-1]
+            record.insert(0, "segment", idx)
+            record.insert(1, "segment_start", record.index == 0)
+            record["stitched_asset_value"] = (
+                record["current_cash"] + record["current_position"] * record["close"]
+            ) * factor
+            records.append(record)
+
+            factor *= final_cash / initial_cash
+
+        segments = pd.DataFrame(rows)
+        metrics = DataAnalyzer.from_dataframe(
+            pd.concat(frames, ignore_index=True)
+        ).performance_metrics()
+        total_trades = int(segments["total_trades"].sum())
+        wins = (segments["win_rate"] * segments["total_trades"] / 100).sum()
+        metrics["total_trades"] = total_trades
+        metrics["win_rate"] = round(wins / total_trades * 100, 2) if total_trades else 0
+
+        folder_path = self.systems[0].record_manager.folder_path
+        stitched_path = os.path.join(folder_path, f"{self.system_name}_stitched.csv")
+        pd.concat(records, ignore_index=True).to_csv(
+            stitched_path, index=False, encoding="utf-8"
+        )
+        segments_path = os.path.join(folder_path, f"{self.system_name}_segments.csv")
+        segments.to_csv(segments_path, index=False, encoding="utf-8")
+
+        print(f"***구간별 성과 지표 ({segments_path})***")
+        print(segments.to_string(index=False))
+        print(f"***구간 연결 전체 성과 지표 ({stitched_path})***")
+        print(f"최종 수익률: {metrics['return_pct']:.2f}%")
+        print(f"최대 낙폭: {metrics['mdd']:.2f}%")
+        print(f"승률: {metrics['win_rate']}% ({metrics['total_trades']})")
+        print(f"샤프 지수: {metrics['sharpe_index']:.2f}\n")
+        return {"segments": segments, "metrics": metrics}
+
+
+if __name__ == "__main__":
+    asyncio.run(
+        SegmentedBacktest(
+            system_name="segmented",
+            segments=4,
+            llm_concurrency={"openai": 8, "ollama": 2},
+            initial_cash=10_000_000,
+            fee_rate=0.08,
+            coin="KRW-BTC",
+            start_date="2020-10-01 09:00:00",
+            end_date="2021-04-13 09:00:00",
+            candle_unit="1d",
+            limit=40,
+        ).run()
+    )
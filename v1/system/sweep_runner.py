@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+import yaml
+from dotenv import load_dotenv
+
+from v1.core.candle_store import CandleStore
+from v1.system.crypto_trading_system import CryptoTradingSystem
+from v1.utils.lazy_import import lazy_module
+from v1.utils.model_utils import model_client_pool
+
+pd = lazy_module("pandas")
+
+
+def _compute_metrics(system: CryptoTradingSystem) -> Dict[str, Any]:
+    """실행이 끝난 시스템의 원장에서 성과 지표를 계산합니다 (기록 CSV를 다시 읽지 않음)."""
+    analyzer = system.analyzer()
+    metrics = analyzer.performance_metrics()
+    metrics["n_rows"] = len(analyzer.df)
+    return metrics
+
+
+class SweepRunner:
+    """
+    YAML 그리드로 정의된 여러 CryptoTradingSystem 실행을 동시에 수행합니다.
+
+    - base의 설정에 grid의 모든 조합(카테시안 곱)을 덮어써 실행 목록 생성
+    - 모든 실행이 하나의 CandleStore를 공유하여 마켓 구간별로 한 번만 다운로드
+    - 동시 실행 수는 asyncio 세마포어로, LLM 동시 요청 수는 모델 클라이언트 풀로 제한
+    - 실행별 기록은 "{name}_{번호}" 레코드로 저장되고, 성과 지표는 실행이 끝난 시스템의 원장에서 계산
+    - 모든 실행의 설정과 성과 지표를 "{name}_summary.csv"로 저장
+
+    Example YAML:
+        name: model_comparison
+        max_concurrent_runs: 4
+        exchange_concurrency: 2
+        llm_concurrency:
+          openai: 8
+          ollama: 2
+        base:
+          initial_cash: 10000000
+          fee_rate: 0.08
+          coin: KRW-BTC
+          start_date: "2020-10-01 09:00:00"
+          end_date: "2021-04-13 09:00:00"
+          candle_unit: 1d
+          limit: 40
+        grid:
+          coin: [KRW-BTC, KRW-ETH]
+          trading_model: [gpt-4o-mini, qwen3:8b]
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.name = config.get("name", "sweep")
+        self.base: Dict[str, Any] = config.get("base", {})
+        self.grid: Dict[str, List[Any]] = config.get("grid", {})
+        self.max_concurrent_runs: int = config.get("max_concurrent_runs", 4)
+        self.llm_concurrency: Dict[str, int] = config.get("llm_concurrency", {})
+        self.candle_store = CandleStore(
+            exchange_concurrency=config.get("exchange_concurrency", 2)
+        )
+
+    @classmethod
+    def from_yaml(cls, path: str) -> "SweepRunner":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(yaml.safe_load(f))
+
+    def expand_grid(self) -> List[Dict[str, Any]]:
+        """base 설정에 grid의 모든 조합을 적용한 실행별 설정 목록을 반환합니다."""
+        keys = list(self.grid)
+        runs = []
+        for values in itertools.product(*(self.grid[key] for key in keys)):
+            params = dict(self.base)
+            params.update(zip(keys, values))
+            runs.append(params)
+        return runs
+
+    async def run(self) -> pd.DataFrame:
+        """
+        모든 실행을 동시에 수행하고, 실행별 설정과 성과 지표를 합친 표를 반환합니다.
+        """
+        load_dotenv()
+        model_client_pool.max_inflight.update(self.llm_concurrency)
+
+        runs = self.expand_grid()
+        systems = [
+            CryptoTradingSystem(
+                system_name=f"{self.name}_{idx:03d}",
+                candle_store=self.candle_store,
+                **params,
+            )
+            for idx, params in enumerate(runs)
+        ]
+
+        try:
+            # 1) 마켓 구간별로 한 번씩만 미리 수집
+            market_ranges = {
+                (
+                    system.coin,
+                    system.warmup_start_date(),
+                    system.end_date,
+                    system.candle_unit,
+                )
+                for system in systems
+            }
+            await asyncio.gather(
+                *(
+                    self.candle_store.prefetch(*market_range)
+                    for market_range in market_ranges
+                )
+            )
+            print(
+                f"[Sweep] {len(systems)}개 실행, {len(market_ranges)}개 마켓 구간 수집 완료"
+            )
+
+            # 2) 실행 동시 수행
+            semaphore = asyncio.Semaphore(self.max_concurrent_runs)
+
+            async def _run_one(system: CryptoTradingSystem) -> Optional[str]:
+                async with semaphore:
+                    try:
+                        await system.run()
+                        return None
+                    except Exception as e:
+                        print(f"[Error] {system.system_name} 실행 실패: {e}")
+                        return str(e)
+                    finally:
+                        system.event_logger.stop()
+
+            errors = await asyncio.gather(*(_run_one(system) for system in systems))
+        finally:
+            await model_client_pool.close()
+
+        # 3) 성과 지표 계산 (실행 시 출력한 지표와 같은 스텝 기준)
+        rows = []
+        for system, params, error in zip(systems, runs, errors):
+            row = {"system_name": system.system_name, **params, "error": error}
+            if error is None:
+                row.update(_compute_metrics(system))
+            rows.append(row)
+        table = pd.DataFrame(rows)
+
+        summary_path = os.path.join(
+            systems[0].record_manager.folder_path, f"{self.name}_summary.csv"
+        )
+        table.to_csv(summary_path, index=False, encoding="utf-8")
+        print(f"***스윕 결과 ({summary_path})***")
+        print(table.to_string(index=False))
+        return table
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python -m v1.system.sweep_runner <sweep.yaml>")
+        sys.exit(1)
+    asyncio.run(SweepRunner.from_yaml(sys.argv[1]).run())
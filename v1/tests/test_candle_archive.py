@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+import v1.core.data_collector as data_collector
+from v1.core.candle_archive import CandleArchive
+from v1.core.data_collector import fetch_archived_candles, fetch_candles
+from v1.utils.timeline import to_epoch
+
+DAY = 86400
+START = "2021-01-01 09:00:00"
+END = "2021-01-10 09:00:00"
+
+
+def make_candles(start_ts, count):
+    return [
+        {
+            "date": "",
+            "timestamp": start_ts + i * DAY,
+            "open": 100.0 + i,
+            "high": 110.0 + i,
+            "low": 90.0 + i,
+            "close": 105.0 + i,
+            "volume": 1.0,
+        }
+        for i in range(count)
+    ]
+
+
+def patch_fetch(monkeypatch, candles):
+    calls = []
+
+    async def fake_fetch(coin, start, end, candle_unit, strict=False):
+        calls.append((start, end, strict))
+        return candles
+
+    monkeypatch.setattr(data_collector, "fetch_candles", fake_fetch)
+    return calls
+
+
+def test_partial_fetch_marks_only_received_span(tmp_path, monkeypatch):
+    archive = CandleArchive(str(tmp_path))
+    t0, t_end = to_epoch(START), to_epoch(END)
+    # 뒤쪽 5일만 받은 경우 (예: 중간에 빈 페이지로 수집 중단)
+    calls = patch_fetch(monkeypatch, make_candles(t0 + 5 * DAY, 5))
+
+    candles = asyncio.run(fetch_archived_candles(archive, "KRW-X", START, END, "1d"))
+
+    assert calls == [(t0, t_end, True)]
+    assert [c["timestamp"] for c in candles] == [t0 + i * DAY for i in range(5, 10)]
+    assert not any(c["filled"] for c in candles)
+    assert archive._read_index(archive._dir("KRW-X", "1d"))["covered"] == [
+        [t0 + 5 * DAY, t_end]
+    ]
+    # 받지 못한 앞쪽 구간은 다음 호출에서 다시 수집
+    assert archive.missing_ranges("KRW-X", "1d", t0, t_end) == [(t0, t0 + 4 * DAY)]
+
+
+def test_empty_fetch_leaves_range_missing(tmp_path, monkeypatch):
+    archive = CandleArchive(str(tmp_path))
+    t0, t_end = to_epoch(START), to_epoch(END)
+    patch_fetch(monkeypatch, [])
+
+    assert asyncio.run(fetch_archived_candles(archive, "KRW-X", START, END, "1d")) == []
+
+    index = archive._read_index(archive._dir("KRW-X", "1d"))
+    assert index["count"] == 0
+    assert not index["covered"]
+    assert archive.missing_ranges("KRW-X", "1d", t0, t_end) == [(t0, t_end)]
+
+
+def test_write_without_candles_records_nothing(tmp_path):
+    archive = CandleArchive(str(tmp_path))
+    t0 = to_epoch(START)
+
+    archive.write("KRW-X", "1d", [], (t0, t0 + 9 * DAY))
+
+    assert archive.missing_ranges("KRW-X", "1d", t0, t0 + 9 * DAY) == [
+        (t0, t0 + 9 * DAY)
+    ]
+
+
+def test_strict_fetch_raises_on_http_error(monkeypatch):
+    class Response:
+        status_code = 500
+        headers = {}
+        text = "server error"
+
+    monkeypatch.setattr(
+        data_collector.requests, "get", lambda url, *args, **kwargs: Response()
+    )
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(fetch_candles("KRW-X", START, END, "1d", strict=True))
+    # 기본값은 기존처럼 경고만 출력하고 받은 캔들까지 반환
+    assert asyncio.run(fetch_candles("KRW-X", START, END, "1d")) == []
@@ -0,0 +1,360 @@
+import atexit
+import json
+import logging
+import os
+import queue
+from contextvars import ContextVar, Token
+from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional
+
+from v1.core.constants import DEFAULT_VERBOSITY
+
+# 세부 분석 내용(리포트, 매매 근거) 레벨: INFO와 DEBUG 사이
+DETAIL = 15
+logging.addLevelName(DETAIL, "DETAIL")
+
+# 콘솔 출력 상세도 -> 로깅 레벨
+#   0: 경고만 출력 (JSONL에는 모두 기록)
+#   1: 매매 요약
+#   2: + 분석 리포트, 매매 근거
+#   3: + 도구 호출 내역
+VERBOSITY_LEVELS = {0: logging.WARNING, 1: logging.INFO, 2: DETAIL, 3: logging.DEBUG}
+
+
+class EventType(str, Enum):
+    RUN_START = "run_start"
+    STEP_START = "step_start"
+    TOOL_CALL = "tool_call"
+    ANALYSIS = "analysis"
+    SIGNAL = "signal"
+    TRADE = "trade"
+    STEP_END = "step_end"
+    METRICS = "metrics"
+    RUN_END = "run_end"
+    MISSED_CANDLES = "missed_candles"
+    DEADLINE_EXCEEDED = "deadline_exceeded"
+    LLM_HEDGE = "llm_hedge"
+    LLM_TIMEOUT = "llm_timeout"
+    LLM_CALL = "llm_call"
+
+
+EVENT_LEVELS = {
+    EventType.RUN_START: logging.INFO,
+    EventType.STEP_START: logging.DEBUG,
+    EventType.TOOL_CALL: logging.DEBUG,
+    EventType.ANALYSIS: DETAIL,
+    EventType.SIGNAL: DETAIL,
+    EventType.TRADE: logging.INFO,
+    EventType.STEP_END: logging.DEBUG,
+    EventType.METRICS: logging.INFO,
+    EventType.RUN_END: logging.INFO,
+    EventType.MISSED_CANDLES: logging.WARNING,
+    EventType.DEADLINE_EXCEEDED: logging.WARNING,
+    EventType.LLM_HEDGE: logging.DEBUG,
+    EventType.LLM_TIMEOUT: logging.WARNING,
+    EventType.LLM_CALL: logging.DEBUG,
+}
+
+# 실행 시작/종료 요약은 시스템이 직접 출력하므로 콘솔 렌더러에서는 생략
+_RUN_EVENTS = {EventType.RUN_START, EventType.METRICS, EventType.RUN_END}
+_SIGNAL_NAMES = {1: "Buy", 0: "Hold", -1: "Sell"}
+
+
+def event_to_dict(record: logging.LogRecord) -> Dict[str, Any]:
+    """이벤트 레코드를 JSONL 한 줄과 같은 구조의 dict로 변환합니다."""
+    return {
+        "ts": round(record.created, 6),
+        "event": record.msg,
+        "system": record.name.split(".", 2)[-1],
+        **record.event_fields,
+    }
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """이벤트를 한 줄짜리 JSON으로 직렬화합니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps(
+            event_to_dict(record), ensure_ascii=False, default=_json_default
+        )
+
+
+def _json_default(value: Any) -> Any:
+    # numpy 스칼라 등은 파이썬 기본 타입으로 변환
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+class ConsoleRenderer(logging.Handler):
+    """이벤트를 사람이 읽기 쉬운 형태로 콘솔에 출력합니다."""
+
+    def emit(self, record: logging.LogRecord):
+        event_type = EventType(record.msg)
+        if event_type in _RUN_EVENTS:
+            return
+        try:
+            text = self.render(event_type, record.event_fields)
+            if text:
+                print(text)
+        except Exception:
+            self.handleError(record)
+
+    def render(self, event_type: EventType, fields: Dict[str, Any]) -> str:
+        if event_type == EventType.TOOL_CALL:
+            lines = [f"[Step {fields['index']}] {fields['message_type']}:"]
+            lines.append(f" - Source: {fields['source']}")
+            if "function" in fields:
+                lines.append(f" - Function: {fields['function']}")
+                lines.append(f" - Arguments: {fields['arguments']}")
+            if "result" in fields:
+                lines.append(f" - Result: {fields['result']}...")
+            return "\n".join(lines)
+        if event_type == EventType.ANALYSIS:
+            return (
+                "-------------- 가격 분석 전문가 (PriceAnalysisExpert) ---------------\n"
+                f"\n{fields['report']}\n\n"
+                f"응답 소요 시간: {fields['elapsed']:.2f}초"
+            )
+        if event_type == EventType.SIGNAL:
+            votes = ""
+            if "votes" in fields:
+                tally = fields["votes"]
+                votes = (
+                    "# Votes: "
+                    + " / ".join(
+                        f"{_SIGNAL_NAMES[signal]} {tally[str(signal)]}"
+                        for signal in (1, 0, -1)
+                    )
+                    + f" ({tally['completed']}/{tally['samples']} 완료)\n"
+                )
+            return (
+                "-------------------- 투자 전문가 (TradingExpert) --------------------\n"
+                f"\n# Signal: {_SIGNAL_NAMES.get(fields['signal'], fields['signal'])}\n"
+                f"{votes}"
+                f"# Reason:\n{fields['reasons']}\n\n"
+                f"응답 소요 시간: {fields['elapsed']:.2f}초"
+            )
+        if event_type == EventType.TRADE:
+            coin = f" [{fields['coin']}]" if "coin" in fields else ""
+            return (
+                f"-------------- {fields['date']} 기준 포트폴리오 현황{coin} -------------\n"
+                f"Position: {_SIGNAL_NAMES.get(fields['signal'], fields['signal'])}"
+                f"{' (gated)' if fields.get('gated') else ''}\n"
+                f"Cash: {fields['cash']}, Amount of Coins: {fields['position']}\n"
+                "---------------------------------------------------------------------"
+            )
+        if event_type == EventType.STEP_START:
+            return f"[{fields['date']}] 스텝 시작"
+        if event_type == EventType.STEP_END:
+            return f"[{fields['date']}] 스텝 종료 ({fields['elapsed']:.2f}초)"
+        if event_type == EventType.MISSED_CANDLES:
+            return (
+                f"[Warning] 캔들 경계 {fields['skipped']}개를 놓쳤습니다 "
+                f"(지연 {fields['drift']:.2f}초), {fields['date']}부터 재개합니다."
+            )
+        if event_type == EventType.DEADLINE_EXCEEDED:
+            return (
+                f"[Warning] {fields['date']} 의사결정이 마감 시한을 넘겨 "
+                f"{_SIGNAL_NAMES.get(fields.get('signal', 0))}로 대체합니다 ({fields['stage']})."
+            )
+        if event_type == EventType.LLM_HEDGE:
+            return (
+                f"[Hedge] {fields['model']} 응답이 {fields['delay']:.2f}초를 넘겨 "
+                f"{fields['hedge_model']}로 중복 요청, {fields['winner']} 응답 사용 "
+                f"({fields['elapsed']:.2f}초)"
+            )
+        if event_type == EventType.LLM_TIMEOUT:
+            return (
+                f"[Warning] {fields['model']} 호출이 마감 시한 "
+                f"{fields['deadline']:g}초를 넘겨 취소되었습니다."
+            )
+        if event_type == EventType.LLM_CALL:
+            cache = (
+                f", 캐시 {fields['cached_tokens']}토큰"
+                if "cached_tokens" in fields
+                else ""
+            )
+            if "prefill_tokens" in fields:
+                cache += f", 프리필 {fields['prefill_tokens']}토큰"
+            ttft = f", 첫 토큰 {fields['ttft']:.2f}초" if "ttft" in fields else ""
+            return (
+                f"[LLM] {fields['model']} 프롬프트 {fields['prompt_tokens']}토큰"
+                f"{cache}{ttft} ({fields['elapsed']:.2f}초)"
+            )
+        return ""
+
+
+class RichConsoleRenderer(ConsoleRenderer):
+    """rich가 설치되어 있을 때 색상/패널로 이벤트를 출력합니다."""
+
+    def __init__(self):
+        super().__init__()
+        from rich.console import Console
+
+        self.console = Console()
+
+    def emit(self, record: logging.LogRecord):
+        event_type = EventType(record.msg)
+        if event_type in _RUN_EVENTS:
+            return
+        try:
+            from rich.panel import Panel
+
+            text = self.render(event_type, record.event_fields)
+            if not text:
+                return
+            if event_type in (EventType.ANALYSIS, EventType.SIGNAL):
+                title, _, body = text.partition("\n")
+                self.console.print(
+                    Panel(body.strip(), title=title.strip("- "), expand=False),
+                    markup=False,
+                )
+            else:
+                self.console.print(text, markup=False, highlight=False)
+        except Exception:
+            self.handleError(record)
+
+
+class EventLogger:
+    """
+    타입이 정해진 이벤트를 백그라운드 큐로 기록하는 구조화 로거
+
+    매매 루프는 QueueHandler로 레코드를 큐에 넣기만 하고,
+    JSONL 파일 쓰기와 콘솔 출력은 QueueListener 스레드가 처리합니다.
+
+    Args:
+        name (str): 시스템명 (이벤트의 system 필드)
+        path (Optional[str]): JSONL 파일 경로, None이면 파일 기록 안 함
+        verbosity (int): 콘솔 출력 상세도 (0~3)
+        console (bool): 콘솔 렌더러 사용 여부
+        rich_console (bool): rich 렌더러 사용 여부 (미설치 시 일반 렌더러)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        path: Optional[str] = None,
+        verbosity: int = DEFAULT_VERBOSITY,
+        console: bool = True,
+        rich_console: bool = False,
+    ):
+        self.name = name
+        self.path = path
+        self.verbosity = verbosity
+
+        handlers: List[logging.Handler] = []
+        if path is not None:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            file_handler = logging.FileHandler(
+                path, mode="w", encoding="utf-8", delay=True
+            )
+            file_handler.setFormatter(JsonLinesFormatter())
+            file_handler.setLevel(logging.DEBUG)
+            handlers.append(file_handler)
+        if console:
+            renderer: logging.Handler = ConsoleRenderer()
+            if rich_console:
+                try:
+                    renderer = RichConsoleRenderer()
+                except ImportError:
+                    pass
+            renderer.setLevel(
+                VERBOSITY_LEVELS.get(verbosity, VERBOSITY_LEVELS[DEFAULT_VERBOSITY])
+            )
+            handlers.append(renderer)
+        self.handlers = handlers
+
+        self._logger = logging.getLogger(f"v1.events.{name}")
+        self._logger.propagate = False
+        self._logger.setLevel(
+            min((handler.level for handler in handlers), default=logging.CRITICAL + 1)
+        )
+        self._queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+        self._listener: Optional[QueueListener] = None
+
+    def add_handler(self, handler: logging.Handler):
+        """
+        이벤트를 받을 핸들러를 추가합니다(예: 제어 서버의 진행 상황 스트림).
+        start() 전에 호출해야 리스너에 포함됩니다.
+        """
+        self.handlers.append(handler)
+        self._logger.setLevel(min(self._logger.level, handler.level or logging.DEBUG))
+
+    def start(self):
+        if self._listener is not None:
+            return
+        for handler in list(self._logger.handlers):
+            self._logger.removeHandler(handler)
+        self._logger.addHandler(QueueHandler(self._queue))
+        self._listener = QueueListener(
+            self._queue, *self.handlers, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def stop(self):
+        """큐에 남은 이벤트를 모두 기록하고 리스너를 종료합니다."""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        self._listener = None
+        for handler in self.handlers:
+            handler.flush()
+            if isinstance(handler, logging.FileHandler):
+                handler.close()
+
+    def is_enabled(self, event_type: EventType) -> bool:
+        """해당 이벤트를 받을 핸들러가 있는지 (큰 페이로드 생성 전 확인용)"""
+        return self._logger.isEnabledFor(EVENT_LEVELS[event_type])
+
+    def emit(self, event_type: EventType, **fields: Any):
+        if self._listener is None:
+            self.start()
+        level = EVENT_LEVELS[event_type]
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, event_type.value, extra={"event_fields": fields})
+
+
+_current_logger: ContextVar[Optional[EventLogger]] = ContextVar(
+    "event_logger", default=None
+)
+_default_logger: Optional[EventLogger] = None
+
+
+def bind_event_logger(event_logger: EventLogger) -> Token:
+    """
+    현재 컨텍스트(및 이후 생성되는 태스크)의 이벤트 로거를 지정합니다.
+    여러 시스템이 한 프로세스에서 동시에 실행되어도 각자의 로그로 기록됩니다.
+    """
+    event_logger.start()
+    return _current_logger.set(event_logger)
+
+
+def unbind_event_logger(token: Token):
+    _current_logger.reset(token)
+
+
+def get_event_logger() -> EventLogger:
+    """바인딩된 로거가 없으면 콘솔 전용 기본 로거를 반환합니다."""
+    global _default_logger
+    event_logger = _current_logger.get()
+    if event_logger is not None:
+        return event_logger
+    if _default_logger is None:
+        _default_logger = EventLogger(
+            name="default",
+            verbosity=int(os.getenv("EVENT_LOG_VERBOSITY", DEFAULT_VERBOSITY)),
+        )
+        _default_logger.start()
+        atexit.register(_default_logger.stop)
+    return _default_logger
+
+
+def log_event(event_type: EventType, **fields: Any):
+    """현재 컨텍스트의 이벤트 로거로 이벤트를 기록합니다."""
+    get_event_logger().emit(event_type, **fields)
+
+
+def event_enabled(event_type: EventType) -> bool:
+    return get_event_logger().is_enabled(event_type)
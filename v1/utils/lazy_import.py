@@ -0,0 +1,28 @@
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_module(name: str) -> ModuleType:
+    """
+    속성에 처음 접근할 때 실제로 로드되는 모듈을 반환합니다.
+
+    pandas, talib처럼 무거운 최상위 패키지를 모듈 수준에서 `pd = lazy_module("pandas")`
+    형태로 선언해 두면, 해당 기능을 쓰지 않는 실행(CLI, 워커 프로세스 등)은
+    import 비용을 치르지 않습니다. 이미 로드된 모듈이면 그대로 반환합니다.
+
+    주의: 모듈 수준 타입 힌트에서 속성을 참조하면 즉시 로드되므로
+    `from __future__ import annotations`와 함께 사용합니다.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,101 @@
+import math
+from typing import Dict, List
+
+from v1.core.constants import RSI_OVERBOUGHT, RSI_OVERSOLD
+from v1.utils.lazy_import import lazy_module
+from v1.utils.ta_functions import get_column
+
+talib = lazy_module("talib")
+
+
+def compute_market_features(price_data: List[Dict]) -> Dict:
+    """
+    LLM 호출 없이 계산 가능한 가벼운 시장 특징값을 계산합니다.
+
+    Args:
+        price_data (List[Dict]): 수집된 가격 데이터 (date, open, high, low, close, volume)
+
+    Returns:
+        Dict: close, rsi, rsi_zone, macd_above_signal, band_position, atr
+            데이터가 부족해 계산할 수 없는 값은 nan 또는 "unknown"
+    """
+    highs = get_column(price_data, "high")
+    lows = get_column(price_data, "low")
+    closes = get_column(price_data, "close")
+
+    rsi = talib.RSI(closes, timeperiod=14)[-1]
+    macd, macd_signal, _ = talib.MACD(
+        closes, fastperiod=12, slowperiod=26, signalperiod=9
+    )
+    upperband, _, lowerband = talib.BBANDS(closes, timeperiod=20, nbdevup=2, nbdevdn=2)
+    atr = talib.ATR(highs, lows, closes, timeperiod=14)[-1]
+    close = closes[-1]
+
+    if math.isnan(rsi):
+        rsi_zone = "unknown"
+    elif rsi > RSI_OVERBOUGHT:
+        rsi_zone = "overbought"
+    elif rsi < RSI_OVERSOLD:
+        rsi_zone = "oversold"
+    else:
+        rsi_zone = "neutral"
+
+    if math.isnan(macd[-1]) or math.isnan(macd_signal[-1]):
+        macd_above_signal = None
+    else:
+        macd_above_signal = bool(macd[-1] > macd_signal[-1])
+
+    if math.isnan(upperband[-1]) or math.isnan(lowerband[-1]):
+        band_position = "unknown"
+    elif close > upperband[-1]:
+        band_position = "above"
+    elif close < lowerband[-1]:
+        band_position = "below"
+    else:
+        band_position = "inside"
+
+    return {
+        "close": float(close),
+        "rsi": float(rsi),
+        "rsi_zone": rsi_zone,
+        "macd_above_signal": macd_above_signal,
+        "band_position": band_position,
+        "atr": float(atr),
+    }
+
+
+def indicator_consensus(features: Dict) -> int:
+    """
+    RSI 구간, MACD 위치, 볼린저 밴드 이탈로 단순 다수결 방향을 계산합니다.
+
+    각 지표는 매수(+1) / 매도(-1) / 중립(0) 중 하나로 투표하며,
+    두 표 이상이 같은 방향일 때만 해당 방향을 반환합니다.
+
+    Args:
+        features (Dict): compute_market_features의 결과
+
+    Returns:
+        int: 1(매수), 0(합의 없음), -1(매도)
+    """
+    votes = []
+    if features["rsi_zone"] == "oversold":
+        votes.append(1)
+    elif features["rsi_zone"] == "overbought":
+        votes.append(-1)
+
+    if features["macd_above_signal"] is True:
+        votes.append(1)
+    elif features["macd_above_signal"] is False:
+        votes.append(-1)
+
+    if features["band_position"] == "below":
+        votes.append(1)
+    elif features["band_position"] == "above":
+        votes.append(-1)
+
+    # 순합이 아니라 같은 방향 표 수로 판단 (+1, +1, -1도 매수 합의)
+    if votes.count(1) >= 2:
+        return 1
+    if votes.count(-1) >= 2:
+        return -1
+    return 0
@@ -1,19 +1,807 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
 import os
-from typing import Union
-from autogen_ext.models.openai import OpenAIChatCompletionClient
-from autogen_ext.models.ollama import OllamaChatCompletionClient
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
+from autogen_core import CancellationToken
+from autogen_core.models import (
+    ChatCompletionClient,
+    CreateResult,
+    LLMMessage,
+    ModelCapabilities,
+    ModelInfo,
+    RequestUsage,
+    SystemMessage,
+    UserMessage,
+)
+from autogen_core.tools import Tool, ToolSchema
+from pydantic import BaseModel
 
-def get_model_client(
+from v1.core.constants import (
+    DEFAULT_HEDGE_PERCENTILE,
+    DEFAULT_LLM_CALL_DEADLINE,
+    DEFAULT_MAX_INFLIGHT,
+    DEFERRED_MODEL_INFO,
+    HEDGE_LATENCY_WINDOW,
+    HEDGE_MIN_SAMPLES,
+    OLLAMA_KEEP_ALIVE_AFTER_RUN,
+    OLLAMA_KEEP_ALIVE_DURING_RUN,
+)
+from v1.utils.event_log import EventType, log_event
+
+# 백엔드 SDK(openai, ollama)는 import 비용이 커서 클라이언트를 실제로 만들 때만 로드
+if TYPE_CHECKING:
+    from autogen_ext.models.cache import ChatCompletionCache
+    from autogen_ext.models.ollama import OllamaChatCompletionClient
+    from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+
+def get_backend(model_name: str) -> str:
+    """모델 이름으로 백엔드("openai" 또는 "ollama")를 판별합니다."""
+    if model_name.startswith("gpt") or model_name.startswith("o"):
+        return "openai"
+    return "ollama"
+
+
+# 진행 중인 OpenAI 요청의 캐시 적중 토큰을 HTTP 응답 훅이 채워 넣는 자리
+_call_usage: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "_call_usage", default=None
+)
+
+# 설치된 openai SDK가 prompt_cache_key를 지원하는지 (첫 OpenAI 요청 때 한 번만 확인)
+_prompt_cache_key_supported: Optional[bool] = None
+
+
+def _supports_prompt_cache_key() -> bool:
+    """
+    openai SDK의 chat.completions.create 요청 파라미터(CompletionCreateParamsBase)에
+    prompt_cache_key가 있는지 확인합니다. autogen도 같은 목록으로 extra_create_args를 검증합니다.
+    """
+    global _prompt_cache_key_supported
+    if _prompt_cache_key_supported is None:
+        from openai.types.chat.completion_create_params import (
+            CompletionCreateParamsBase,
+        )
+
+        _prompt_cache_key_supported = (
+            "prompt_cache_key" in CompletionCreateParamsBase.__annotations__
+        )
+    return _prompt_cache_key_supported
+
+
+async def _capture_usage(response) -> None:
+    """
+    OpenAI httpx 응답 훅: 스트리밍이 아닌 응답 본문에서 autogen이 버리는
+    usage.prompt_tokens_details.cached_tokens(프롬프트 캐시 적중 토큰)를 추출합니다.
+    """
+    usage = _call_usage.get()
+    if usage is None or response.status_code != 200:
+        return
+    if "application/json" not in response.headers.get("content-type", ""):
+        return
+    await response.aread()
+    try:
+        body = response.json()
+    except ValueError:
+        return
+    if isinstance(body.get("usage"), dict):
+        details = body["usage"].get("prompt_tokens_details") or {}
+        usage["cached_tokens"] = details.get("cached_tokens") or 0
+
+
+def prompt_prefix_key(
+    messages: Sequence[LLMMessage], tools: Sequence[Tool | ToolSchema] = ()
+) -> str:
+    """
+    시스템 메시지와 도구 스키마(스텝마다 바이트 단위로 같아야 하는 프롬프트 앞부분)의 지문.
+    같은 지문의 요청끼리만 프롬프트 캐시(KV 캐시)를 재사용할 수 있습니다.
+    """
+    digest = hashlib.sha1()
+    for message in messages:
+        if isinstance(message, SystemMessage):
+            digest.update(message.content.encode())
+    for tool in tools:
+        schema = tool.schema if isinstance(tool, Tool) else tool
+        digest.update(json.dumps(schema, sort_keys=True, ensure_ascii=False).encode())
+    return digest.hexdigest()[:16]
+
+
+def create_model_client(
     model_name: str,
 ) -> Union[OpenAIChatCompletionClient, OllamaChatCompletionClient]:
     """
-    모델 이름에 따라 적절한 모델 클라이언트를 반환합니다.
+    모델 이름에 따라 적절한 모델 클라이언트를 새로 생성합니다.
+    Ollama 모델은 실행 중 언로드되지 않도록 keep_alive를 고정합니다.
+    OpenAI 클라이언트에는 캐시 적중 통계를 위한 HTTP 응답 훅(_capture_usage)을 등록합니다.
     """
-    if model_name.startswith("gpt") or model_name.startswith("o"):
+    if get_backend(model_name) == "openai":
+        from autogen_ext.models.openai import OpenAIChatCompletionClient
+        from openai import DefaultAsyncHttpxClient
+
         return OpenAIChatCompletionClient(
             model=model_name,
             api_key=os.getenv("OPENAI_API_KEY"),
+            http_client=DefaultAsyncHttpxClient(
+                event_hooks={"response": [_capture_usage]}
+            ),
         )
     else:
-        return OllamaChatCompletionClient(model=model_name)
+        from autogen_ext.models.ollama import OllamaChatCompletionClient
+
+        return OllamaChatCompletionClient(
+            model=model_name, keep_alive=OLLAMA_KEEP_ALIVE_DURING_RUN
+        )
+
+
+class PromptCacheStats:
+    """
+    모델별 프롬프트 캐시 적중률, 프리필 토큰, 첫 토큰까지 걸린 시간(TTFT)을 집계합니다.
+
+    캐시 적중률은 캐시 토큰을 보고하는 요청(OpenAI)만, 프리필은 Ollama 요청만 집계합니다.
+    (Ollama의 prompt_eval_count는 KV 캐시로 건너뛰지 못하고 새로 계산한 토큰 수)
+    TTFT는 스트리밍 요청에서 첫 청크까지 걸린 시간입니다.
+    prefix_switches는 직전 요청과 프롬프트 앞부분 지문이 달랐던 횟수로, Ollama처럼
+    마지막 프롬프트의 KV 캐시만 유지하는 백엔드에서는 재사용이 끊긴 횟수입니다.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.reported_prompt_tokens = 0
+        self.cached_tokens = 0
+        self.prefill_calls = 0
+        self.prefill_tokens = 0
+        self.ttft: List[float] = []
+        self.prefix_switches = 0
+        self._last_prefix: Optional[str] = None
+
+    def record(self, prefix: str, prompt_tokens: int, usage: Dict[str, Any]) -> None:
+        self.calls += 1
+        self.prompt_tokens += prompt_tokens
+        if self._last_prefix is not None and prefix != self._last_prefix:
+            self.prefix_switches += 1
+        self._last_prefix = prefix
+        if "cached_tokens" in usage:
+            self.reported_prompt_tokens += prompt_tokens
+            self.cached_tokens += usage["cached_tokens"]
+        if "prefill_tokens" in usage:
+            self.prefill_calls += 1
+            self.prefill_tokens += usage["prefill_tokens"]
+        if usage.get("ttft") is not None:
+            self.ttft.append(usage["ttft"])
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "prompt_tokens": self.prompt_tokens,
+            "cache_hit_rate": (
+                self.cached_tokens / self.reported_prompt_tokens * 100
+                if self.reported_prompt_tokens
+                else None
+            ),
+            "avg_prefill_tokens": (
+                self.prefill_tokens / self.prefill_calls if self.prefill_calls else None
+            ),
+            "avg_ttft": sum(self.ttft) / len(self.ttft) if self.ttft else None,
+            "prefix_switches": self.prefix_switches,
+        }
+
+
+class PooledModelClient(ChatCompletionClient):
+    """
+    풀에서 공유되는 모델 클라이언트 래퍼.
+    요청마다 백엔드 세마포어를 획득하여 동시 진행 요청 수를 제한합니다.
+
+    실제 클라이언트는 첫 요청(또는 사용량 조회) 시점에 생성합니다.
+    그 전까지 model_info는 DEFERRED_MODEL_INFO를 반환하므로, 에이전트 생성만으로는
+    백엔드 SDK를 로드하거나 연결을 만들지 않습니다.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        pool: ModelClientPool,
+        client: Optional[ChatCompletionClient] = None,
+    ):
+        self.model_name = model_name
+        self.backend = get_backend(model_name)
+        self._client = client
+        self._pool = pool
+
+    @property
+    def client(self) -> ChatCompletionClient:
+        if self._client is None:
+            self._client = create_model_client(self.model_name)
+        return self._client
+
+    @property
+    def created(self) -> bool:
+        return self._client is not None
+
+    async def create(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> CreateResult:
+        prefix = prompt_prefix_key(messages, tools)
+        async with self._pool.semaphore(self.backend):
+            usage: Dict[str, Any] = {}
+            token = _call_usage.set(usage)
+            start = time.monotonic()
+            try:
+                result = await self.client.create(
+                    messages,
+                    tools=tools,
+                    json_output=json_output,
+                    extra_create_args=self._cache_args(prefix, extra_create_args),
+                    cancellation_token=cancellation_token,
+                )
+            finally:
+                _call_usage.reset(token)
+            self._record(prefix, result, usage, start)
+            return result
+
+    async def create_stream(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> AsyncGenerator[Union[str, CreateResult], None]:
+        prefix = prompt_prefix_key(messages, tools)
+        async with self._pool.semaphore(self.backend):
+            usage: Dict[str, Any] = {}
+            start = time.monotonic()
+            async for chunk in self.client.create_stream(
+                messages,
+                tools=tools,
+                json_output=json_output,
+                extra_create_args=self._cache_args(prefix, extra_create_args),
+                cancellation_token=cancellation_token,
+            ):
+                if isinstance(chunk, CreateResult):
+                    self._record(prefix, chunk, usage, start)
+                elif "ttft" not in usage:
+                    usage["ttft"] = time.monotonic() - start
+                yield chunk
+
+    def _record(
+        self, prefix: str, result: CreateResult, usage: Dict[str, Any], start: float
+    ) -> None:
+        if self.backend == "ollama":
+            # autogen이 prompt_tokens로 옮겨 주는 prompt_eval_count = 새로 계산한 프리필 토큰
+            usage["prefill_tokens"] = result.usage.prompt_tokens
+        self._pool.record_call(
+            self.model_name,
+            prefix,
+            result.usage.prompt_tokens,
+            usage,
+            time.monotonic() - start,
+        )
+
+    def _cache_args(
+        self, prefix: str, extra_create_args: Mapping[str, Any]
+    ) -> Mapping[str, Any]:
+        """
+        OpenAI 요청은 같은 프롬프트 앞부분끼리 같은 캐시로 라우팅되도록 prompt_cache_key 지정
+        (설치된 openai SDK가 지원하지 않으면 autogen이 거부하므로 생략)
+        """
+        if self.backend != "openai" or "prompt_cache_key" in extra_create_args:
+            return extra_create_args
+        if not _supports_prompt_cache_key():
+            return extra_create_args
+        return {
+            **extra_create_args,
+            "prompt_cache_key": f"{self.model_name}:{prefix}",
+        }
+
+    async def close(self) -> None:
+        # 공유 클라이언트는 풀에서만 닫음 (ModelClientPool.close)
+        pass
+
+    def actual_usage(self) -> RequestUsage:
+        return self.client.actual_usage()
+
+    def total_usage(self) -> RequestUsage:
+        return self.client.total_usage()
+
+    def count_tokens(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+    ) -> int:
+        return self.client.count_tokens(messages, tools=tools)
+
+    def remaining_tokens(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+    ) -> int:
+        return self.client.remaining_tokens(messages, tools=tools)
+
+    @property
+    def capabilities(self) -> ModelCapabilities:  # type: ignore
+        return self.client.capabilities  # type: ignore
+
+    @property
+    def model_info(self) -> ModelInfo:
+        if self._client is None:
+            return DEFERRED_MODEL_INFO
+        return self._client.model_info
+
+
+class LLMDeadlineExceeded(asyncio.TimeoutError):
+    """LLM 호출이 하드 마감 시한을 넘겨 취소됨"""
+
+
+class LatencyTracker:
+    """
+    모델별 최근 응답 시간과 헤징/마감 시한 초과 횟수를 기록합니다(헤징 임계값 튜닝용).
+    """
+
+    def __init__(self, window: int = HEDGE_LATENCY_WINDOW):
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.timeouts = 0
+
+    def record(self, elapsed: float) -> None:
+        self.samples.append(elapsed)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """최근 응답 시간의 q 백분위수 (표본이 HEDGE_MIN_SAMPLES개 미만이면 None)"""
+        if len(self.samples) < HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "p50": self.percentile(50) or 0.0,
+            "p95": self.percentile(95) or 0.0,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "timeouts": self.timeouts,
+        }
+
+
+class HedgedModelClient(ChatCompletionClient):
+    """
+    호출마다 하드 마감 시한을 두고, 느린 요청은 헤지 모델로 중복 요청하는 클라이언트 래퍼.
+
+    - 응답이 최근 응답 시간의 hedge_percentile 백분위수를 넘기면 hedge 클라이언트
+      (다른 모델 또는 백엔드)로 같은 요청을 보내고 먼저 도착한 응답을 사용합니다.
+    - deadline(초)이 지나면 모든 요청을 취소하고 LLMDeadlineExceeded를 발생시킵니다.
+    - 스트리밍 요청은 헤징 없이 청크 사이 마감 시한만 적용합니다.
+    헤징(LLM_HEDGE)과 마감 시한 초과(LLM_TIMEOUT)는 이벤트 로그에 기록됩니다.
+    """
+
+    def __init__(
+        self,
+        primary: PooledModelClient,
+        hedge: Optional[PooledModelClient],
+        tracker: LatencyTracker,
+        deadline: Optional[float],
+        hedge_percentile: float,
+    ):
+        self.primary = primary
+        self.hedge = hedge
+        self.tracker = tracker
+        self.deadline = deadline
+        self.hedge_percentile = hedge_percentile
+
+    def _remaining(self, start: float) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return self.deadline - (time.monotonic() - start)
+
+    def _timed_out(self, start: float) -> LLMDeadlineExceeded:
+        self.tracker.timeouts += 1
+        log_event(
+            EventType.LLM_TIMEOUT,
+            model=self.primary.model_name,
+            deadline=self.deadline,
+        )
+        return LLMDeadlineExceeded(
+            f"{self.primary.model_name} 호출이 {self.deadline}초를 넘겼습니다."
+        )
+
+    async def create(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> CreateResult:
+        start = time.monotonic()
+        self.tracker.calls += 1
+        delay = (
+            self.tracker.percentile(self.hedge_percentile)
+            if self.hedge is not None
+            else None
+        )
+
+        def _launch(client: PooledModelClient) -> asyncio.Task:
+            return asyncio.create_task(
+                client.create(
+                    messages,
+                    tools=tools,
+                    json_output=json_output,
+                    extra_create_args=extra_create_args,
+                    cancellation_token=cancellation_token,
+                )
+            )
+
+        attempts = {_launch(self.primary): self.primary}
+        hedged = False
+        error: Optional[BaseException] = None
+        try:
+            while attempts:
+                timeout = self._remaining(start)
+                if timeout is not None and timeout <= 0:
+                    raise self._timed_out(start)
+                if not hedged and delay is not None:
+                    until_hedge = max(0.0, delay - (time.monotonic() - start))
+                    timeout = (
+                        until_hedge if timeout is None else min(timeout, until_hedge)
+                    )
+
+                done, _ = await asyncio.wait(
+                    attempts, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    client = attempts.pop(task)
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+                    # 헤지가 이기면 주 요청의 응답 시간 대신 그 하한(elapsed)을 기록
+                    elapsed = time.monotonic() - start
+                    self.tracker.record(elapsed)
+                    if hedged:
+                        self.tracker.hedge_wins += client is self.hedge
+                        log_event(
+                            EventType.LLM_HEDGE,
+                            model=self.primary.model_name,
+                            hedge_model=self.hedge.model_name,
+                            delay=delay,
+                            winner=client.model_name,
+                            elapsed=elapsed,
+                        )
+                    return task.result()
+
+                if (
+                    not done
+                    and not hedged
+                    and delay is not None
+                    and time.monotonic() - start >= delay
+                ):
+                    # 임계값을 넘긴 요청은 헤지 모델로 중복 요청 (먼저 온 응답 사용)
+                    hedged = True
+                    self.tracker.hedges += 1
+                    attempts[_launch(self.hedge)] = self.hedge
+            raise error
+        finally:
+            for task in attempts:
+                task.cancel()
+            await asyncio.gather(*attempts, return_exceptions=True)
+
+    async def create_stream(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+        json_output: Optional[bool | type[BaseModel]] = None,
+        extra_create_args: Mapping[str, Any] = {},
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> AsyncGenerator[Union[str, CreateResult], None]:
+        start = time.monotonic()
+        self.tracker.calls += 1
+        stream = self.primary.create_stream(
+            messages,
+            tools=tools,
+            json_output=json_output,
+            extra_create_args=extra_create_args,
+            cancellation_token=cancellation_token,
+        )
+        try:
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(
+                        stream.__anext__(), timeout=self._remaining(start)
+                    )
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    raise self._timed_out(start)
+                yield chunk
+            self.tracker.record(time.monotonic() - start)
+        finally:
+            await stream.aclose()
+
+    async def close(self) -> None:
+        pass
+
+    def actual_usage(self) -> RequestUsage:
+        return self.primary.actual_usage()
+
+    def total_usage(self) -> RequestUsage:
+        return self.primary.total_usage()
+
+    def count_tokens(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+    ) -> int:
+        return self.primary.count_tokens(messages, tools=tools)
+
+    def remaining_tokens(
+        self,
+        messages: Sequence[LLMMessage],
+        *,
+        tools: Sequence[Tool | ToolSchema] = [],
+    ) -> int:
+        return self.primary.remaining_tokens(messages, tools=tools)
+
+    @property
+    def capabilities(self) -> ModelCapabilities:  # type: ignore
+        return self.primary.capabilities
+
+    @property
+    def model_info(self) -> ModelInfo:
+        return self.primary.model_info
+
+
+class ModelClientPool:
+    """
+    프로세스 전역 모델 클라이언트 풀.
+
+    - 모델 이름별로 클라이언트를 하나만 생성하여 모든 에이전트/실행이 공유
+    - warm_up으로 실행 시작 전 모델을 미리 로드 (Ollama: 빈 프롬프트 로드, OpenAI: 연결 수립)
+    - Ollama 모델은 실행 동안 keep_alive를 고정하고, close 시 기본값으로 복원
+    - 백엔드별 세마포어로 동시 진행 요청 수를 제한
+    - cache=True(또는 LLM_CACHE=1)면 같은 요청의 응답을 모델별 메모리 캐시로 재사용
+      (캐시 적중 시 세마포어도 거치지 않음)
+    - 호출마다 마감 시한(LLM_CALL_DEADLINE_SECONDS, 기본값 없음)을 두고, hedge_model을
+      지정하면 느린 요청을 헤지 모델로 중복 요청 (HedgedModelClient)
+    """
+
+    def __init__(
+        self,
+        max_inflight: Optional[Dict[str, int]] = None,
+        cache: Optional[bool] = None,
+        call_deadline: Optional[float] = None,
+        hedge_percentile: Optional[float] = None,
+    ):
+        self.max_inflight = dict(DEFAULT_MAX_INFLIGHT)
+        for backend in self.max_inflight:
+            env_value = os.getenv(f"{backend.upper()}_MAX_INFLIGHT")
+            if env_value:
+                self.max_inflight[backend] = int(env_value)
+        if max_inflight:
+            self.max_inflight.update(max_inflight)
+        if cache is None:
+            cache = os.getenv("LLM_CACHE", "").lower() in ("1", "true", "yes")
+        self.cache_enabled = cache
+        if call_deadline is None and os.getenv("LLM_CALL_DEADLINE_SECONDS"):
+            call_deadline = float(os.getenv("LLM_CALL_DEADLINE_SECONDS"))
+        if call_deadline is None:
+            call_deadline = DEFAULT_LLM_CALL_DEADLINE
+        self.call_deadline = call_deadline or None
+        self.hedge_percentile = hedge_percentile or float(
+            os.getenv("LLM_HEDGE_PERCENTILE", DEFAULT_HEDGE_PERCENTILE)
+        )
+
+        self._clients: Dict[str, PooledModelClient] = {}
+        self._hedged: Dict[Tuple[str, Optional[str]], HedgedModelClient] = {}
+        self.latency: Dict[str, LatencyTracker] = {}
+        self.prompt_cache: Dict[str, PromptCacheStats] = {}
+        # 캐시 키에 모델 이름이 없으므로 모델(+헤지 모델)별로 저장소를 분리
+        self._cached: Dict[Tuple[str, Optional[str]], ChatCompletionCache] = {}
+        self._warmed: set = set()
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(
+        self,
+        model_name: str,
+        cached: bool = True,
+        hedge_model: Optional[str] = None,
+    ) -> ChatCompletionClient:
+        """
+        모델 이름에 해당하는 공유 클라이언트를 반환합니다(없으면 생성).
+
+        cached=False면 캐시가 켜져 있어도 캐시를 거치지 않는 클라이언트를 반환합니다.
+        (같은 프롬프트로 여러 번 샘플링하는 투표 모드 등)
+        마감 시한이나 hedge_model이 있으면 HedgedModelClient로 감쌉니다.
+        """
+        key = (model_name, hedge_model or None)
+        client: ChatCompletionClient = self._pooled(model_name)
+        if self.call_deadline is not None or hedge_model:
+            if key not in self._hedged:
+                self._hedged[key] = HedgedModelClient(
+                    self._pooled(model_name),
+                    self._pooled(hedge_model) if hedge_model else None,
+                    self.latency.setdefault(model_name, LatencyTracker()),
+                    self.call_deadline,
+                    self.hedge_percentile,
+                )
+            client = self._hedged[key]
+        if not (self.cache_enabled and cached):
+            return client
+        if key not in self._cached:
+            from autogen_core import InMemoryStore
+            from autogen_ext.models.cache import ChatCompletionCache
+
+            self._cached[key] = ChatCompletionCache(client, InMemoryStore())
+        return self._cached[key]
+
+    def enable_cache(self) -> None:
+        """이후 get()으로 받는 클라이언트에 응답 캐시를 적용합니다."""
+        self.cache_enabled = True
+
+    def _pooled(self, model_name: str) -> PooledModelClient:
+        if model_name not in self._clients:
+            self._clients[model_name] = PooledModelClient(model_name, self)
+        return self._clients[model_name]
+
+    def semaphore(self, backend: str) -> asyncio.Semaphore:
+        """현재 이벤트 루프에 대한 백엔드별 세마포어를 반환합니다."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            # asyncio.run이 새 루프를 만들면 세마포어도 새로 생성
+            self._semaphores = {}
+            self._semaphore_loop = loop
+        if backend not in self._semaphores:
+            self._semaphores[backend] = asyncio.Semaphore(
+                self.max_inflight.get(backend, 1)
+            )
+        return self._semaphores[backend]
+
+    async def warm_up(self, model_names: Optional[Iterable[str]] = None) -> None:
+        """
+        모델을 미리 로드하여 첫 캔들의 콜드 스타트 지연을 제거합니다.
+
+        Args:
+            model_names (Optional[Iterable[str]]): 워밍업할 모델, None이면 풀에 등록된 전체 모델
+        """
+        names = [
+            name
+            for name in (model_names if model_names is not None else self._clients)
+            if name and name not in self._warmed
+        ]
+        await asyncio.gather(*(self._warm_up_one(name) for name in names))
+
+    async def _warm_up_one(self, model_name: str) -> None:
+        try:
+            if get_backend(model_name) == "ollama":
+                from ollama import AsyncClient as OllamaAsyncClient
+
+                # 빈 프롬프트 요청은 생성 없이 모델만 메모리에 로드
+                await OllamaAsyncClient().generate(
+                    model=model_name,
+                    prompt="",
+                    keep_alive=OLLAMA_KEEP_ALIVE_DURING_RUN,
+                )
+            else:
+                await self._pooled(model_name).create(
+                    [UserMessage(content="ping", source="ModelClientPool")],
+                    extra_create_args={"max_tokens": 1},
+                )
+            self._warmed.add(model_name)
+        except Exception as e:
+            print(f"[Warning] {model_name} 모델 워밍업 실패: {e}")
+
+    def record_call(
+        self,
+        model_name: str,
+        prefix: str,
+        prompt_tokens: int,
+        usage: Dict[str, Any],
+        elapsed: float,
+    ) -> None:
+        """백엔드 요청 1건의 캐시 적중/프리필/TTFT를 집계하고 LLM_CALL 이벤트로 기록"""
+        self.prompt_cache.setdefault(model_name, PromptCacheStats()).record(
+            prefix, prompt_tokens, usage
+        )
+        log_event(
+            EventType.LLM_CALL,
+            model=model_name,
+            prefix=prefix,
+            prompt_tokens=prompt_tokens,
+            elapsed=elapsed,
+            **usage,
+        )
+
+    def prompt_cache_summary(self) -> Dict[str, Dict[str, float]]:
+        """모델별 프롬프트 캐시 적중률, 평균 프리필 토큰/시간, 평균 TTFT"""
+        return {
+            model_name: stats.summary()
+            for model_name, stats in self.prompt_cache.items()
+        }
+
+    def latency_summary(self) -> Dict[str, Dict[str, float]]:
+        """모델별 호출 수, 응답 시간 p50/p95, 헤징/마감 시한 초과 횟수"""
+        return {
+            model_name: tracker.summary()
+            for model_name, tracker in self.latency.items()
+            if tracker.calls
+        }
+
+    async def close(self) -> None:
+        """Ollama keep_alive를 복원하고 모든 클라이언트를 닫은 뒤 풀 상태를 초기화합니다."""
+        for model_name, pooled in self._clients.items():
+            if pooled.backend == "ollama" and model_name in self._warmed:
+                from ollama import AsyncClient as OllamaAsyncClient
+
+                try:
+                    await OllamaAsyncClient().generate(
+                        model=model_name,
+                        prompt="",
+                        keep_alive=OLLAMA_KEEP_ALIVE_AFTER_RUN,
+                    )
+                except Exception as e:
+                    print(f"[Warning] {model_name} keep_alive 복원 실패: {e}")
+            if not pooled.created:
+                continue
+            try:
+                await pooled.client.close()
+            except Exception as e:
+                print(f"[Warning] {model_name} 모델 클라이언트 종료 실패: {e}")
+            # 이미 나눠준 래퍼가 다음 이벤트 루프에서 새 클라이언트를 만들도록 비웁니다.
+            pooled._client = None
+        # 래퍼는 유지하되 응답 시간 통계는 새로 시작합니다.
+        self.latency = {}
+        for (model_name, _), hedged in self._hedged.items():
+            hedged.tracker = self.latency.setdefault(model_name, LatencyTracker())
+            hedged.deadline = self.call_deadline
+        self.prompt_cache = {}
+        self._cached = {}
+        self._warmed = set()
+        self._semaphores = {}
+        self._semaphore_loop = None
+
+
+# 프로세스 전역 풀
+model_client_pool = ModelClientPool()
+
+
+def get_model_client(
+    model_name: str, cached: bool = True, hedge_model: Optional[str] = None
+) -> ChatCompletionClient:
+    """
+    모델 이름에 따라 프로세스 전역 풀에서 공유 모델 클라이언트를 반환합니다.
+    cached=False면 응답 캐시를 사용하지 않고, hedge_model이 있으면 느린 요청을 중복 요청합니다.
+    """
+    return model_client_pool.get(model_name, cached=cached, hedge_model=hedge_model)
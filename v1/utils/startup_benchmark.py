@@ -0,0 +1,126 @@
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+from v1.core.constants import LAZY_IMPORT_MODULES, STARTUP_IMPORT_BUDGETS_MS
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+
+
+def measure_import(module: str) -> Tuple[float, Dict[str, float]]:
+    """
+    새 인터프리터에서 `python -X importtime -c "import module"`을 실행해
+    모듈의 누적 import 시간(ms)과 로드된 전체 모듈별 누적 시간(ms)을 반환합니다.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (PROJECT_ROOT, env.get("PYTHONPATH")) if path
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=PROJECT_ROOT,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{result.stderr[-2000:]}")
+
+    cumulative: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total_us, name = line.split("|", 2)
+        try:
+            cumulative[name.strip()] = int(total_us) / 1000
+        except ValueError:
+            continue  # 헤더 줄
+    return cumulative.get(module, 0.0), cumulative
+
+
+def run_benchmark(
+    budgets: Dict[str, float], repeat: int = 3, top: int = 5
+) -> List[Dict]:
+    """
+    모듈별로 repeat번 측정해 최솟값을 예산과 비교하고,
+    import 시점에 지연 대상 모듈(LAZY_IMPORT_MODULES)이 로드됐는지 확인합니다.
+    """
+    results = []
+    for module, budget in budgets.items():
+        best_ms, best_modules = float("inf"), {}
+        for _ in range(repeat):
+            elapsed_ms, modules = measure_import(module)
+            if elapsed_ms < best_ms:
+                best_ms, best_modules = elapsed_ms, modules
+
+        eager = [
+            name
+            for name in LAZY_IMPORT_MODULES
+            if name in best_modules or f"{name}.pyplot" in best_modules
+        ]
+        heaviest = sorted(
+            (
+                (name, ms)
+                for name, ms in best_modules.items()
+                if "." not in name and name != module
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:top]
+        results.append(
+            {
+                "module": module,
+                "import_ms": best_ms,
+                "budget_ms": budget,
+                "eager_heavy_modules": eager,
+                "heaviest": heaviest,
+                "ok": best_ms <= budget and not eager,
+            }
+        )
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="python -X importtime 기반 시작 시간 벤치마크"
+    )
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        help="측정할 모듈 (기본값: STARTUP_IMPORT_BUDGETS_MS의 전체 모듈)",
+    )
+    parser.add_argument("--budget-ms", type=float, default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.modules:
+        budgets = {
+            module: args.budget_ms or STARTUP_IMPORT_BUDGETS_MS.get(module, 1000)
+            for module in args.modules
+        }
+    else:
+        budgets = {
+            module: args.budget_ms or budget
+            for module, budget in STARTUP_IMPORT_BUDGETS_MS.items()
+        }
+
+    results = run_benchmark(budgets, repeat=args.repeat)
+    for result in results:
+        status = "OK" if result["ok"] else "FAIL"
+        print(
+            f"[{status}] {result['module']}: {result['import_ms']:.0f}ms "
+            f"(예산 {result['budget_ms']:.0f}ms)"
+        )
+        if result["eager_heavy_modules"]:
+            print(
+                f"  - import 시점에 로드된 무거운 모듈: {result['eager_heavy_modules']}"
+            )
+        for name, ms in result["heaviest"]:
+            print(f"  - {name}: {ms:.0f}ms")
+    return 0 if all(result["ok"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,18 @@
 import numpy as np
-import talib
+
+from v1.utils.lazy_import import lazy_module
+
+talib = lazy_module("talib")
+
+
+def get_column(price_data, field: str) -> np.ndarray:
+    """
+    가격 데이터에서 필드 하나를 float64 배열로 꺼냅니다.
+    BacktestClock의 CandleWindow처럼 column()을 제공하면 복사 없이 배열 뷰를 사용합니다.
+    """
+    if hasattr(price_data, "column"):
+        return price_data.column(field)
+    return np.array([item[field] for item in price_data], dtype=np.float64)
 
 
 class TAITools:
@@ -22,7 +35,7 @@ class TAITools:
 
         """
         # 대상 필드로부터 배열 추출
-        values = np.array([item[field] for item in self._data()], dtype=np.float64)
+        values = get_column(self._data(), field)
 
         # 이동평균 계산 (SMA)
         ma = talib.SMA(values, timeperiod=period)
@@ -52,9 +65,9 @@ class TAITools:
         Returns:
             str: A string summarizing volatility using standard deviation, ATR, and other metrics.
         """
-        highs = np.array([item["high"] for item in self._data()], dtype=np.float64)
-        lows = np.array([item["low"] for item in self._data()], dtype=np.float64)
-        closes = np.array([item["close"] for item in self._data()], dtype=np.float64)
+        highs = get_column(self._data(), "high")
+        lows = get_column(self._data(), "low")
+        closes = get_column(self._data(), "close")
 
         # 표준편차 (close 기준)
         std_dev = talib.STDDEV(closes, timeperiod=period, nbdev=1)
@@ -123,7 +136,7 @@ class TAITools:
         Returns:
             str: A string containing the latest RSI value and an indication of whether the market is overbought or oversold.
         """
-        closes = np.array([item["close"] for item in self._data()], dtype=np.float64)
+        closes = get_column(self._data(), "close")
 
         # RSI 계산
         rsi_values = talib.RSI(closes, timeperiod=period)
@@ -168,7 +181,7 @@ class TAITools:
             str: A string summarizing the latest MACD, signal line, histogram values,
                 and a brief directional analysis.
         """
-        closes = np.array([item["close"] for item in self._data()], dtype=np.float64)
+        closes = get_column(self._data(), "close")
 
         # MACD 계산
         macd, macd_signal, macd_hist = talib.MACD(
@@ -215,7 +228,7 @@ class TAITools:
         Returns:
             str: A string summarizing the latest Bollinger Bands values and a brief analysis.
         """
-        closes = np.array([item["close"] for item in self._data()], dtype=np.float64)
+        closes = get_column(self._data(), "close")
 
         # 볼린저 밴드 계산
         upperband, middleband, lowerband = talib.BBANDS(
@@ -1,4 +1,8 @@
 import re
+from typing import Optional
+
+# 응답에서 매매 신호만 단독으로 적힌 줄
+SIGNAL_LINE_PATTERN = re.compile(r"^\s*(-1|0|1)\s*$", re.MULTILINE)
 
 
 def remove_think_block(text: str) -> str:
@@ -13,3 +17,55 @@ def remove_think_block(text: str) -> str:
     text = text.strip()
 
     return text
+
+
+def extract_early_signal(text: str) -> Optional[int]:
+    """
+    스트리밍 중인 응답에서 완성된 신호 줄(-1, 0, 1)을 조기에 추출합니다.
+
+    아직 닫히지 않은 <think>/<thought> 블록 이후의 내용과 개행으로 끝나지 않은
+    마지막 줄은 확정되지 않았으므로 무시합니다.
+
+    Args:
+        text (str): 지금까지 수신한 응답 문자열
+
+    Returns:
+        Optional[int]: 확정된 신호, 아직 없으면 None
+    """
+    text = re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL)
+    text = re.sub(r"<thought>.*?</thought>", "", text, flags=re.DOTALL)
+
+    # 닫히지 않은 사고 블록은 이후 내용을 신뢰할 수 없음
+    open_block = re.search(r"<think>|<thought>", text)
+    if open_block:
+        text = text[: open_block.start()]
+
+    # 개행으로 끝난 줄만 확정된 줄로 취급
+    completed = text[: text.rfind("\n") + 1]
+    match = SIGNAL_LINE_PATTERN.search(completed)
+    if match:
+        return int(match.group(1))
+    return None
+
+
+def extract_confidence(text: str) -> Optional[float]:
+    """
+    응답에서 'Confidence: 0.8' 형식의 자기 보고 확신도를 추출합니다.
+
+    Args:
+        text (str): 모델 응답 문자열
+
+    Returns:
+        Optional[float]: 0.0~1.0 범위의 확신도, 없거나 범위를 벗어나면 None
+    """
+    match = re.search(
+        r"^\s*Confidence\s*:\s*([0-9]*\.?[0-9]+)\s*$",
+        text,
+        flags=re.MULTILINE | re.IGNORECASE,
+    )
+    if not match:
+        return None
+    confidence = float(match.group(1))
+    if not 0.0 <= confidence <= 1.0:
+        return None
+    return confidence
@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta, timezone
+from typing import Union
+
+import numpy as np
+
+from v1.core.constants import DEFAULT_UNIT, TIME_DELTA_MAP
+
+# Upbit 캔들 시각과 시스템 입력 날짜는 모두 한국 표준시(KST, UTC+9) 기준
+KST = timezone(timedelta(hours=9))
+KST_OFFSET_SECONDS = 9 * 60 * 60
+
+INPUT_FORMAT = "%Y-%m-%d %H:%M:%S"  # 시스템 입력 (예: "2020-10-01 09:00:00")
+UPBIT_FORMAT = (
+    "%Y-%m-%dT%H:%M:%S"  # Upbit candle_date_time_kst (예: "2020-10-01T09:00:00")
+)
+
+
+def to_epoch(value: Union[str, int, datetime]) -> int:
+    """
+    KST 날짜 문자열/datetime을 UTC 기준 epoch 초(int)로 변환합니다.
+
+    "2020-10-01 09:00:00"과 "2020-10-01T09:00:00" 형식을 모두 받으며,
+    이미 정수라면 그대로 반환합니다. 타임존이 없는 값은 KST로 간주합니다.
+    """
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=KST)
+    return int(value.timestamp())
+
+
+def format_kst(timestamp: int, fmt: str = INPUT_FORMAT) -> str:
+    """epoch 초를 KST 날짜 문자열로 변환합니다(출력/외부 API 경계에서만 사용)."""
+    return datetime.fromtimestamp(int(timestamp), tz=KST).strftime(fmt)
+
+
+def format_utc(timestamp: int) -> str:
+    """epoch 초를 Upbit 'to' 파라미터용 UTC ISO 문자열로 변환합니다."""
+    return datetime.fromtimestamp(int(timestamp), tz=timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%SZ"
+    )
+
+
+def now_epoch() -> int:
+    return int(datetime.now(tz=timezone.utc).timestamp())
+
+
+def unit_seconds(candle_unit: str) -> int:
+    """캔들 단위 하나의 길이(초)"""
+    delta_args = TIME_DELTA_MAP.get(candle_unit, TIME_DELTA_MAP[DEFAULT_UNIT])
+    return int(timedelta(**delta_args).total_seconds())
+
+
+def to_kst_datetime64(timestamps) -> np.ndarray:
+    """
+    epoch 초 배열을 KST 기준(타임존 없는) datetime64[s] 배열로 한 번에 변환합니다.
+    문자열 파싱 없이 pandas datetime 컬럼을 만들 때 사용합니다.
+    """
+    return (np.asarray(timestamps, dtype=np.int64) + KST_OFFSET_SECONDS).astype(
+        "datetime64[s]"
+    )